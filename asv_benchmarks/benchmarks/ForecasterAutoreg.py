@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from skforecast.ForecasterAutoreg import ForecasterAutoreg
 from sklearn.linear_model import LinearRegression
+from scipy.stats import norm
+from .common import make_series
 
 
 class Suite:
@@ -21,4 +23,104 @@ class Suite:
         """
         Benchmark method create_train_X_y
         """
-        X, y = self.forecaster.create_train_X_y(self.time_series)
\ No newline at end of file
+        X, y = self.forecaster.create_train_X_y(self.time_series)
+
+
+class SuitePredict:
+
+    def setup(self):
+        # One step ahead predictions, the latency of serving a single request.
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=24)
+        time_series = pd.Series(np.arange(1000, dtype=float))
+        forecaster.fit(y=time_series)
+
+        self.forecaster = forecaster
+        self.last_window = time_series.iloc[-24:]
+        self.last_window_values = self.last_window.to_numpy()
+
+    def time_predict(self):
+        """
+        Benchmark method predict, 1 step
+        """
+        self.forecaster.predict(steps=1, last_window=self.last_window)
+
+    def time_predict_numpy(self):
+        """
+        Benchmark method predict_numpy, 1 step
+        """
+        self.forecaster.predict_numpy(steps=1, last_window=self.last_window_values)
+
+
+class SuiteFit:
+    params = ([1000, 10000], [10, 50])
+    param_names = ['n_obs', 'n_lags']
+
+    def setup(self, n_obs, n_lags):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=n_lags)
+        self.time_series = make_series(n_obs)
+
+    def time_fit(self, n_obs, n_lags):
+        """
+        Benchmark method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+    def peakmem_fit(self, n_obs, n_lags):
+        """
+        Peak memory of method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+
+class SuitePredictSteps:
+    params = ([10, 50], [10, 100])
+    param_names = ['n_lags', 'steps']
+
+    def setup(self, n_lags, steps):
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=n_lags)
+        forecaster.fit(y=make_series(1000))
+        self.forecaster = forecaster
+
+    def time_predict(self, n_lags, steps):
+        """
+        Benchmark method predict
+        """
+        self.forecaster.predict(steps=steps)
+
+
+class SuiteProbabilistic:
+    params = ([10, 50], [100, 500])
+    param_names = ['steps', 'n_boot']
+
+    def setup(self, steps, n_boot):
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=24)
+        forecaster.fit(y=make_series(1000))
+        self.forecaster = forecaster
+
+    def time_predict_bootstrapping(self, steps, n_boot):
+        """
+        Benchmark method predict_bootstrapping
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def peakmem_predict_bootstrapping(self, steps, n_boot):
+        """
+        Peak memory of method predict_bootstrapping
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def time_predict_interval(self, steps, n_boot):
+        """
+        Benchmark method predict_interval
+        """
+        self.forecaster.predict_interval(steps=steps, n_boot=n_boot)
+
+    def time_predict_dist(self, steps, n_boot):
+        """
+        Benchmark method predict_dist, normal distribution
+        """
+        self.forecaster.predict_dist(steps=steps, distribution=norm, n_boot=n_boot)
@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from skforecast.ForecasterAutoregCustom import ForecasterAutoregCustom
 from sklearn.linear_model import LinearRegression
+from scipy.stats import norm
+from .common import make_series
 
 
 class Suite:
@@ -24,18 +26,122 @@ class Suite:
 
             return predictors
 
+        def create_predictors_vectorized(y):
+            """
+            Same predictors as `create_predictors` for all the windows at once
+            (one window per row).
+            """
+
+            lags = y[:, -1:-11:-1]
+            mean = np.mean(y[:, -20:], axis=1, keepdims=True)
+            predictors = np.hstack([lags, mean])
+
+            return predictors
+
         forecaster = ForecasterAutoregCustom(
                     regressor      = LinearRegression(),
                     fun_predictors = create_predictors,
                     window_size    = 20
              )
+        forecaster_vectorized = ForecasterAutoregCustom(
+                                    regressor             = LinearRegression(),
+                                    fun_predictors        = create_predictors_vectorized,
+                                    window_size           = 20,
+                                    vectorized_predictors = True
+                                )
         time_series = pd.Series(np.arange(10000))
 
         self.forecaster = forecaster
+        self.forecaster_vectorized = forecaster_vectorized
         self.time_series = time_series
 
     def time_create_train_X_y(self):
         """
         Benchmark method create_train_X_y
         """
-        X, y = self.forecaster.create_train_X_y(self.time_series)
\ No newline at end of file
+        X, y = self.forecaster.create_train_X_y(self.time_series)
+
+    def time_create_train_X_y_vectorized_predictors(self):
+        """
+        Benchmark method create_train_X_y with `vectorized_predictors=True`
+        """
+        X, y = self.forecaster_vectorized.create_train_X_y(self.time_series)
+
+
+def create_lags(y):
+    """
+    Create first 10 lags of a time series.
+    """
+    
+    return y[-1:-11:-1]
+
+
+class SuiteFit:
+    params = [1000, 10000]
+    param_names = ['n_obs']
+
+    def setup(self, n_obs):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoregCustom(
+                              regressor      = LinearRegression(),
+                              fun_predictors = create_lags,
+                              window_size    = 10
+                          )
+        self.time_series = make_series(n_obs)
+
+    def time_fit(self, n_obs):
+        """
+        Benchmark method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+    def peakmem_fit(self, n_obs):
+        """
+        Peak memory of method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+
+class SuitePredict:
+    params = ([10, 50], [100, 500])
+    param_names = ['steps', 'n_boot']
+
+    def setup(self, steps, n_boot):
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoregCustom(
+                         regressor      = LinearRegression(),
+                         fun_predictors = create_lags,
+                         window_size    = 10
+                     )
+        forecaster.fit(y=make_series(1000))
+        self.forecaster = forecaster
+
+    def time_predict(self, steps, n_boot):
+        """
+        Benchmark method predict
+        """
+        self.forecaster.predict(steps=steps)
+
+    def time_predict_bootstrapping(self, steps, n_boot):
+        """
+        Benchmark method predict_bootstrapping
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def peakmem_predict_bootstrapping(self, steps, n_boot):
+        """
+        Peak memory of method predict_bootstrapping
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def time_predict_interval(self, steps, n_boot):
+        """
+        Benchmark method predict_interval
+        """
+        self.forecaster.predict_interval(steps=steps, n_boot=n_boot)
+
+    def time_predict_dist(self, steps, n_boot):
+        """
+        Benchmark method predict_dist, normal distribution
+        """
+        self.forecaster.predict_dist(steps=steps, distribution=norm, n_boot=n_boot)
@@ -0,0 +1,83 @@
+# ASV Benchmarks ForecasterAutoregDirect
+# ==============================================================================
+from skforecast.ForecasterAutoregDirect import ForecasterAutoregDirect
+from sklearn.linear_model import LinearRegression
+from scipy.stats import norm
+from .common import make_series
+
+
+class SuiteFit:
+    params = ([1000, 10000], [10, 50], [10, 24])
+    param_names = ['n_obs', 'n_lags', 'steps']
+
+    def setup(self, n_obs, n_lags, steps):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoregDirect(
+                              regressor = LinearRegression(),
+                              steps     = steps,
+                              lags      = n_lags
+                          )
+        self.time_series = make_series(n_obs)
+
+    def time_create_train_X_y(self, n_obs, n_lags, steps):
+        """
+        Benchmark method create_train_X_y
+        """
+        X, y = self.forecaster.create_train_X_y(self.time_series)
+
+    def time_fit(self, n_obs, n_lags, steps):
+        """
+        Benchmark method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+    def peakmem_fit(self, n_obs, n_lags, steps):
+        """
+        Peak memory of method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+
+class SuitePredict:
+    params = ([10, 24], [100, 500])
+    param_names = ['steps', 'n_boot']
+
+    def setup(self, steps, n_boot):
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoregDirect(
+                         regressor = LinearRegression(),
+                         steps     = steps,
+                         lags      = 24
+                     )
+        forecaster.fit(y=make_series(1000))
+        self.forecaster = forecaster
+
+    def time_predict(self, steps, n_boot):
+        """
+        Benchmark method predict
+        """
+        self.forecaster.predict(steps=steps)
+
+    def time_predict_bootstrapping(self, steps, n_boot):
+        """
+        Benchmark method predict_bootstrapping
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def peakmem_predict_bootstrapping(self, steps, n_boot):
+        """
+        Peak memory of method predict_bootstrapping
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def time_predict_interval(self, steps, n_boot):
+        """
+        Benchmark method predict_interval
+        """
+        self.forecaster.predict_interval(steps=steps, n_boot=n_boot)
+
+    def time_predict_dist(self, steps, n_boot):
+        """
+        Benchmark method predict_dist, normal distribution
+        """
+        self.forecaster.predict_dist(steps=steps, distribution=norm, n_boot=n_boot)
@@ -0,0 +1,81 @@
+# ASV Benchmarks ForecasterAutoregMultiSeries
+# ==============================================================================
+from skforecast.ForecasterAutoregMultiSeries import ForecasterAutoregMultiSeries
+from sklearn.linear_model import LinearRegression
+from scipy.stats import norm
+from .common import make_series
+
+
+class SuiteFit:
+    params = ([1000, 10000], [10, 50], [2, 20])
+    param_names = ['n_obs', 'n_lags', 'n_series']
+
+    def setup(self, n_obs, n_lags, n_series):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoregMultiSeries(
+                              regressor = LinearRegression(),
+                              lags      = n_lags
+                          )
+        self.series = make_series(n_obs, n_series)
+
+    def time_create_train_X_y(self, n_obs, n_lags, n_series):
+        """
+        Benchmark method create_train_X_y
+        """
+        X, y, y_index, y_train_index = self.forecaster.create_train_X_y(self.series)
+
+    def time_fit(self, n_obs, n_lags, n_series):
+        """
+        Benchmark method fit
+        """
+        self.forecaster.fit(series=self.series)
+
+    def peakmem_fit(self, n_obs, n_lags, n_series):
+        """
+        Peak memory of method fit
+        """
+        self.forecaster.fit(series=self.series)
+
+
+class SuitePredict:
+    params = ([10, 50], [100, 500], [2, 20])
+    param_names = ['steps', 'n_boot', 'n_series']
+
+    def setup(self, steps, n_boot, n_series):
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoregMultiSeries(
+                         regressor = LinearRegression(),
+                         lags      = 24
+                     )
+        forecaster.fit(series=make_series(1000, n_series))
+        self.forecaster = forecaster
+
+    def time_predict(self, steps, n_boot, n_series):
+        """
+        Benchmark method predict, all levels
+        """
+        self.forecaster.predict(steps=steps)
+
+    def time_predict_bootstrapping(self, steps, n_boot, n_series):
+        """
+        Benchmark method predict_bootstrapping, all levels
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def peakmem_predict_bootstrapping(self, steps, n_boot, n_series):
+        """
+        Peak memory of method predict_bootstrapping, all levels
+        """
+        self.forecaster.predict_bootstrapping(steps=steps, n_boot=n_boot)
+
+    def time_predict_interval(self, steps, n_boot, n_series):
+        """
+        Benchmark method predict_interval, all levels
+        """
+        self.forecaster.predict_interval(steps=steps, n_boot=n_boot)
+
+    def time_predict_dist(self, steps, n_boot, n_series):
+        """
+        Benchmark method predict_dist, normal distribution, all levels
+        """
+        self.forecaster.predict_dist(steps=steps, distribution=norm, n_boot=n_boot)
@@ -0,0 +1,61 @@
+# ASV Benchmarks ForecasterAutoregMultiVariate
+# ==============================================================================
+from skforecast.ForecasterAutoregMultiVariate import ForecasterAutoregMultiVariate
+from sklearn.linear_model import LinearRegression
+from .common import make_series
+
+
+class SuiteFit:
+    # ForecasterAutoregMultiVariate has no probabilistic predictions.
+    params = ([1000, 10000], [10, 50], [2, 10])
+    param_names = ['n_obs', 'n_lags', 'n_series']
+
+    def setup(self, n_obs, n_lags, n_series):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoregMultiVariate(
+                              regressor = LinearRegression(),
+                              level     = 'series_0',
+                              steps     = 10,
+                              lags      = n_lags
+                          )
+        self.series = make_series(n_obs, n_series)
+
+    def time_create_train_X_y(self, n_obs, n_lags, n_series):
+        """
+        Benchmark method create_train_X_y
+        """
+        X, y = self.forecaster.create_train_X_y(self.series)
+
+    def time_fit(self, n_obs, n_lags, n_series):
+        """
+        Benchmark method fit
+        """
+        self.forecaster.fit(series=self.series)
+
+    def peakmem_fit(self, n_obs, n_lags, n_series):
+        """
+        Peak memory of method fit
+        """
+        self.forecaster.fit(series=self.series)
+
+
+class SuitePredict:
+    params = ([10, 50], [2, 10])
+    param_names = ['n_lags', 'n_series']
+
+    def setup(self, n_lags, n_series):
+        # setup is excluded from the timing
+        forecaster = ForecasterAutoregMultiVariate(
+                         regressor = LinearRegression(),
+                         level     = 'series_0',
+                         steps     = 10,
+                         lags      = n_lags
+                     )
+        forecaster.fit(series=make_series(1000, n_series))
+        self.forecaster = forecaster
+
+    def time_predict(self, n_lags, n_series):
+        """
+        Benchmark method predict, 10 steps
+        """
+        self.forecaster.predict()
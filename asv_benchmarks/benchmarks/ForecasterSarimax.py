@@ -0,0 +1,76 @@
+# ASV Benchmarks ForecasterSarimax
+# ==============================================================================
+from pmdarima.arima import ARIMA
+from skforecast.ForecasterSarimax import ForecasterSarimax
+from skforecast.model_selection_sarimax import backtesting_sarimax
+from .common import make_series
+
+
+class SuiteFit:
+    # ForecasterSarimax has no bootstrapping, intervals come from the model.
+    params = [500, 2000]
+    param_names = ['n_obs']
+
+    def setup(self, n_obs):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterSarimax(regressor=ARIMA(order=(1, 1, 1)))
+        self.time_series = make_series(n_obs)
+
+    def time_fit(self, n_obs):
+        """
+        Benchmark method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+    def peakmem_fit(self, n_obs):
+        """
+        Peak memory of method fit
+        """
+        self.forecaster.fit(y=self.time_series)
+
+
+class SuitePredict:
+    params = [10, 100]
+    param_names = ['steps']
+
+    def setup(self, steps):
+        # setup is excluded from the timing
+        forecaster = ForecasterSarimax(regressor=ARIMA(order=(1, 1, 1)))
+        forecaster.fit(y=make_series(500))
+        self.forecaster = forecaster
+
+    def time_predict(self, steps):
+        """
+        Benchmark method predict
+        """
+        self.forecaster.predict(steps=steps)
+
+    def time_predict_interval(self, steps):
+        """
+        Benchmark method predict_interval
+        """
+        self.forecaster.predict_interval(steps=steps, interval=[5, 95])
+
+
+class SuiteBacktesting:
+    params = [True, False]
+    param_names = ['refit']
+
+    def setup(self, refit):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterSarimax(regressor=ARIMA(order=(1, 1, 1)))
+        self.time_series = make_series(300)
+
+    def time_backtesting_sarimax(self, refit):
+        """
+        Benchmark function backtesting_sarimax, 5 folds of 20 steps
+        """
+        backtesting_sarimax(
+            forecaster         = self.forecaster,
+            y                  = self.time_series,
+            steps              = 20,
+            metric             = 'mean_squared_error',
+            initial_train_size = 200,
+            refit              = refit,
+            verbose            = False
+        )
@@ -0,0 +1,22 @@
+# Data shared by the ASV benchmarks
+# ==============================================================================
+# In the benchmark classes, the values of `params` are combined and each
+# benchmark runs once per combination.
+import numpy as np
+import pandas as pd
+
+
+def make_series(n_obs, n_series=None):
+    """
+    Random walk of length `n_obs` with a RangeIndex. If `n_series` is not 
+    `None`, DataFrame with `n_series` random walks named `series_0`, `series_1`...
+    """
+    rng = np.random.default_rng(123)
+
+    if n_series is None:
+        return pd.Series(rng.normal(size=n_obs).cumsum(), name='y')
+    
+    return pd.DataFrame(
+               rng.normal(size=(n_obs, n_series)).cumsum(axis=0),
+               columns = [f'series_{i}' for i in range(n_series)]
+           )
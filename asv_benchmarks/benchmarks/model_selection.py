@@ -0,0 +1,117 @@
+# ASV Benchmarks model_selection and model_selection_multiseries
+# ==============================================================================
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from skforecast.ForecasterAutoregMultiSeries import ForecasterAutoregMultiSeries
+from skforecast.model_selection import backtesting_forecaster
+from skforecast.model_selection import grid_search_forecaster
+from skforecast.model_selection_multiseries import backtesting_forecaster_multiseries
+from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import Ridge
+from .common import make_series
+
+
+class SuiteBacktesting:
+    params = ([1000, 5000], [True, False], [False, True])
+    param_names = ['n_obs', 'refit', 'interval']
+
+    def setup(self, n_obs, refit, interval):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=24)
+        self.time_series = make_series(n_obs)
+
+    def time_backtesting_forecaster(self, n_obs, refit, interval):
+        """
+        Benchmark function backtesting_forecaster, 10 folds
+        """
+        backtesting_forecaster(
+            forecaster         = self.forecaster,
+            y                  = self.time_series,
+            steps              = n_obs // 20,
+            metric             = 'mean_squared_error',
+            initial_train_size = n_obs // 2,
+            refit              = refit,
+            interval           = [5, 95] if interval else None,
+            n_boot             = 100,
+            verbose            = False
+        )
+
+    def peakmem_backtesting_forecaster(self, n_obs, refit, interval):
+        """
+        Peak memory of function backtesting_forecaster, 10 folds
+        """
+        backtesting_forecaster(
+            forecaster         = self.forecaster,
+            y                  = self.time_series,
+            steps              = n_obs // 20,
+            metric             = 'mean_squared_error',
+            initial_train_size = n_obs // 2,
+            refit              = refit,
+            interval           = [5, 95] if interval else None,
+            n_boot             = 100,
+            verbose            = False
+        )
+
+
+class SuiteGridSearch:
+    params = ([1000, 5000], [True, False])
+    param_names = ['n_obs', 'refit']
+
+    def setup(self, n_obs, refit):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoreg(regressor=Ridge(), lags=24)
+        self.time_series = make_series(n_obs)
+
+    def time_grid_search_forecaster(self, n_obs, refit):
+        """
+        Benchmark function grid_search_forecaster, 2 lags x 3 alphas
+        """
+        grid_search_forecaster(
+            forecaster         = self.forecaster,
+            y                  = self.time_series,
+            param_grid         = {'alpha': [0.1, 1, 10]},
+            steps              = n_obs // 20,
+            metric             = 'mean_squared_error',
+            initial_train_size = n_obs // 2,
+            lags_grid          = [12, 24],
+            refit              = refit,
+            return_best        = False,
+            verbose            = False
+        )
+
+
+class SuiteBacktestingMultiSeries:
+    params = ([2, 20], [True, False])
+    param_names = ['n_series', 'refit']
+
+    def setup(self, n_series, refit):
+        # setup is excluded from the timing
+        self.forecaster = ForecasterAutoregMultiSeries(regressor=LinearRegression(), lags=24)
+        self.series = make_series(1000, n_series)
+
+    def time_backtesting_forecaster_multiseries(self, n_series, refit):
+        """
+        Benchmark function backtesting_forecaster_multiseries, 10 folds
+        """
+        backtesting_forecaster_multiseries(
+            forecaster         = self.forecaster,
+            series             = self.series,
+            steps              = 50,
+            metric             = 'mean_squared_error',
+            initial_train_size = 500,
+            refit              = refit,
+            verbose            = False
+        )
+
+    def peakmem_backtesting_forecaster_multiseries(self, n_series, refit):
+        """
+        Peak memory of function backtesting_forecaster_multiseries, 10 folds
+        """
+        backtesting_forecaster_multiseries(
+            forecaster         = self.forecaster,
+            series             = self.series,
+            steps              = 50,
+            metric             = 'mean_squared_error',
+            initial_train_size = 500,
+            refit              = refit,
+            verbose            = False
+        )
@@ -29,9 +29,17 @@ from ..utils import preprocess_y
 from ..utils import preprocess_last_window
 from ..utils import preprocess_exog
 from ..utils import expand_index
+from ..utils import append_last_window
 from ..utils import check_predict_input
 from ..utils import transform_series
+from ..utils import transform_bootstrapping_matrix
+from ..utils import fit_distribution
 from ..utils import transform_dataframe
+from ..utils import transform_numpy
+from ..utils import transform_exog_numpy
+from ..utils import ResidualStore
+from ..utils import to_residual_store
+from ..utils import timed_phase
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -71,6 +79,18 @@ class ForecasterAutoreg(ForecasterBase):
         index. For example, a function that assigns a lower weight to certain dates.
         Ignored if `regressor` does not have the argument `sample_weight` in its `fit`
         method. The resulting `sample_weight` cannot have negative values.
+
+    dtype : numpy dtype, default `numpy.float64`
+        Data type of the training matrices (lags and numeric exogenous variables)
+        created in `create_train_X_y` and used in `fit`. Use `numpy.float32` to
+        halve the memory needed by regressors that support it.
+        **New in version 0.7.0**
+
+    residuals_capacity : int, default `1000`
+        Maximum number of residuals stored in `in_sample_residuals` and
+        `out_sample_residuals`. When more residuals are available, a uniform
+        random sample is kept (reservoir sampling, see `ResidualStore`).
+        **New in version 0.7.0**
     
     Attributes
     ----------
@@ -115,6 +135,15 @@ class ForecasterAutoreg(ForecasterBase):
     source_code_weight_func : str
         Source code of the custom function used to create weights.
         **New in version 0.6.0**
+
+    dtype : numpy dtype
+        Data type of the training matrices.
+        **New in version 0.7.0**
+
+    residuals_capacity : int
+        Maximum number of residuals stored in `in_sample_residuals` and
+        `out_sample_residuals`.
+        **New in version 0.7.0**
         
     index_type : type
         Type of index of the input used in training.
@@ -138,16 +167,16 @@ class ForecasterAutoreg(ForecasterBase):
     X_train_col_names : list
         Names of columns of the matrix created internally for training.
         
-    in_sample_residuals : pandas Series
+    in_sample_residuals : ResidualStore
         Residuals of the model when predicting training data. Only stored up to
-        1000 values. If `transformer_y` is not `None`, residuals are stored in the
-        transformed scale.
+        `residuals_capacity` values (reservoir sampling). If `transformer_y` is 
+        not `None`, residuals are stored in the transformed scale.
         
-    out_sample_residuals : pandas Series
+    out_sample_residuals : ResidualStore
         Residuals of the model when predicting non training data. Only stored
-        up to 1000 values. If `transformer_y` is not `None`, residuals
-        are assumed to be in the transformed scale. Use `set_out_sample_residuals` to
-        set values.
+        up to `residuals_capacity` values (reservoir sampling). If `transformer_y`
+        is not `None`, residuals are assumed to be in the transformed scale. Use
+        `set_out_sample_residuals` to set values.
 
     creation_date : str
         Date of creation.
@@ -169,7 +198,9 @@ class ForecasterAutoreg(ForecasterBase):
         lags: Union[int, np.ndarray, list],
         transformer_y: Optional[object]=None,
         transformer_exog: Optional[object]=None,
-        weight_func: Optional[callable]=None
+        weight_func: Optional[callable]=None,
+        dtype: type=np.float64,
+        residuals_capacity: int=1000
     ) -> None:
         
         self.regressor               = regressor
@@ -177,6 +208,8 @@ class ForecasterAutoreg(ForecasterBase):
         self.transformer_exog        = transformer_exog
         self.weight_func             = weight_func
         self.source_code_weight_func = None
+        self.dtype                   = dtype
+        self.residuals_capacity      = residuals_capacity
         self.index_type              = None
         self.index_freq              = None
         self.training_range          = None
@@ -192,6 +225,7 @@ class ForecasterAutoreg(ForecasterBase):
         self.fit_date                = None
         self.skforcast_version       = skforecast.__version__
         self.python_version          = sys.version.split(" ")[0]
+        self._train_matrix_cache     = None
         
         self.lags = initialize_lags(type(self).__name__, lags)
         self.max_lag = max(self.lags)
@@ -256,6 +290,9 @@ class ForecasterAutoreg(ForecasterBase):
         
         Notice that, the returned matrix X_data, contains the lag 1 in the first
         column, the lag 2 in the second column and so on.
+
+        Lags are gathered from a strided view of `y` (no intermediate copies)
+        and `X_data` is created with the forecaster's `dtype`.
         
         Parameters
         ----------        
@@ -279,10 +316,11 @@ class ForecasterAutoreg(ForecasterBase):
                 f'of the series ({len(y)}).'
             )
         
-        X_data = np.full(shape=(n_splits, len(self.lags)), fill_value=np.nan, dtype=float)
-
-        for i, lag in enumerate(self.lags):
-            X_data[:, i] = y[self.max_lag - lag: -lag]
+        # Row i of `windows` is y[i:i + max_lag], lag `l` is its column `max_lag - l`.
+        windows = np.lib.stride_tricks.sliding_window_view(
+                      y[:-1].astype(self.dtype, copy=False), self.max_lag
+                  )
+        X_data = windows[:, self.max_lag - self.lags]
 
         y_data = y[self.max_lag:]
             
@@ -348,6 +386,8 @@ class ForecasterAutoreg(ForecasterBase):
                             inverse_transform = False
                        )
             exog_values, exog_index = preprocess_exog(exog=exog)
+            if exog_values.dtype.kind in 'biuf':
+                exog_values = exog_values.astype(self.dtype, copy=False)
             
             if not (exog_index[:len(y_index)] == y_index).all():
                 raise ValueError(
@@ -447,16 +487,16 @@ class ForecasterAutoreg(ForecasterBase):
         """
         
         # Reset values in case the forecaster has already been fitted.
-        self.index_type           = None
-        self.index_freq           = None
-        self.last_window          = None
-        self.included_exog        = False
-        self.exog_type            = None
-        self.exog_col_names       = None
-        self.X_train_col_names    = None
-        self.in_sample_residuals  = None
-        self.fitted               = False
-        self.training_range       = None
+        self.index_type          = None
+        self.index_freq          = None
+        self.last_window         = None
+        self.included_exog       = False
+        self.exog_type           = None
+        self.exog_col_names      = None
+        self.X_train_col_names   = None
+        self.in_sample_residuals = None
+        self.fitted              = False
+        self.training_range      = None
         
         if exog is not None:
             self.included_exog = True
@@ -464,13 +504,25 @@ class ForecasterAutoreg(ForecasterBase):
             self.exog_col_names = \
                  exog.columns.to_list() if isinstance(exog, pd.DataFrame) else exog.name
 
-        X_train, y_train = self.create_train_X_y(y=y, exog=exog)
+        with timed_phase('create_train_X_y') as phase:
+            if self._train_matrix_cache is not None:
+                # Training matrices already created with the same predictors,
+                # transformers and data are reused (see `TrainMatrixCache`).
+                X_train, y_train = self._train_matrix_cache.create_train_X_y(
+                                       forecaster = self,
+                                       y          = y,
+                                       exog       = exog
+                                   )
+            else:
+                X_train, y_train = self.create_train_X_y(y=y, exog=exog)
+            phase.add_array(X_train)
         sample_weight = self.create_sample_weights(X_train=X_train)
 
-        if sample_weight is not None:
-            self.regressor.fit(X=X_train, y=y_train, sample_weight=sample_weight)
-        else:
-            self.regressor.fit(X=X_train, y=y_train)
+        with timed_phase('regressor.fit'):
+            if sample_weight is not None:
+                self.regressor.fit(X=X_train, y=y_train, sample_weight=sample_weight)
+            else:
+                self.regressor.fit(X=X_train, y=y_train)
 
         self.fitted = True
         self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
@@ -481,22 +533,157 @@ class ForecasterAutoreg(ForecasterBase):
         else: 
             self.index_freq = X_train.index.step
 
-        residuals = y_train - self.regressor.predict(X_train)
-        residuals = pd.Series(
-                        data  = residuals,
-                        index = y_train.index,
-                        name  = 'in_sample_residuals'
-                    )
+        with timed_phase('regressor.predict'):
+            residuals = y_train - self.regressor.predict(X_train)
 
-        if len(residuals) > 1000:
-            # Only up to 1000 residuals are stored
-            residuals = residuals.sample(n=1000, random_state=123, replace=False)
-                                                  
-        self.in_sample_residuals = residuals
+        # Only up to `residuals_capacity` residuals are stored (reservoir sampling).
+        self.in_sample_residuals = ResidualStore(
+                                       capacity     = self.residuals_capacity,
+                                       random_state = 123
+                                   )
+        self.in_sample_residuals.append(residuals)
         
         # The last time window of training data is stored so that lags needed as
         # predictors in the first iteration of `predict()` can be calculated.
         self.last_window = y.iloc[-self.max_lag:].copy()
+
+
+    def update(
+        self,
+        y: pd.Series,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
+        update_residuals: bool=True,
+        partial_fit: bool=False
+    ) -> None:
+        """
+        Update the forecaster with new observations that follow the end of the
+        training data (or of the previous update), without fitting it again on
+        the whole history. `last_window` is moved forward so that `predict()` 
+        starts right after the new observations, the prediction errors of the 
+        new observations are added to `in_sample_residuals` and, optionally, the
+        regressor is updated with its `partial_fit` method.
+
+        Transformers are not fitted again, new values are transformed with the 
+        transformers fitted in `fit`. `last_window` is replaced by a new window
+        (the last `window_size` values are copied), it is not extended in place.
+        
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------
+        y : pandas Series
+            New observations of the time series. They must start one step ahead
+            of `last_window` end.
+            
+        exog : pandas Series, pandas DataFrame, default `None`
+            Exogenous variable/s of the new observations. Must have the same
+            number of observations as `y` and their indexes must be aligned.
+
+        update_residuals : bool, default `True`
+            If `True`, the errors of the one step ahead predictions of the new 
+            observations (made before `partial_fit`) are added to 
+            `in_sample_residuals` with reservoir sampling.
+
+        partial_fit : bool, default `False`
+            If `True`, the regressor is updated with the new observations using
+            its `partial_fit` method, for example `SGDRegressor`.
+
+        Returns 
+        -------
+        None
+        
+        """
+
+        check_y(y=y)
+        check_predict_input(
+            forecaster_type  = type(self).__name__,
+            steps            = len(y),
+            fitted           = self.fitted,
+            included_exog    = self.included_exog,
+            index_type       = self.index_type,
+            index_freq       = self.index_freq,
+            window_size      = self.window_size,
+            last_window      = self.last_window,
+            exog             = exog,
+            exog_type        = self.exog_type,
+            exog_col_names   = self.exog_col_names
+        )
+
+        if partial_fit and not hasattr(self.regressor, 'partial_fit'):
+            raise TypeError(
+                (f'`partial_fit` is only available for regressors with a `partial_fit` '
+                 f'method. Got {type(self.regressor).__name__}.')
+            )
+
+        if exog is not None and len(exog) != len(y):
+            raise ValueError(
+                (f'`exog` must have same number of samples as `y`. '
+                 f'length `exog`: ({len(exog)}), length `y`: ({len(y)})')
+            )
+
+        updated_last_window = append_last_window(
+                                  last_window = self.last_window,
+                                  new_values  = y,
+                                  window_size = self.max_lag
+                              )
+
+        if not (update_residuals or partial_fit):
+            self.last_window = updated_last_window
+            return
+
+        # Predictors of the new observations are created from the previous
+        # window followed by the new values.
+        window = transform_series(
+                     series            = pd.concat([self.last_window, y]),
+                     transformer       = self.transformer_y,
+                     fit               = False,
+                     inverse_transform = False
+                 )
+        X_new, y_new = self._create_lags(y=window.to_numpy())
+
+        if exog is not None:
+            if isinstance(exog, pd.Series):
+                exog = transform_series(
+                           series            = exog,
+                           transformer       = self.transformer_exog,
+                           fit               = False,
+                           inverse_transform = False
+                       )
+            else:
+                exog = transform_dataframe(
+                           df                = exog,
+                           transformer       = self.transformer_exog,
+                           fit               = False,
+                           inverse_transform = False
+                       )
+            exog_values, _ = preprocess_exog(exog=exog)
+            if exog_values.dtype.kind in 'biuf':
+                exog_values = exog_values.astype(self.dtype, copy=False)
+            X_new = np.column_stack((X_new, exog_values))
+
+        X_new = pd.DataFrame(
+                    data    = X_new,
+                    columns = self.X_train_col_names,
+                    index   = y.index
+                )
+
+        if update_residuals:
+            self.in_sample_residuals = to_residual_store(
+                                           residuals = self.in_sample_residuals,
+                                           capacity  = self.residuals_capacity
+                                       )
+            self.in_sample_residuals.append(y_new - self.regressor.predict(X_new))
+
+        if partial_fit:
+            sample_weight = self.create_sample_weights(X_train=X_new)
+            if sample_weight is not None:
+                self.regressor.partial_fit(X=X_new, y=y_new, sample_weight=sample_weight)
+            else:
+                self.regressor.partial_fit(X=X_new, y=y_new)
+            self.training_range = pd.Index([self.training_range[0], updated_last_window.index[-1]])
+            self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
+
+        self.last_window = updated_last_window
     
 
     def _recursive_predict(
@@ -528,27 +715,108 @@ class ForecasterAutoreg(ForecasterBase):
         
         """
 
-        predictions = np.full(shape=steps, fill_value=np.nan)
+        n_lags = len(self.lags)
+        if exog is not None and exog.ndim == 1:
+            exog = exog.reshape(-1, 1)
+        n_exog = exog.shape[1] if exog is not None else 0
+
+        # Predictions are written after the initial window in a preallocated
+        # array, so the lags of each step are read without shifting the window.
+        # The predictors of each step are written in the same reused row.
+        window = np.full(shape=self.window_size + steps, fill_value=np.nan, dtype=float)
+        window[:self.window_size] = last_window[-self.window_size:]
+        X = np.full(shape=(1, n_lags + n_exog), fill_value=np.nan, dtype=float)
 
         for i in range(steps):
-            X = last_window[-self.lags].reshape(1, -1)
+            X[0, :n_lags] = window[self.window_size + i - self.lags]
             if exog is not None:
-                X = np.column_stack((X, exog[i, ].reshape(1, -1)))
+                X[0, n_lags:] = exog[i, ]
 
             with warnings.catch_warnings():
                 # Suppress scikit-learn warning: "X does not have valid feature names,
                 # but NoOpTransformer was fitted with feature names".
                 warnings.simplefilter("ignore")
-                prediction = self.regressor.predict(X)
-                predictions[i] = prediction.ravel()[0]
+                with timed_phase('regressor.predict'):
+                    prediction = self.regressor.predict(X)
+                window[self.window_size + i] = prediction.ravel()[0]
 
-            # Update `last_window` values. The first position is discarded and 
-            # the new prediction is added at the end.
-            last_window = np.append(last_window[1:], prediction)
+        predictions = window[self.window_size:]
 
         return predictions
 
-            
+
+    def _recursive_predict_bootstrapping(
+        self,
+        steps: int,
+        last_window: np.ndarray,
+        sample_residuals: np.ndarray,
+        exog: Optional[np.ndarray]=None
+    ) -> np.ndarray:
+        """
+        Predict n steps ahead for all bootstrapping iterations at once. All
+        iterations start from the same `last_window` and advance together, each
+        row of the predictors matrix belongs to one iteration, so the regressor
+        is called only once per step. The residual of each iteration is added to
+        its prediction before it is used as a predictor for the next step.
+
+        Parameters
+        ----------
+        steps : int
+            Number of future steps predicted.
+
+        last_window : numpy ndarray
+            Values of the series used to create the predictors (lags) need in the
+            first iteration of prediction (t + 1).
+
+        sample_residuals : numpy ndarray, shape (steps, n_boot)
+            Residuals added to the predictions of each step (rows) and
+            bootstrapping iteration (columns).
+
+        exog : numpy ndarray, default `None`
+            Exogenous variable/s included as predictor/s.
+
+        Returns
+        -------
+        boot_predictions : numpy ndarray, shape (steps, n_boot)
+            Predicted values of each bootstrapping iteration.
+
+        """
+
+        n_boot = sample_residuals.shape[1]
+        n_lags = len(self.lags)
+        if exog is not None and exog.ndim == 1:
+            exog = exog.reshape(-1, 1)
+        n_exog = exog.shape[1] if exog is not None else 0
+
+        # Each row stores the window of one bootstrapping iteration followed by
+        # its predictions, so lags are read without shifting the window.
+        windows = np.full(
+                      shape      = (n_boot, self.window_size + steps),
+                      fill_value = np.nan,
+                      dtype      = float
+                  )
+        windows[:, :self.window_size] = last_window[-self.window_size:]
+        X = np.full(shape=(n_boot, n_lags + n_exog), fill_value=np.nan, dtype=float)
+        boot_predictions = np.full(shape=(steps, n_boot), fill_value=np.nan, dtype=float)
+
+        for i in range(steps):
+            X[:, :n_lags] = windows[:, self.window_size + i - self.lags]
+            if exog is not None:
+                X[:, n_lags:] = exog[i, ]
+
+            with warnings.catch_warnings():
+                # Suppress scikit-learn warning: "X does not have valid feature names,
+                # but NoOpTransformer was fitted with feature names".
+                warnings.simplefilter("ignore")
+                with timed_phase('regressor.predict'):
+                    prediction = self.regressor.predict(X)
+
+            boot_predictions[i, :] = prediction.ravel() + sample_residuals[i, :]
+            windows[:, self.window_size + i] = boot_predictions[i, :]
+
+        return boot_predictions
+
+
     def predict(
         self,
         steps: int,
@@ -637,11 +905,13 @@ class ForecasterAutoreg(ForecasterBase):
                                                     last_window = last_window
                                                 )
             
-        predictions = self._recursive_predict(
-                          steps       = steps,
-                          last_window = copy(last_window_values),
-                          exog        = copy(exog_values)
-                      )
+        with timed_phase('_recursive_predict') as phase:
+            predictions = self._recursive_predict(
+                              steps       = steps,
+                              last_window = copy(last_window_values),
+                              exog        = copy(exog_values)
+                          )
+            phase.add_array(predictions)
 
         predictions = pd.Series(
                           data  = predictions,
@@ -661,7 +931,95 @@ class ForecasterAutoreg(ForecasterBase):
 
         return predictions
 
-    
+
+    def predict_numpy(
+        self,
+        steps: int,
+        last_window: Optional[np.ndarray]=None,
+        exog: Optional[np.ndarray]=None
+    ) -> np.ndarray:
+        """
+        Predict n steps ahead from numpy arrays. Same predictions as `predict`
+        without its input validation, index handling and pandas objects: inputs
+        are only checked against the shapes learned in `fit`. Meant for serving
+        predictions with low latency.
+
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------
+        steps : int
+            Number of future steps predicted.
+            
+        last_window : numpy ndarray, default `None`
+            Values of the series used to create the predictors (lags) needed in the 
+            first iteration of prediction (t + 1), at least `window_size` values.
+            If `None`, the values stored in `self.last_window` are used.
+            
+        exog : numpy ndarray, default `None`
+            Values of the exogenous variable/s, one row per step and the columns
+            in the same order as `exog_col_names`.
+
+        Returns 
+        -------
+        predictions : numpy ndarray
+            Predicted values.
+            
+        """
+
+        if not self.fitted:
+            raise sklearn.exceptions.NotFittedError(
+                ('This Forecaster instance is not fitted yet. Call `fit` with '
+                 'appropriate arguments before using predict.')
+            )
+
+        if last_window is None:
+            last_window = self.last_window.to_numpy()
+        elif last_window.ndim != 1 or len(last_window) < self.window_size:
+            raise ValueError(
+                (f'`last_window` must be a 1d numpy ndarray with at least '
+                 f'{self.window_size} values. Got shape {last_window.shape}.')
+            )
+        last_window = transform_numpy(
+                          array             = last_window[-self.window_size:].astype(float),
+                          transformer       = self.transformer_y,
+                          inverse_transform = False
+                      )
+
+        if (exog is None) == self.included_exog:
+            raise ValueError(
+                ('`exog` must be provided if, and only if, the forecaster was '
+                 'trained with exogenous variable/s.')
+            )
+        if exog is not None:
+            n_exog = len(self.exog_col_names) if isinstance(self.exog_col_names, list) else 1
+            exog = np.asarray(exog)
+            if len(exog) < steps or (exog.shape[1] if exog.ndim == 2 else 1) != n_exog:
+                raise ValueError(
+                    (f'`exog` must be a numpy ndarray with at least {steps} rows and '
+                     f'{n_exog} columns, in the same order as {self.exog_col_names}. '
+                     f'Got shape {exog.shape}.')
+                )
+            exog = transform_exog_numpy(
+                       exog           = exog[:steps],
+                       exog_col_names = self.exog_col_names,
+                       transformer    = self.transformer_exog
+                   )
+
+        predictions = self._recursive_predict(
+                          steps       = steps,
+                          last_window = last_window,
+                          exog        = exog
+                      )
+        predictions = transform_numpy(
+                          array             = predictions,
+                          transformer       = self.transformer_y,
+                          inverse_transform = True
+                      )
+
+        return predictions
+
+
     def predict_bootstrapping(
         self,
         steps: int,
@@ -784,11 +1142,6 @@ class ForecasterAutoreg(ForecasterBase):
                                                     last_window = last_window
                                                 )
 
-        boot_predictions = np.full(
-                               shape      = (steps, n_boot),
-                               fill_value = np.nan,
-                               dtype      = float
-                           )
         rng = np.random.default_rng(seed=random_state)
         seeds = rng.integers(low=0, high=10000, size=n_boot)
 
@@ -796,38 +1149,30 @@ class ForecasterAutoreg(ForecasterBase):
             residuals = self.in_sample_residuals
         else:
             residuals = self.out_sample_residuals
+        # Residuals assigned directly to the attribute are stored first.
+        residuals = to_residual_store(
+                        residuals = residuals,
+                        capacity  = self.residuals_capacity
+                    )
 
+        # Residuals of each bootstrapping iteration are drawn with its own seed
+        # so that results are reproducible and independent of `n_boot`.
+        sample_residuals = np.full(
+                               shape      = (steps, n_boot),
+                               fill_value = np.nan,
+                               dtype      = float
+                           )
         for i in range(n_boot):
-            # In each bootstraping iteration the initial last_window and exog 
-            # need to be restored.
-            last_window_boot = last_window_values.copy()
-            exog_boot = exog_values.copy() if exog is not None else None
-
-            rng = np.random.default_rng(seed=seeds[i])
-            sample_residuals = rng.choice(
-                                   a       = residuals,
-                                   size    = steps,
-                                   replace = True
+            sample_residuals[:, i] = residuals.sample(size=steps, random_state=seeds[i])
+
+        with timed_phase('_recursive_predict_bootstrapping') as phase:
+            boot_predictions = self._recursive_predict_bootstrapping(
+                                   steps            = steps,
+                                   last_window      = last_window_values,
+                                   sample_residuals = sample_residuals,
+                                   exog             = exog_values
                                )
-
-            for step in range(steps):
-
-                prediction = self._recursive_predict(
-                                 steps       = 1,
-                                 last_window = last_window_boot,
-                                 exog        = exog_boot 
-                             )
-                
-                prediction_with_residual  = prediction + sample_residuals[step]
-                boot_predictions[step, i] = prediction_with_residual
-
-                last_window_boot = np.append(
-                                       last_window_boot[1:],
-                                       prediction_with_residual
-                                   )
-                
-                if exog is not None:
-                    exog_boot = exog_boot[1:]
+            phase.add_array(boot_predictions)
 
         boot_predictions = pd.DataFrame(
                                data    = boot_predictions,
@@ -835,13 +1180,11 @@ class ForecasterAutoreg(ForecasterBase):
                                columns = [f"pred_boot_{i}" for i in range(n_boot)]
                            )
 
-        for col in boot_predictions.columns:
-            boot_predictions[col] = transform_series(
-                                        series            = boot_predictions[col],
-                                        transformer       = self.transformer_y,
-                                        fit               = False,
-                                        inverse_transform = True
-                                    )
+        boot_predictions = transform_bootstrapping_matrix(
+                               boot_predictions  = boot_predictions,
+                               transformer       = self.transformer_y,
+                               inverse_transform = True
+                           )
                                     
         return boot_predictions
 
@@ -948,7 +1291,9 @@ class ForecasterAutoreg(ForecasterBase):
         exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
         n_boot: int=500,
         random_state: int=123,
-        in_sample_residuals: bool=True
+        in_sample_residuals: bool=True,
+        fit_method: str='mle',
+        n_jobs: int=1
     ) -> pd.DataFrame:
         """
         Fit a given probability distribution for each step. After generating 
@@ -989,6 +1334,17 @@ class ForecasterAutoreg(ForecasterBase):
             calculated and stored the residuals within the forecaster (see
             `set_out_sample_residuals()`).
 
+        fit_method : str, default `'mle'`
+            Method used to estimate the parameters of the distribution, `'mle'`
+            (maximum likelihood) or `'moments'` (method of moments, available for 
+            `norm`, `lognorm` and `gamma`). See `skforecast.utils.fit_distribution`.
+            **New in version 0.7.0**
+
+        n_jobs : int, default `1`
+            Number of jobs used to fit by maximum likelihood the distributions
+            with no vectorized estimator. If `-1`, all processors are used.
+            **New in version 0.7.0**
+
         Returns 
         -------
         predictions : pandas DataFrame
@@ -1006,7 +1362,12 @@ class ForecasterAutoreg(ForecasterBase):
                        )       
 
         param_names = [p for p in inspect.signature(distribution._pdf).parameters if not p=='x'] + ["loc","scale"]
-        param_values = np.apply_along_axis(lambda x: distribution.fit(x), axis=1, arr=boot_samples)
+        param_values = fit_distribution(
+                           boot_samples = boot_samples,
+                           distribution = distribution,
+                           method       = fit_method,
+                           n_jobs       = n_jobs
+                       )
         predictions = pd.DataFrame(
                           data    = param_values,
                           columns = param_names,
@@ -1080,14 +1441,16 @@ class ForecasterAutoreg(ForecasterBase):
         Parameters
         ----------
         residuals : pd.Series
-            Values of residuals. If len(residuals) > 1000, only a random sample
-            of 1000 values are stored.
+            Values of residuals. If len(residuals) > `residuals_capacity`, only
+            a random sample of `residuals_capacity` values are stored.
             
         append : bool, default `True`
             If `True`, new residuals are added to the once already stored in the
-            attribute `out_sample_residuals`. Once the limit of 1000 values is
-            reached, no more values are appended. If False, `out_sample_residuals`
-            is overwritten with the new residuals.
+            attribute `out_sample_residuals`. Once the limit of `residuals_capacity`
+            values is reached, new residuals replace stored ones with reservoir
+            sampling, so that the stored values are a uniform random sample of
+            all the residuals added. If False, `out_sample_residuals` is 
+            overwritten with the new residuals.
 
         transform : bool, default `True`
             If `True`, new residuals are transformed using self.transformer_y.
@@ -1131,25 +1494,19 @@ class ForecasterAutoreg(ForecasterBase):
                             inverse_transform = False
                         )
             
-        if len(residuals) > 1000:
-            rng = np.random.default_rng(seed=random_state)
-            residuals = rng.choice(a=residuals, size=1000, replace=False)
-            residuals = pd.Series(residuals)   
-    
         if append and self.out_sample_residuals is not None:
-            free_space = max(0, 1000 - len(self.out_sample_residuals))
-            if len(residuals) < free_space:
-                residuals = np.hstack((
-                                self.out_sample_residuals,
-                                residuals
-                            ))
-            else:
-                residuals = np.hstack((
-                                self.out_sample_residuals,
-                                residuals[:free_space]
-                            ))
+            self.out_sample_residuals = to_residual_store(
+                                            residuals    = self.out_sample_residuals,
+                                            capacity     = self.residuals_capacity,
+                                            random_state = random_state
+                                        )
+        else:
+            self.out_sample_residuals = ResidualStore(
+                                            capacity     = self.residuals_capacity,
+                                            random_state = random_state
+                                        )
 
-        self.out_sample_residuals = pd.Series(residuals)
+        self.out_sample_residuals.append(residuals)
 
     
     def get_feature_importance(
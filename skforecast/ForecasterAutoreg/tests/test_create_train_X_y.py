@@ -273,4 +273,32 @@ def test_create_train_X_y_output_when_transformer_y_and_transformer_exog():
         elif isinstance(expected[i], pd.Series):
             pd.testing.assert_series_equal(results[i], expected[i])
         else:
-            assert (results[i] == expected[i]).all()
\ No newline at end of file
+            assert (results[i] == expected[i]).all()
+
+def test_create_train_X_y_output_when_dtype_is_float32():
+    """
+    Test the output of create_train_X_y when the forecaster is created with
+    `dtype=np.float32`. Lags and exog are float32, y_train keeps its dtype.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3, dtype=np.float32)
+    results = forecaster.create_train_X_y(
+                y = pd.Series(np.arange(7, dtype=float)),
+                exog =  pd.Series(np.arange(100, 107), name='exog')
+              )
+    expected = (pd.DataFrame(
+                    data = np.array([[2., 1., 0., 103.],
+                                     [3., 2., 1., 104.],
+                                     [4., 3., 2., 105.],
+                                     [5., 4., 3., 106.]], dtype=np.float32),
+                    index   = np.array([3, 4, 5, 6]),
+                    columns = ['lag_1', 'lag_2', 'lag_3', 'exog']
+                ),
+                pd.Series(
+                    np.array([3., 4., 5., 6.]),
+                    index = np.array([3, 4, 5, 6]),
+                    name = 'y'
+                )
+               )
+
+    pd.testing.assert_frame_equal(results[0], expected[0])
+    pd.testing.assert_series_equal(results[1], expected[1])
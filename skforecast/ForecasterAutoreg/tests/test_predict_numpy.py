@@ -0,0 +1,81 @@
+# Unit test predict_numpy ForecasterAutoreg
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from sklearn.exceptions import NotFittedError
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+# Fixtures
+from .fixtures_ForecasterAutoreg import y
+from .fixtures_ForecasterAutoreg import exog
+from .fixtures_ForecasterAutoreg import exog_predict
+
+
+def test_predict_numpy_exception_when_forecaster_not_fitted():
+    """
+    Test NotFittedError is raised when predict_numpy is called before fit.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+
+    err_msg = re.escape(
+                ('This Forecaster instance is not fitted yet. Call `fit` with '
+                 'appropriate arguments before using predict.')
+              )
+    with pytest.raises(NotFittedError, match = err_msg):
+        forecaster.predict_numpy(steps=1, last_window=y.to_numpy())
+
+
+def test_predict_numpy_exception_when_last_window_too_short():
+    """
+    Test ValueError is raised when last_window has less values than window_size.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y)
+
+    err_msg = re.escape(
+                ('`last_window` must be a 1d numpy ndarray with at least '
+                 '3 values. Got shape (2,).')
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.predict_numpy(steps=1, last_window=y.to_numpy()[:2])
+
+
+def test_predict_numpy_exception_when_exog_not_provided():
+    """
+    Test ValueError is raised when the forecaster was trained with exog and
+    exog is None.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y, exog=exog)
+
+    err_msg = re.escape(
+                ('`exog` must be provided if, and only if, the forecaster was '
+                 'trained with exogenous variable/s.')
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.predict_numpy(steps=1)
+
+
+def test_predict_numpy_output_equal_to_predict_exog_and_transformer():
+    """
+    Test predict_numpy returns the same values as predict when exog and
+    transformers are included, with and without last_window.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor        = LinearRegression(),
+                     lags             = 5,
+                     transformer_y    = StandardScaler(),
+                     transformer_exog = StandardScaler()
+                 )
+    forecaster.fit(y=y, exog=exog)
+
+    expected = forecaster.predict(steps=5, exog=exog_predict).to_numpy()
+    results = forecaster.predict_numpy(steps=5, exog=exog_predict.to_numpy())
+    np.testing.assert_array_almost_equal(results, expected)
+
+    expected = forecaster.predict(steps=5, last_window=y[:30], exog=exog[30:]).to_numpy()
+    results = forecaster.predict_numpy(steps=5, last_window=y[:30].to_numpy(), exog=exog[30:].to_numpy())
+    np.testing.assert_array_almost_equal(results, expected)
@@ -19,4 +19,20 @@ def test_recursive_predict_output_when_regressor_is_LinearRegression():
                     exog = None
                   )
     expected = np.array([50., 51., 52., 53., 54.])
-    assert (predictions == approx(expected))
\ No newline at end of file
+    assert (predictions == approx(expected))
+
+def test_recursive_predict_output_when_last_window_is_longer_than_window_size_and_exog_is_1d():
+    """
+    Test _recursive_predict output when `last_window` has more values than
+    `window_size` (only the last `window_size` values are used) and `exog`
+    is a 1d numpy ndarray.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=pd.Series(np.arange(50)), exog=pd.Series(np.arange(100, 150), name='exog'))
+    predictions = forecaster._recursive_predict(
+                    steps = 5,
+                    last_window = np.arange(40, 50),
+                    exog = np.arange(150, 155)
+                  )
+    expected = np.array([50., 51., 52., 53., 54.])
+    assert (predictions == approx(expected))
@@ -0,0 +1,57 @@
+# Unit test _recursive_predict_bootstrapping ForecasterAutoreg
+# ==============================================================================
+import numpy as np
+import pandas as pd
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from sklearn.linear_model import LinearRegression
+
+# Fixtures
+from .fixtures_ForecasterAutoreg import y
+from .fixtures_ForecasterAutoreg import exog
+from .fixtures_ForecasterAutoreg import exog_predict
+
+
+def test_recursive_predict_bootstrapping_output_when_residuals_are_zero():
+    """
+    Test _recursive_predict_bootstrapping output is equal to _recursive_predict
+    in every bootstrapping iteration when all residuals are 0.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y, exog=exog)
+    boot_predictions = forecaster._recursive_predict_bootstrapping(
+                           steps            = 5,
+                           last_window      = forecaster.last_window.values,
+                           sample_residuals = np.zeros(shape=(5, 3)),
+                           exog             = exog_predict.values
+                       )
+    predictions = forecaster._recursive_predict(
+                      steps       = 5,
+                      last_window = forecaster.last_window.values,
+                      exog        = exog_predict.values
+                  )
+    expected = np.tile(predictions.reshape(-1, 1), (1, 3))
+
+    np.testing.assert_array_almost_equal(boot_predictions, expected)
+
+
+def test_recursive_predict_bootstrapping_output_when_regressor_is_LinearRegression():
+    """
+    Test _recursive_predict_bootstrapping output when using LinearRegression
+    as regressor. Residuals of each step are added to the prediction before
+    it is used as a predictor for the next step.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=pd.Series(np.arange(50)))
+    boot_predictions = forecaster._recursive_predict_bootstrapping(
+                           steps            = 3,
+                           last_window      = forecaster.last_window.values,
+                           sample_residuals = np.array([[0., 1.],
+                                                        [0., 1.],
+                                                        [0., 1.]]),
+                           exog             = None
+                       )
+    expected = np.array([[50., 51.        ],
+                         [51., 52.33333333],
+                         [52., 53.77777778]])
+
+    np.testing.assert_array_almost_equal(boot_predictions, expected)
@@ -0,0 +1,118 @@
+# Unit test update ForecasterAutoreg
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from sklearn.exceptions import NotFittedError
+from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+
+# Fixtures
+from .fixtures_ForecasterAutoreg import y
+from .fixtures_ForecasterAutoreg import exog
+
+
+def test_update_exception_when_forecaster_not_fitted():
+    """
+    Test NotFittedError is raised when update is called before fit.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+
+    err_msg = re.escape(
+                ('This Forecaster instance is not fitted yet. Call `fit` with '
+                 'appropriate arguments before using predict.')
+              )
+    with pytest.raises(NotFittedError, match = err_msg):
+        forecaster.update(y=y[40:])
+
+
+def test_update_exception_when_y_does_not_start_after_last_window():
+    """
+    Test ValueError is raised when the new observations do not start one step
+    ahead of last_window end.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y[:40])
+
+    err_msg = re.escape('`new_values` must start one step ahead of `last_window` end')
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.update(y=y[41:])
+
+
+def test_update_exception_when_partial_fit_and_regressor_has_no_partial_fit():
+    """
+    Test TypeError is raised when partial_fit=True and the regressor has no
+    partial_fit method.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y[:40])
+
+    err_msg = re.escape(
+                ('`partial_fit` is only available for regressors with a `partial_fit` '
+                 'method. Got LinearRegression.')
+              )
+    with pytest.raises(TypeError, match = err_msg):
+        forecaster.update(y=y[40:], partial_fit=True)
+
+
+def test_update_predict_equal_to_predict_with_last_window_exog_and_transformer():
+    """
+    Test predictions after update are the same as predictions using the whole
+    series as last_window, and new residuals are the one step ahead errors of
+    the new observations.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor        = LinearRegression(),
+                     lags             = 3,
+                     transformer_y    = StandardScaler(),
+                     transformer_exog = StandardScaler()
+                 )
+    forecaster.fit(y=y[:40], exog=exog[:40])
+    n_residuals = len(forecaster.in_sample_residuals)
+    expected = forecaster.predict(steps=5, last_window=y[:45], exog=exog[45:])
+    expected_residuals = [
+        (y.iloc[i] - forecaster.predict(steps=1, last_window=y[:i], exog=exog[i:]).iloc[0])
+        / forecaster.transformer_y.scale_[0]
+        for i in range(40, 45)
+    ]
+
+    forecaster.update(y=y[40:45], exog=exog[40:45])
+    results = forecaster.predict(steps=5, exog=exog[45:])
+
+    pd.testing.assert_series_equal(results, expected)
+    pd.testing.assert_series_equal(forecaster.last_window, y[42:45])
+    assert len(forecaster.in_sample_residuals) == n_residuals + 5
+    np.testing.assert_array_almost_equal(
+        forecaster.in_sample_residuals.values[-5:], expected_residuals
+    )
+
+
+def test_update_last_window_keeps_datetime_index_frequency():
+    """
+    Test last_window keeps the DatetimeIndex frequency after several updates.
+    """
+    y_datetime = y.copy()
+    y_datetime.index = pd.date_range(start='2022-01-01', periods=50, freq='D')
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y_datetime[:40])
+    for i in range(40, 50):
+        forecaster.update(y=y_datetime[i:i + 1], update_residuals=False)
+
+    pd.testing.assert_series_equal(forecaster.last_window, y_datetime[47:])
+    assert forecaster.last_window.index.freqstr == 'D'
+
+
+def test_update_partial_fit_updates_regressor_and_training_range():
+    """
+    Test partial_fit=True updates the regressor and the end of training_range.
+    """
+    forecaster = ForecasterAutoreg(SGDRegressor(random_state=123), lags=3)
+    forecaster.fit(y=y[:40])
+    coef = forecaster.regressor.coef_.copy()
+    forecaster.update(y=y[40:], partial_fit=True)
+
+    assert (forecaster.regressor.coef_ != coef).any()
+    assert forecaster.training_range.to_list() == [0, 49]
@@ -30,7 +30,12 @@ from ..utils import preprocess_exog
 from ..utils import expand_index
 from ..utils import check_predict_input
 from ..utils import transform_series
+from ..utils import transform_bootstrapping_matrix
+from ..utils import fit_distribution
 from ..utils import transform_dataframe
+from ..utils import ResidualStore
+from ..utils import to_residual_store
+from ..utils import timed_phase
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -72,6 +77,20 @@ class ForecasterAutoregCustom(ForecasterBase):
         Ignored if `regressor` does not have the argument `sample_weight` in its `fit`
         method. The resulting `sample_weight` cannot have negative values.
         **New in version 0.6.0**
+
+    vectorized_predictors : bool, default `False`
+        If `True`, `fun_predictors` receives a 2d numpy ndarray of shape
+        (n_windows, window_size), one window per row, and must return a 2d numpy
+        ndarray of shape (n_windows, n_predictors). The training matrix is then
+        created with a single call to `fun_predictors` instead of one call per
+        window. The windows are a read-only view of the series.
+        **New in version 0.7.0**
+
+    residuals_capacity : int, default `1000`
+        Maximum number of residuals stored in `in_sample_residuals` and
+        `out_sample_residuals`. When more residuals are available, a uniform
+        random sample is kept (reservoir sampling, see `ResidualStore`).
+        **New in version 0.7.0**
     
     Attributes
     ----------
@@ -119,6 +138,16 @@ class ForecasterAutoregCustom(ForecasterBase):
     source_code_weight_func : str
         Source code of the custom function used to create weights.
         **New in version 0.6.0**
+
+    vectorized_predictors : bool
+        If `True`, `fun_predictors` creates the predictors of all the windows
+        (one per row of a 2d numpy ndarray) at once.
+        **New in version 0.7.0**
+
+    residuals_capacity : int
+        Maximum number of residuals stored in `in_sample_residuals` and
+        `out_sample_residuals`.
+        **New in version 0.7.0**
         
     index_type : type
         Type of index of the input used in training.
@@ -142,16 +171,16 @@ class ForecasterAutoregCustom(ForecasterBase):
     X_train_col_names : list
         Names of columns of the matrix created internally for training.
         
-    in_sample_residuals : pandas Series
+    in_sample_residuals : ResidualStore
         Residuals of the model when predicting training data. Only stored up to
-        1000 values. If `transformer_y` is not `None`, residuals are stored in the
-        transformed scale.
+        `residuals_capacity` values (reservoir sampling). If `transformer_y` is 
+        not `None`, residuals are stored in the transformed scale.
         
-    out_sample_residuals : pandas Series
+    out_sample_residuals : ResidualStore
         Residuals of the model when predicting non training data. Only stored
-        up to 1000 values. If `transformer_y` is not `None`, residuals
-        are assumed to be in the transformed scale. Use `set_out_sample_residuals` to
-        set values.
+        up to `residuals_capacity` values (reservoir sampling). If `transformer_y`
+        is not `None`, residuals are assumed to be in the transformed scale. Use
+        `set_out_sample_residuals` to set values.
 
     creation_date : str
         Date of creation.
@@ -174,7 +203,9 @@ class ForecasterAutoregCustom(ForecasterBase):
         window_size: int,
         transformer_y: Optional[object]=None,
         transformer_exog: Optional[object]=None,
-        weight_func: Optional[callable]=None
+        weight_func: Optional[callable]=None,
+        vectorized_predictors: bool=False,
+        residuals_capacity: int=1000
     ) -> None:
         
         self.regressor                     = regressor
@@ -185,6 +216,8 @@ class ForecasterAutoregCustom(ForecasterBase):
         self.transformer_exog              = transformer_exog
         self.weight_func                   = weight_func
         self.source_code_weight_func       = None
+        self.vectorized_predictors         = vectorized_predictors
+        self.residuals_capacity            = residuals_capacity
         self.index_type                    = None
         self.index_freq                    = None
         self.training_range                = None
@@ -200,6 +233,7 @@ class ForecasterAutoregCustom(ForecasterBase):
         self.fit_date                      = None
         self.skforcast_version             = skforecast.__version__
         self.python_version                = sys.version.split(" ")[0]
+        self._train_matrix_cache           = None
         
         if not isinstance(window_size, int):
             raise TypeError(
@@ -335,19 +369,37 @@ class ForecasterAutoregCustom(ForecasterBase):
                      'to ensure the correct alignment of values.')      
                 )
        
-        X_train  = []
-        y_train  = []
+        if self.vectorized_predictors:
+            # Row i of `windows` is y[i:i + window_size], the window that
+            # precedes y[i + window_size].
+            windows = np.lib.stride_tricks.sliding_window_view(
+                          y_values[:-1], self.window_size
+                      )
+            X_train = self.create_predictors(y=windows)
+            if not isinstance(X_train, np.ndarray) or X_train.ndim != 2 \
+               or X_train.shape[0] != windows.shape[0]:
+                raise ValueError(
+                    (f"When `vectorized_predictors` is `True`, `create_predictors()` "
+                     f"must return a 2d numpy ndarray with one row per window. "
+                     f"Expected {windows.shape[0]} rows. Got "
+                     f"{getattr(X_train, 'shape', type(X_train))}.")
+                )
+            y_train = y_values[self.window_size:]
+        else:
+            X_train  = []
+            y_train  = []
 
-        for i in range(len(y) - self.window_size):
+            for i in range(len(y) - self.window_size):
 
-            train_index = np.arange(i, self.window_size + i)
-            test_index  = self.window_size + i
+                train_index = np.arange(i, self.window_size + i)
+                test_index  = self.window_size + i
+
+                X_train.append(self.create_predictors(y=y_values[train_index]))
+                y_train.append(y_values[test_index])
+            
+            X_train = np.vstack(X_train)
+            y_train = np.array(y_train)
 
-            X_train.append(self.create_predictors(y=y_values[train_index]))
-            y_train.append(y_values[test_index])
-        
-        X_train = np.vstack(X_train)
-        y_train = np.array(y_train)
         X_train_col_names = [f"custom_predictor_{i}" for i in range(X_train.shape[1])]
 
         if np.isnan(X_train).any():
@@ -445,16 +497,16 @@ class ForecasterAutoregCustom(ForecasterBase):
         """
         
         # Reset values in case the forecaster has already been fitted.
-        self.index_type           = None
-        self.index_freq           = None
-        self.last_window          = None
-        self.included_exog        = False
-        self.exog_type            = None
-        self.exog_col_names       = None
-        self.X_train_col_names    = None
-        self.in_sample_residuals  = None
-        self.fitted               = False
-        self.training_range       = None
+        self.index_type          = None
+        self.index_freq          = None
+        self.last_window         = None
+        self.included_exog       = False
+        self.exog_type           = None
+        self.exog_col_names      = None
+        self.X_train_col_names   = None
+        self.in_sample_residuals = None
+        self.fitted              = False
+        self.training_range      = None
         
         if exog is not None:
             self.included_exog = True
@@ -462,13 +514,25 @@ class ForecasterAutoregCustom(ForecasterBase):
             self.exog_col_names = \
                  exog.columns.to_list() if isinstance(exog, pd.DataFrame) else exog.name
         
-        X_train, y_train = self.create_train_X_y(y=y, exog=exog)
+        with timed_phase('create_train_X_y') as phase:
+            if self._train_matrix_cache is not None:
+                # Training matrices already created with the same predictors,
+                # transformers and data are reused (see `TrainMatrixCache`).
+                X_train, y_train = self._train_matrix_cache.create_train_X_y(
+                                       forecaster = self,
+                                       y          = y,
+                                       exog       = exog
+                                   )
+            else:
+                X_train, y_train = self.create_train_X_y(y=y, exog=exog)
+            phase.add_array(X_train)
         sample_weight = self.create_sample_weights(X_train=X_train)
         
-        if sample_weight is not None:
-            self.regressor.fit(X=X_train, y=y_train, sample_weight=sample_weight)
-        else:
-            self.regressor.fit(X=X_train, y=y_train)
+        with timed_phase('regressor.fit'):
+            if sample_weight is not None:
+                self.regressor.fit(X=X_train, y=y_train, sample_weight=sample_weight)
+            else:
+                self.regressor.fit(X=X_train, y=y_train)
         
         self.fitted = True
         self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
@@ -479,18 +543,15 @@ class ForecasterAutoregCustom(ForecasterBase):
         else: 
             self.index_freq = X_train.index.step
 
-        residuals = y_train - self.regressor.predict(X_train)
-        residuals = pd.Series(
-                        data  = residuals,
-                        index = y_train.index,
-                        name  = 'in_sample_residuals'
-                    )
+        with timed_phase('regressor.predict'):
+            residuals = y_train - self.regressor.predict(X_train)
 
-        if len(residuals) > 1000:
-            # Only up to 1000 residuals are stored
-            residuals = residuals.sample(n=1000, random_state=123, replace=False)
-                                                  
-        self.in_sample_residuals = residuals
+        # Only up to `residuals_capacity` residuals are stored (reservoir sampling).
+        self.in_sample_residuals = ResidualStore(
+                                       capacity     = self.residuals_capacity,
+                                       random_state = 123
+                                   )
+        self.in_sample_residuals.append(residuals)
         
         # The last time window of training data is stored so that predictors in
         # the first iteration of `predict()` can be calculated.
@@ -529,7 +590,10 @@ class ForecasterAutoregCustom(ForecasterBase):
         predictions = np.full(shape=steps, fill_value=np.nan)
 
         for i in range(steps):
-            X = self.create_predictors(y=last_window).reshape(1, -1)
+            if self.vectorized_predictors:
+                X = self.create_predictors(y=last_window.reshape(1, -1))
+            else:
+                X = self.create_predictors(y=last_window).reshape(1, -1)
             if np.isnan(X).any():
                 raise Exception(
                     f"`create_predictors()` is returning `NaN` values."
@@ -541,7 +605,8 @@ class ForecasterAutoregCustom(ForecasterBase):
                 # Suppress scikit-learn warning: "X does not have valid feature names,
                 # but NoOpTransformer was fitted with feature names".
                 warnings.simplefilter("ignore")
-                prediction = self.regressor.predict(X)
+                with timed_phase('regressor.predict'):
+                    prediction = self.regressor.predict(X)
                 predictions[i] = prediction.ravel()[0]
 
             # Update `last_window` values. The first position is discarded and 
@@ -639,11 +704,13 @@ class ForecasterAutoregCustom(ForecasterBase):
                                                     last_window = last_window
                                                 )
             
-        predictions = self._recursive_predict(
-                        steps       = steps,
-                        last_window = copy(last_window_values),
-                        exog        = copy(exog_values)
-                      )
+        with timed_phase('_recursive_predict') as phase:
+            predictions = self._recursive_predict(
+                            steps       = steps,
+                            last_window = copy(last_window_values),
+                            exog        = copy(exog_values)
+                          )
+            phase.add_array(predictions)
 
         predictions = pd.Series(
                         data  = predictions,
@@ -798,6 +865,11 @@ class ForecasterAutoregCustom(ForecasterBase):
             residuals = self.in_sample_residuals
         else:
             residuals = self.out_sample_residuals
+        # Residuals assigned directly to the attribute are stored first.
+        residuals = to_residual_store(
+                        residuals = residuals,
+                        capacity  = self.residuals_capacity
+                    )
 
         for i in range(n_boot):
             # In each bootstraping iteration the initial last_window and exog 
@@ -805,12 +877,7 @@ class ForecasterAutoregCustom(ForecasterBase):
             last_window_boot = last_window_values.copy()
             exog_boot = exog_values.copy() if exog is not None else None
 
-            rng = np.random.default_rng(seed=seeds[i])
-            sample_residuals = rng.choice(
-                                   a       = residuals,
-                                   size    = steps,
-                                   replace = True
-                               )
+            sample_residuals = residuals.sample(size=steps, random_state=seeds[i])
 
             for step in range(steps):
 
@@ -837,13 +904,11 @@ class ForecasterAutoregCustom(ForecasterBase):
                                columns = [f"pred_boot_{i}" for i in range(n_boot)]
                            )
                             
-        for col in boot_predictions.columns:
-            boot_predictions[col] = transform_series(
-                                        series            = boot_predictions[col],
-                                        transformer       = self.transformer_y,
-                                        fit               = False,
-                                        inverse_transform = True
-                                    )
+        boot_predictions = transform_bootstrapping_matrix(
+                               boot_predictions  = boot_predictions,
+                               transformer       = self.transformer_y,
+                               inverse_transform = True
+                           )
         
         return boot_predictions
     
@@ -950,7 +1015,9 @@ class ForecasterAutoregCustom(ForecasterBase):
         exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
         n_boot: int=500,
         random_state: int=123,
-        in_sample_residuals: bool=True
+        in_sample_residuals: bool=True,
+        fit_method: str='mle',
+        n_jobs: int=1
     ) -> pd.DataFrame:
         """
         Fit a given probability distribution for each step. After generating 
@@ -991,6 +1058,17 @@ class ForecasterAutoregCustom(ForecasterBase):
             calculated and stored the residuals within the forecaster (see
             `set_out_sample_residuals()`).
 
+        fit_method : str, default `'mle'`
+            Method used to estimate the parameters of the distribution, `'mle'`
+            (maximum likelihood) or `'moments'` (method of moments, available for 
+            `norm`, `lognorm` and `gamma`). See `skforecast.utils.fit_distribution`.
+            **New in version 0.7.0**
+
+        n_jobs : int, default `1`
+            Number of jobs used to fit by maximum likelihood the distributions
+            with no vectorized estimator. If `-1`, all processors are used.
+            **New in version 0.7.0**
+
         Returns 
         -------
         predictions : pandas DataFrame
@@ -1008,7 +1086,12 @@ class ForecasterAutoregCustom(ForecasterBase):
                        )
 
         param_names = [p for p in inspect.signature(distribution._pdf).parameters if not p=='x'] + ["loc","scale"]
-        param_values = np.apply_along_axis(lambda x: distribution.fit(x), axis=1, arr=boot_samples)
+        param_values = fit_distribution(
+                           boot_samples = boot_samples,
+                           distribution = distribution,
+                           method       = fit_method,
+                           n_jobs       = n_jobs
+                       )
         predictions = pd.DataFrame(
                           data    = param_values,
                           columns = param_names,
@@ -1056,14 +1139,16 @@ class ForecasterAutoregCustom(ForecasterBase):
         Parameters
         ----------
         residuals : pd.Series
-            Values of residuals. If len(residuals) > 1000, only a random sample
-            of 1000 values are stored.
+            Values of residuals. If len(residuals) > `residuals_capacity`, only
+            a random sample of `residuals_capacity` values are stored.
             
         append : bool, default `True`
             If `True`, new residuals are added to the once already stored in the
-            attribute `out_sample_residuals`. Once the limit of 1000 values is
-            reached, no more values are appended. If False, `out_sample_residuals`
-            is overwritten with the new residuals.
+            attribute `out_sample_residuals`. Once the limit of `residuals_capacity`
+            values is reached, new residuals replace stored ones with reservoir
+            sampling, so that the stored values are a uniform random sample of
+            all the residuals added. If False, `out_sample_residuals` is 
+            overwritten with the new residuals.
 
         transform : bool, default `True`
             If `True`, new residuals are transformed using self.transformer_y.
@@ -1107,25 +1192,19 @@ class ForecasterAutoregCustom(ForecasterBase):
                             inverse_transform = False
                         )
             
-        if len(residuals) > 1000:
-            rng = np.random.default_rng(seed=random_state)
-            residuals = rng.choice(a=residuals, size=1000, replace=False)
-            residuals = pd.Series(residuals)   
-    
         if append and self.out_sample_residuals is not None:
-            free_space = max(0, 1000 - len(self.out_sample_residuals))
-            if len(residuals) < free_space:
-                residuals = np.hstack((
-                                self.out_sample_residuals,
-                                residuals
-                            ))
-            else:
-                residuals = np.hstack((
-                                self.out_sample_residuals,
-                                residuals[:free_space]
-                            ))
+            self.out_sample_residuals = to_residual_store(
+                                            residuals    = self.out_sample_residuals,
+                                            capacity     = self.residuals_capacity,
+                                            random_state = random_state
+                                        )
+        else:
+            self.out_sample_residuals = ResidualStore(
+                                            capacity     = self.residuals_capacity,
+                                            random_state = random_state
+                                        )
 
-        self.out_sample_residuals = pd.Series(residuals)
+        self.out_sample_residuals.append(residuals)
 
     
     def get_feature_importance(
@@ -250,4 +250,62 @@ def test_create_train_X_y_exception_fun_predictors_return_nan_values():
                 )
     err_msg = re.escape("`create_predictors()` is returning `NaN` values.")
     with pytest.raises(Exception, match = err_msg):
-        forecaster.fit(y=pd.Series(np.arange(50)))
\ No newline at end of file
+        forecaster.fit(y=pd.Series(np.arange(50)))
+
+def create_predictors_vectorized(y): # pragma: no cover
+    """
+    Create first 5 lags and the mean of each window (one window per row).
+    """
+    lags = y[:, -1:-6:-1]
+    mean = y.mean(axis=1, keepdims=True)
+    return np.hstack([lags, mean])
+
+
+def test_create_train_X_y_output_when_vectorized_predictors_is_True():
+    """
+    Test the output of create_train_X_y when `vectorized_predictors=True` is
+    the same as calling `fun_predictors` once per window.
+    """
+    y = pd.Series(np.arange(15, dtype=float))
+    exog = pd.Series(np.arange(100, 115), name='exog', dtype=float)
+
+    forecaster = ForecasterAutoregCustom(
+                     regressor             = LinearRegression(),
+                     fun_predictors        = create_predictors_vectorized,
+                     window_size           = 6,
+                     vectorized_predictors = True
+                 )
+    results = forecaster.create_train_X_y(y=y, exog=exog)
+
+    forecaster_loop = ForecasterAutoregCustom(
+                          regressor      = LinearRegression(),
+                          fun_predictors = lambda y: create_predictors_vectorized(y.reshape(1, -1)).ravel(),
+                          window_size    = 6
+                      )
+    expected = forecaster_loop.create_train_X_y(y=y, exog=exog)
+
+    pd.testing.assert_frame_equal(results[0], expected[0])
+    pd.testing.assert_series_equal(results[1], expected[1])
+
+
+def test_create_train_X_y_exception_when_vectorized_predictors_does_not_return_one_row_per_window():
+    """
+    Test exception is raised when `vectorized_predictors=True` and
+    `fun_predictors` does not return a 2d array with one row per window.
+    """
+    def create_predictors_last_window(y): # pragma: no cover
+        return y[-1]
+
+    forecaster = ForecasterAutoregCustom(
+                     regressor             = LinearRegression(),
+                     fun_predictors        = create_predictors_last_window,
+                     window_size           = 5,
+                     vectorized_predictors = True
+                 )
+    err_msg = re.escape(
+                ("When `vectorized_predictors` is `True`, `create_predictors()` "
+                 "must return a 2d numpy ndarray with one row per window. "
+                 "Expected 5 rows. Got (5,).")
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.create_train_X_y(y=pd.Series(np.arange(10)))
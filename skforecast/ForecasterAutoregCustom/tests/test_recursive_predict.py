@@ -33,4 +33,34 @@ def test_recursive_predict_output_when_regressor_is_LinearRegression():
                     exog = None
                   )
     expected = np.array([50., 51., 52., 53., 54.])
-    assert (predictions == approx(expected))
\ No newline at end of file
+    assert (predictions == approx(expected))
+
+def create_predictors_vectorized(y): # pragma: no cover
+    """
+    Create first 5 lags of each window (one window per row).
+    """
+    
+    lags = y[:, -1:-6:-1]
+    
+    return lags  
+
+
+def test_recursive_predict_output_when_vectorized_predictors_is_True():
+    """
+    Test _recursive_predict output when using LinearRegression as regressor
+    and `vectorized_predictors=True`.
+    """
+    forecaster = ForecasterAutoregCustom(
+                        regressor             = LinearRegression(),
+                        fun_predictors        = create_predictors_vectorized,
+                        window_size           = 5,
+                        vectorized_predictors = True
+                )
+    forecaster.fit(y=pd.Series(np.arange(50)))
+    predictions = forecaster._recursive_predict(
+                    steps = 5,
+                    last_window = forecaster.last_window.values,
+                    exog = None
+                  )
+    expected = np.array([50., 51., 52., 53., 54.])
+    assert (predictions == approx(expected))
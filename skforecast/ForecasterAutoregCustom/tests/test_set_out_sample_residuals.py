@@ -71,7 +71,7 @@ def test_same_out_sample_residuals_stored_when_residuals_length_is_greater_than_
     forecaster.set_out_sample_residuals(residuals=pd.Series(np.arange(2000)))
     out_sample_residuals_2 = forecaster.out_sample_residuals
 
-    assert (out_sample_residuals_1 == out_sample_residuals_2).all()
+    np.testing.assert_array_equal(out_sample_residuals_1.values, out_sample_residuals_2.values)
 
 
 def test_set_out_sample_residuals_when_residuals_length_is_less_than_1000_and_no_append():
@@ -111,6 +111,8 @@ def test_set_out_sample_residuals_when_residuals_length_is_less_than_1000_and_ap
 def test_set_out_sample_residuals_when_residuals_length_is_more_than_1000_and_append():
     """
     Test residuals stored when new residuals length is more than 1000 and append is True.
+    Once 1000 residuals are stored, new residuals replace stored ones with reservoir
+    sampling.
     """
     forecaster = ForecasterAutoregCustom(
                     regressor      = LinearRegression(),
@@ -119,10 +121,11 @@ def test_set_out_sample_residuals_when_residuals_length_is_more_than_1000_and_ap
                 )
     forecaster.set_out_sample_residuals(residuals=pd.Series(np.arange(10)))
     forecaster.set_out_sample_residuals(residuals=pd.Series(np.arange(1000)), append=True)
-    expected = pd.Series(np.hstack([np.arange(10), np.arange(1200)])[:1000])
     results = forecaster.out_sample_residuals
 
-    assert (results == expected).all()
+    assert len(results) == 1000
+    assert results.n_seen[0] == 1010
+    assert np.isin(results.values, np.hstack([np.arange(10), np.arange(1000)])).all()
 
 
 def test_set_out_sample_residuals_when_transform_is_True():
@@ -148,4 +151,4 @@ def test_set_out_sample_residuals_when_transform_is_True():
     new_residuals_transformed = pd.Series(new_residuals_transformed.flatten(), name='residuals')
     forecaster.set_out_sample_residuals(residuals=new_residuals, transform=True)
 
-    pd.testing.assert_series_equal(new_residuals_transformed, forecaster.out_sample_residuals)
\ No newline at end of file
+    np.testing.assert_array_almost_equal(new_residuals_transformed.to_numpy(), forecaster.out_sample_residuals.values)
\ No newline at end of file
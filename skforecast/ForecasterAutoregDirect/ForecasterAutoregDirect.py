@@ -17,6 +17,7 @@ import sklearn.pipeline
 from sklearn.base import clone
 import inspect
 from copy import copy
+from joblib import Parallel, delayed
 
 import skforecast
 from ..ForecasterBase import ForecasterBase
@@ -28,11 +29,19 @@ from ..utils import preprocess_y
 from ..utils import preprocess_last_window
 from ..utils import preprocess_exog
 from ..utils import exog_to_direct
+from ..utils import DirectTrainMatrix
 from ..utils import expand_index
 from ..utils import check_predict_input
 from ..utils import check_interval
 from ..utils import transform_series
+from ..utils import transform_bootstrapping_matrix
+from ..utils import fit_distribution
 from ..utils import transform_dataframe
+from ..utils import transform_numpy
+from ..utils import transform_exog_numpy
+from ..utils import timed_phase
+from ..utils import ResidualStore
+from ..utils import to_residual_store
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -78,6 +87,24 @@ class ForecasterAutoregDirect(ForecasterBase):
         Ignored if `regressor` does not have the argument `sample_weight` in its `fit`
         method. The resulting `sample_weight` cannot have negative values.
         **New in version 0.6.0**
+
+    dtype : numpy dtype, default `numpy.float64`
+        Data type of the training matrices (lags and numeric exogenous variables)
+        created in `create_train_X_y` and used in `fit`. Use `numpy.float32` to
+        halve the memory needed by regressors that support it.
+        **New in version 0.7.0**
+
+    n_jobs : int, default `1`
+        The number of jobs to run in parallel to fit the regressor of each step
+        (joblib). If `-1`, all processors are used. Use the joblib context manager
+        `parallel_backend` to choose between processes (default) and threads.
+        **New in version 0.7.0**
+
+    residuals_capacity : int, default `1000`
+        Maximum number of residuals of each step stored in `in_sample_residuals`
+        and `out_sample_residuals`. When more residuals are available, a uniform
+        random sample is kept (reservoir sampling, see `ResidualStore`).
+        **New in version 0.7.0**
     
     Attributes
     ----------
@@ -119,6 +146,19 @@ class ForecasterAutoregDirect(ForecasterBase):
     source_code_weight_func : str
         Source code of the custom function used to create weights.
         **New in version 0.6.0**
+
+    dtype : numpy dtype
+        Data type of the training matrices.
+        **New in version 0.7.0**
+
+    n_jobs : int
+        The number of jobs to run in parallel to fit the regressor of each step.
+        **New in version 0.7.0**
+
+    residuals_capacity : int
+        Maximum number of residuals of each step stored in `in_sample_residuals`
+        and `out_sample_residuals`.
+        **New in version 0.7.0**
         
     max_lag : int
         Maximum value of lag included in `lags`.
@@ -156,16 +196,18 @@ class ForecasterAutoregDirect(ForecasterBase):
     fitted : Bool
         Tag to identify if the regressor has been fitted (trained).
 
-    in_sample_residuals : dict
-        Residuals of the models when predicting training data. Only stored up to
-        1000 values per model (step). If `transformer_y` is not `None`, residuals are
-        stored in the transformed scale.
+    in_sample_residuals : ResidualStore
+        Residuals of the models when predicting training data, with one bin per
+        model (bin `step - 1`). Only stored up to `residuals_capacity` values per
+        model (reservoir sampling). If `transformer_y` is not `None`, residuals 
+        are stored in the transformed scale.
         
-    out_sample_residuals : dict
-        Residuals of the models when predicting non training data. Only stored
-        up to 1000 values per model (step). If `transformer_y` is not `None`, residuals
-        are assumed to be in the transformed scale. Use `set_out_sample_residuals` to set
-        values.
+    out_sample_residuals : ResidualStore
+        Residuals of the models when predicting non training data, with one bin
+        per model (bin `step - 1`). Only stored up to `residuals_capacity` values
+        per model (reservoir sampling). If `transformer_y` is not `None`, residuals
+        are assumed to be in the transformed scale. Use `set_out_sample_residuals` 
+        to set values.
 
     creation_date : str
         Date of creation.
@@ -193,7 +235,10 @@ class ForecasterAutoregDirect(ForecasterBase):
         lags: Union[int, np.ndarray, list],
         transformer_y: Optional[object]=None,
         transformer_exog: Optional[object]=None,
-        weight_func: Optional[callable]=None
+        weight_func: Optional[callable]=None,
+        dtype: type=np.float64,
+        n_jobs: int=1,
+        residuals_capacity: int=1000
     ) -> None:
         
         self.regressor               = regressor
@@ -202,6 +247,9 @@ class ForecasterAutoregDirect(ForecasterBase):
         self.transformer_exog        = transformer_exog
         self.weight_func             = weight_func
         self.source_code_weight_func = None
+        self.dtype                   = dtype
+        self.n_jobs                  = n_jobs
+        self.residuals_capacity      = residuals_capacity
         self.index_type              = None
         self.index_freq              = None
         self.training_range          = None
@@ -215,6 +263,7 @@ class ForecasterAutoregDirect(ForecasterBase):
         self.fit_date                = None
         self.skforcast_version       = skforecast.__version__
         self.python_version          = sys.version.split(" ")[0]
+        self._train_matrix_cache     = None
 
         if not isinstance(steps, int):
             raise TypeError(
@@ -227,7 +276,7 @@ class ForecasterAutoregDirect(ForecasterBase):
                 f"`steps` argument must be greater than or equal to 1. Got {steps}."
             )
         
-        self.in_sample_residuals = {step: None for step in range(1, steps + 1)}
+        self.in_sample_residuals = None
         self.out_sample_residuals = None
         self.regressors_ = {step: clone(self.regressor) for step in range(1, steps + 1)}
         self.lags = initialize_lags(type(self).__name__, lags)
@@ -295,6 +344,9 @@ class ForecasterAutoregDirect(ForecasterBase):
         
         Notice that, the returned matrix X_data, contains the lag 1 in the first
         column, the lag 2 in the second column and so on.
+
+        Lags are gathered from a strided view of `y` (no intermediate copies)
+        and `X_data` is created with the forecaster's `dtype`.
         
         Parameters
         ----------        
@@ -318,13 +370,16 @@ class ForecasterAutoregDirect(ForecasterBase):
                 f'of the series minus the number of steps ({len(y)-(self.steps-1)}).'
             )
         
-        X_data = np.full(shape=(n_splits, len(self.lags)), fill_value=np.nan, dtype=float)
-        for i, lag in enumerate(self.lags):
-            X_data[:, i] = y[self.max_lag - lag : -(lag + self.steps - 1)] 
+        # Row i of `windows` is y[i:i + max_lag], lag `l` is its column `max_lag - l`.
+        windows = np.lib.stride_tricks.sliding_window_view(
+                      y[:-self.steps].astype(self.dtype, copy=False), self.max_lag
+                  )
+        X_data = windows[:, self.max_lag - self.lags]
 
-        y_data = np.full(shape=(n_splits, self.steps), fill_value=np.nan, dtype=float)
-        for step in range(self.steps):
-            y_data[:, step] = y[self.max_lag + step : self.max_lag + step + n_splits]
+        # Row i of `y_data` is y[i + max_lag:i + max_lag + steps].
+        y_data = np.lib.stride_tricks.sliding_window_view(
+                     y[self.max_lag:], self.steps
+                 ).astype(float)
             
         return X_data, y_data
 
@@ -359,6 +414,39 @@ class ForecasterAutoregDirect(ForecasterBase):
         
         """
 
+        X_train, y_train = self._create_train_matrix(y=y, exog=exog).to_frame()
+
+        return X_train, y_train
+
+
+    def _create_train_matrix(
+        self,
+        y: pd.Series,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None
+    ) -> DirectTrainMatrix:
+        """
+        Create the training matrices of all the regressors as a `DirectTrainMatrix`.
+        Lags and exogenous variables are stored only once, the predictors of 
+        each step are created with its method `get_step`.
+
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------        
+        y : pandas Series
+            Training time series.
+            
+        exog : pandas Series, pandas DataFrame, default `None`
+            Exogenous variable/s included as predictor/s. Must have the same
+            number of observations as `y` and their indexes must be aligned.
+
+        Returns 
+        -------
+        train_matrix : DirectTrainMatrix
+            Training matrices of all the regressors.
+        
+        """
+
         if len(y) < self.max_lag + self.steps:
             raise ValueError(
                 f'Minimum length of `y` for training this forecaster is '
@@ -374,9 +462,11 @@ class ForecasterAutoregDirect(ForecasterBase):
             )
         y_values, y_index = preprocess_y(y=y)
 
-        X_train, y_train = self._create_lags(y=y_values)
+        X_lags, y_train = self._create_lags(y=y_values)
         y_train_col_names = [f"y_step_{i+1}" for i in range(self.steps)]
-        X_train_col_names = [f"lag_{i}" for i in self.lags]
+        X_lags_col_names = [f"lag_{i}" for i in self.lags]
+        X_exog = None
+        col_names_exog = None
 
         if exog is not None:
             if len(exog) != len(y):
@@ -402,6 +492,8 @@ class ForecasterAutoregDirect(ForecasterBase):
                            inverse_transform = False
                        )
             exog_values, exog_index = preprocess_exog(exog=exog)
+            if exog_values.dtype.kind in 'biuf':
+                exog_values = exog_values.astype(self.dtype, copy=False)
             if not (exog_index[:len(y_index)] == y_index).all():
                 raise ValueError(
                     ('Different index for `y` and `exog`. They must be equal '
@@ -409,29 +501,27 @@ class ForecasterAutoregDirect(ForecasterBase):
                 )
             col_names_exog = exog.columns if isinstance(exog, pd.DataFrame) else [exog.name]
 
-            # Transform exog to match direct format
-            X_exog = exog_to_direct(exog=exog_values, steps=self.steps)
-            col_names_exog = [f"{col_name}_step_{i+1}" for col_name in col_names_exog for i in range(self.steps)]
-            X_train_col_names.extend(col_names_exog)
-
-            # The first `self.max_lag` positions have to be removed from X_exog
-            # since they are not in X_lags.
-            X_exog = X_exog[-X_train.shape[0]:, ]
-            X_train = np.column_stack((X_train, X_exog))
-
-        X_train = pd.DataFrame(
-                      data    = X_train,
-                      columns = X_train_col_names,
-                      index   = y_index[self.max_lag + (self.steps -1): ]
-                  )
-        self.X_train_col_names = X_train_col_names
-        y_train = pd.DataFrame(
-                      data    = y_train,
-                      index   = y_index[self.max_lag + (self.steps -1): ],
-                      columns = y_train_col_names,
-                  )
+            # Transform exog to match direct format. The first `self.max_lag` 
+            # positions are removed since they are not in X_lags. Values are 
+            # copied once, the values of each step are a view of them.
+            X_exog = exog_to_direct(
+                         exog        = exog_values[self.max_lag:].copy(),
+                         steps       = self.steps,
+                         return_view = True
+                     )
+
+        train_matrix = DirectTrainMatrix(
+                           X_lags            = X_lags,
+                           y_train           = y_train,
+                           index             = y_index[self.max_lag + (self.steps -1): ],
+                           X_lags_col_names  = X_lags_col_names,
+                           y_train_col_names = y_train_col_names,
+                           X_exog            = X_exog,
+                           exog_col_names    = col_names_exog
+                       )
+        self.X_train_col_names = train_matrix.X_train_col_names
         
-        return X_train, y_train
+        return train_matrix
 
     
     def filter_train_X_y_for_step(
@@ -496,9 +586,10 @@ class ForecasterAutoregDirect(ForecasterBase):
 
         Parameters
         ----------
-        X_train : pandas DataFrame
+        X_train : pandas DataFrame, DirectTrainMatrix
            Dataframe generated with the methods `create_train_X_y` and 
-            `filter_train_X_y_for_step`, first return.
+            `filter_train_X_y_for_step`, first return, or with
+            `_create_train_matrix`. Only its index is used.
 
         Returns
         -------
@@ -562,7 +653,7 @@ class ForecasterAutoregDirect(ForecasterBase):
         self.exog_type           = None
         self.exog_col_names      = None
         self.X_train_col_names   = None
-        self.in_sample_residuals = {step: None for step in range(1, self.steps + 1)}
+        self.in_sample_residuals = None
         self.fitted              = False
         self.training_range      = None
 
@@ -572,48 +663,75 @@ class ForecasterAutoregDirect(ForecasterBase):
             self.exog_col_names = \
                  exog.columns.to_list() if isinstance(exog, pd.DataFrame) else exog.name
 
-        X_train, y_train = self.create_train_X_y(y=y, exog=exog)
+        with timed_phase('create_train_X_y') as phase:
+            if self._train_matrix_cache is not None:
+                # Training matrices already created with the same predictors,
+                # transformers and data are reused (see `TrainMatrixCache`).
+                train_matrix = self._train_matrix_cache.create_train_matrix(
+                                   forecaster = self,
+                                   y          = y,
+                                   exog       = exog
+                               )
+            else:
+                train_matrix = self._create_train_matrix(y=y, exog=exog)
+            phase.add_array(train_matrix)
         
-        # Train one regressor for each step 
-        for step in range(1, self.steps + 1): 
-            # self.regressors_ and self.filter_train_X_y_for_step expect
-            # first step to start at value 1
-            X_train_step, y_train_step = self.filter_train_X_y_for_step(
-                                             step    = step,
-                                             X_train = X_train,
-                                             y_train = y_train
-                                         )
-            sample_weight = self.create_sample_weights(X_train=X_train_step)
+        def fit_forecaster(regressor, X_train_step, y_train_step, sample_weight, step):
+            """
+            Auxiliary function to fit the regressor of one step and calculate
+            its in-sample residuals. The fits of the steps are independent, so
+            they can run in parallel.
+            """
             if sample_weight is not None:
-                self.regressors_[step].fit(
+                regressor.fit(
                     X = X_train_step,
                     y = y_train_step,
                     sample_weight = sample_weight
                 )
             else:
-                self.regressors_[step].fit(X=X_train_step, y=y_train_step)
+                regressor.fit(X=X_train_step, y=y_train_step)
                 
-            residuals = y_train_step - self.regressors_[step].predict(X_train_step)
-            residuals = pd.Series(
-                            data  = residuals,
-                            index = y_train.index,
-                            name  = 'in_sample_residuals'
-                        )
-
-            if len(residuals) > 1000:
-                # Only up to 1000 residuals are stored
-                residuals = residuals.sample(n=1000, random_state=123, replace=False)
-
-            self.in_sample_residuals[step] = residuals
+            residuals = y_train_step - regressor.predict(X_train_step)
+
+            return step, regressor, residuals
+
+        # All steps share the index of the training matrices, and therefore 
+        # the weights.
+        sample_weight = self.create_sample_weights(X_train=train_matrix)
+
+        # Train one regressor for each step. self.regressors_ and
+        # train_matrix.get_step expect first step to start at value 1.
+        # The matrices of each step are created when its job is dispatched.
+        with timed_phase('regressor.fit'):
+            results_fit = Parallel(n_jobs=self.n_jobs)(
+                              delayed(fit_forecaster)(
+                                  self.regressors_[step],
+                                  *train_matrix.get_step(step=step),
+                                  sample_weight,
+                                  step
+                              )
+                              for step in range(1, self.steps + 1)
+                          )
+
+        # Only up to `residuals_capacity` residuals of each step are stored
+        # (reservoir sampling), one bin per step.
+        self.in_sample_residuals = ResidualStore(
+                                       capacity     = self.residuals_capacity,
+                                       n_bins       = self.steps,
+                                       random_state = 123
+                                   )
+        for step, regressor, residuals in results_fit:
+            self.regressors_[step] = regressor
+            self.in_sample_residuals.append(residuals=residuals, bins=step - 1)
 
         self.fitted = True
         self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
         self.training_range = preprocess_y(y=y)[1][[0, -1]]
-        self.index_type = type(X_train.index)
-        if isinstance(X_train.index, pd.DatetimeIndex):
-            self.index_freq = X_train.index.freqstr
+        self.index_type = type(train_matrix.index)
+        if isinstance(train_matrix.index, pd.DatetimeIndex):
+            self.index_freq = train_matrix.index.freqstr
         else: 
-            self.index_freq = X_train.index.step
+            self.index_freq = train_matrix.index.step
 
         self.last_window = y.iloc[-self.max_lag:].copy()
 
@@ -745,7 +863,8 @@ class ForecasterAutoregDirect(ForecasterBase):
                 # Suppress scikit-learn warning: "X does not have valid feature names,
                 # but NoOpTransformer was fitted with feature names".
                 warnings.simplefilter("ignore")
-                predictions[i] = regressor.predict(X)
+                with timed_phase('regressor.predict'):
+                    predictions[i] = regressor.predict(X)
 
         idx = expand_index(index=last_window_index, steps=max(steps))
 
@@ -765,6 +884,126 @@ class ForecasterAutoregDirect(ForecasterBase):
         return predictions
 
 
+    def predict_numpy(
+        self,
+        steps: Optional[Union[int, list]]=None,
+        last_window: Optional[np.ndarray]=None,
+        exog: Optional[np.ndarray]=None
+    ) -> np.ndarray:
+        """
+        Predict n steps ahead from numpy arrays. Same predictions as `predict`
+        without its input validation, index handling and pandas objects: inputs
+        are only checked against the shapes learned in `fit`. Meant for serving
+        predictions with low latency.
+
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------
+        steps : int, list, None, default `None`
+            Predict n steps. The value of `steps` must be less than or equal to the 
+            value of steps defined when initializing the forecaster. Starts at 1.
+        
+            If int:
+                Only steps within the range of 1 to int are predicted.
+        
+            If list:
+                List of ints. Only the steps contained in the list are predicted.
+
+            If `None`:
+                As many steps are predicted as were defined at initialization.
+
+        last_window : numpy ndarray, default `None`
+            Values of the series used to create the predictors (lags) needed in the 
+            first iteration of prediction (t + 1), at least `window_size` values.
+            If `None`, the values stored in `self.last_window` are used.
+            
+        exog : numpy ndarray, default `None`
+            Values of the exogenous variable/s, one row per step and the columns
+            in the same order as `exog_col_names`.
+
+        Returns 
+        -------
+        predictions : numpy ndarray
+            Predicted values of each step in `steps`.
+            
+        """
+
+        if not self.fitted:
+            raise sklearn.exceptions.NotFittedError(
+                ('This Forecaster instance is not fitted yet. Call `fit` with '
+                 'appropriate arguments before using predict.')
+            )
+
+        if isinstance(steps, (int, np.integer)):
+            steps = np.arange(steps) + 1
+        elif steps is None:
+            steps = np.arange(self.steps) + 1
+        else:
+            steps = np.asarray(steps)
+        max_step = int(steps.max())
+        if steps.min() < 1 or max_step > self.steps:
+            raise ValueError(
+                f'`steps` must be between 1 and {self.steps}. Got {steps}.'
+            )
+
+        if last_window is None:
+            last_window = self.last_window.to_numpy()
+        elif last_window.ndim != 1 or len(last_window) < self.window_size:
+            raise ValueError(
+                (f'`last_window` must be a 1d numpy ndarray with at least '
+                 f'{self.window_size} values. Got shape {last_window.shape}.')
+            )
+        last_window = transform_numpy(
+                          array             = last_window[-self.window_size:].astype(float),
+                          transformer       = self.transformer_y,
+                          inverse_transform = False
+                      )
+
+        if (exog is None) == self.included_exog:
+            raise ValueError(
+                ('`exog` must be provided if, and only if, the forecaster was '
+                 'trained with exogenous variable/s.')
+            )
+        if exog is not None:
+            n_exog = len(self.exog_col_names) if isinstance(self.exog_col_names, list) else 1
+            exog = np.asarray(exog)
+            if len(exog) < max_step or (exog.shape[1] if exog.ndim == 2 else 1) != n_exog:
+                raise ValueError(
+                    (f'`exog` must be a numpy ndarray with at least {max_step} rows and '
+                     f'{n_exog} columns, in the same order as {self.exog_col_names}. '
+                     f'Got shape {exog.shape}.')
+                )
+            exog = transform_exog_numpy(
+                       exog           = exog[:max_step],
+                       exog_col_names = self.exog_col_names,
+                       transformer    = self.transformer_exog
+                   )
+
+        X_lags = last_window[-self.lags].reshape(1, -1)
+        predictions = np.full(shape=len(steps), fill_value=np.nan)
+
+        with warnings.catch_warnings():
+            # Suppress scikit-learn warning: "X does not have valid feature names,
+            # but NoOpTransformer was fitted with feature names".
+            warnings.simplefilter("ignore")
+            for i, step in enumerate(steps):
+                if exog is None:
+                    X = X_lags
+                else:
+                    # Only the exog values of the current step are used.
+                    X = np.hstack([X_lags, exog[step - 1].reshape(1, -1)])
+                predictions[i] = self.regressors_[step].predict(X)
+
+        predictions = transform_numpy(
+                          array             = predictions,
+                          transformer       = self.transformer_y,
+                          inverse_transform = True
+                      )
+
+        return predictions
+
+
     def predict_bootstrapping(
         self,
         steps: int,
@@ -846,6 +1085,14 @@ class ForecasterAutoregDirect(ForecasterBase):
             residuals = self.in_sample_residuals
         else:
             residuals = self.out_sample_residuals
+        if isinstance(residuals, dict):
+            # Residuals assigned directly to the attribute as `{step: residuals}`.
+            residuals = {step - 1: value for step, value in residuals.items()}
+        residuals = to_residual_store(
+                        residuals = residuals,
+                        capacity  = self.residuals_capacity,
+                        n_bins    = self.steps
+                    )
 
         predictions = self.predict(
                           steps       = steps,
@@ -860,9 +1107,6 @@ class ForecasterAutoregDirect(ForecasterBase):
                           fit               = False,
                           inverse_transform = False
                       )
-        boot_predictions = pd.concat([predictions] * n_boot, axis=1)
-        boot_predictions.columns= [f"pred_boot_{i}" for i in range(n_boot)]
-        
         if isinstance(steps, int):
             steps = list(np.arange(steps) + 1)
         elif steps is None:
@@ -870,22 +1114,24 @@ class ForecasterAutoregDirect(ForecasterBase):
         elif isinstance(steps, list):
             steps = list(np.array(steps))
 
-        rng = np.random.default_rng(seed=random_state)
-        for i, step in enumerate(steps):
-            sample_residuals = rng.choice(
-                                   a       = residuals[step],
-                                   size    = n_boot,
-                                   replace = True
-                               )
-            boot_predictions.iloc[i, :] = boot_predictions.iloc[i, :] + sample_residuals
-
-        for col in boot_predictions.columns:
-            boot_predictions[col] = transform_series(
-                                        series            = boot_predictions[col],
-                                        transformer       = self.transformer_y,
-                                        fit               = False,
-                                        inverse_transform = True
-                                    )
+        # The residuals of every step and bootstrapping iteration are taken from
+        # the bin of the step with a single integer-index gather.
+        sample_residuals = residuals.sample_per_bin(
+                               bins         = np.array(steps) - 1,
+                               size         = n_boot,
+                               random_state = random_state
+                           )
+        boot_predictions = pd.DataFrame(
+                               data    = predictions.to_numpy().reshape(-1, 1) + sample_residuals,
+                               index   = predictions.index,
+                               columns = [f"pred_boot_{i}" for i in range(n_boot)]
+                           )
+
+        boot_predictions = transform_bootstrapping_matrix(
+                               boot_predictions  = boot_predictions,
+                               transformer       = self.transformer_y,
+                               inverse_transform = True
+                           )
         
         return boot_predictions
 
@@ -1001,7 +1247,9 @@ class ForecasterAutoregDirect(ForecasterBase):
         exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
         n_boot: int=500,
         random_state: int=123,
-        in_sample_residuals: bool=True
+        in_sample_residuals: bool=True,
+        fit_method: str='mle',
+        n_jobs: int=1
     ) -> pd.DataFrame:
         """
         Fit a given probability distribution for each step. After generating 
@@ -1042,6 +1290,17 @@ class ForecasterAutoregDirect(ForecasterBase):
             calculated and stored the residuals within the forecaster (see
             `set_out_sample_residuals()`).
 
+        fit_method : str, default `'mle'`
+            Method used to estimate the parameters of the distribution, `'mle'`
+            (maximum likelihood) or `'moments'` (method of moments, available for 
+            `norm`, `lognorm` and `gamma`). See `skforecast.utils.fit_distribution`.
+            **New in version 0.7.0**
+
+        n_jobs : int, default `1`
+            Number of jobs used to fit by maximum likelihood the distributions
+            with no vectorized estimator. If `-1`, all processors are used.
+            **New in version 0.7.0**
+
         Returns 
         -------
         predictions : pandas DataFrame
@@ -1059,7 +1318,12 @@ class ForecasterAutoregDirect(ForecasterBase):
                        )       
 
         param_names = [p for p in inspect.signature(distribution._pdf).parameters if not p=='x'] + ["loc","scale"]
-        param_values = np.apply_along_axis(lambda x: distribution.fit(x), axis=1, arr=boot_samples)
+        param_values = fit_distribution(
+                           boot_samples = boot_samples,
+                           distribution = distribution,
+                           method       = fit_method,
+                           n_jobs       = n_jobs
+                       )
         predictions = pd.DataFrame(
                           data    = param_values,
                           columns = param_names,
@@ -1136,13 +1400,15 @@ class ForecasterAutoregDirect(ForecasterBase):
         ----------
         residuals : dict
             Dictionary of panda.Series with the residuals of each model (step).
-            If len(residuals) > 1000, only a random sample of 1000 values are stored.
+            If len(residuals) > `residuals_capacity`, only a random sample of
+            `residuals_capacity` values are stored.
             
         append : bool, default `True`
             If `True`, new residuals are added to the once already stored in the
-            attribute `out_sample_residuals`. Once the limit of 1000 values is
-            reached, no more values are appended. If False, `out_sample_residuals`
-            is overwritten with the new residuals.
+            attribute `out_sample_residuals`. Once the limit of `residuals_capacity`
+            values of a step is reached, new residuals replace stored ones with 
+            reservoir sampling. If False, `out_sample_residuals` is overwritten
+            with the new residuals.
 
         transform : bool, default `True`
             If `True`, new residuals are transformed using self.transformer_y.
@@ -1156,24 +1422,22 @@ class ForecasterAutoregDirect(ForecasterBase):
 
         """
 
-        if self.out_sample_residuals is None:
-            self.out_sample_residuals = {step: None for step in range(1, self.steps + 1)}
-
         if not isinstance(residuals, dict) or not all(isinstance(x, pd.Series) for x in residuals.values()):
             raise TypeError(
                 f"`residuals` argument must be a dict of `pd.Series`. Got {type(residuals)}."
             )
 
-        if not set(self.out_sample_residuals.keys()).issubset(set(residuals.keys())):
+        steps = set(range(1, self.steps + 1))
+        if not steps.issubset(set(residuals.keys())):
             warnings.warn(
                 f"""
                 Only residuals of models 
-                {set(self.out_sample_residuals.keys()).intersection(set(residuals.keys()))} 
+                {steps.intersection(set(residuals.keys()))} 
                 are updated.
                 """
             )
 
-        residuals = {key: value for key, value in residuals.items() if key in self.out_sample_residuals.keys()}
+        residuals = {key: value for key, value in residuals.items() if key in steps}
 
         if not transform and self.transformer_y is not None:
             warnings.warn(
@@ -1201,25 +1465,28 @@ class ForecasterAutoregDirect(ForecasterBase):
                                      inverse_transform = False
                                  )
            
-        for key, value in residuals.items():
-            if len(value) > 1000:
-                rng = np.random.default_rng(seed=random_state)
-                value = rng.choice(a=value, size=1000, replace=False)
-
-            if append and self.out_sample_residuals[key] is not None:
-                free_space = max(0, 1000 - len(self.out_sample_residuals[key]))
-                if len(value) < free_space:
-                    value = np.hstack((
-                                self.out_sample_residuals[key],
-                                value
-                            ))
-                else:
-                    value = np.hstack((
-                                self.out_sample_residuals[key],
-                                value[:free_space]
-                            ))
-            
-            self.out_sample_residuals[key] = pd.Series(value)
+        if append and self.out_sample_residuals is not None:
+            out_sample_residuals = self.out_sample_residuals
+            if isinstance(out_sample_residuals, dict):
+                # Residuals assigned directly to the attribute as `{step: residuals}`.
+                out_sample_residuals = {
+                    step - 1: value for step, value in out_sample_residuals.items()
+                }
+            self.out_sample_residuals = to_residual_store(
+                                            residuals    = out_sample_residuals,
+                                            capacity     = self.residuals_capacity,
+                                            n_bins       = self.steps,
+                                            random_state = random_state
+                                        )
+        else:
+            self.out_sample_residuals = ResidualStore(
+                                            capacity     = self.residuals_capacity,
+                                            n_bins       = self.steps,
+                                            random_state = random_state
+                                        )
+
+        for step, value in residuals.items():
+            self.out_sample_residuals.append(residuals=value, bins=step - 1)
 
  
     def get_feature_importance(
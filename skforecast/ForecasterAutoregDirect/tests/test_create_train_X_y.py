@@ -286,4 +286,33 @@ def test_create_train_X_y_output_when_lags_5_steps_3_and_and_exog_is_dataframe()
         elif isinstance(expected[i], pd.Series):
             pd.testing.assert_series_equal(results[i], expected[i])
         else:
-            assert (results[i] == expected[i]).all()
\ No newline at end of file
+            assert (results[i] == expected[i]).all()
+
+def test_create_train_X_y_output_when_dtype_is_float32():
+    """
+    Test the output of create_train_X_y when the forecaster is created with
+    `dtype=np.float32`. Lags and exog are float32, y_train is float64.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=2,
+                                         dtype=np.float32)
+    results = forecaster.create_train_X_y(
+                y = pd.Series(np.arange(7, dtype=float)),
+                exog = pd.Series(np.arange(100, 107), name='exog')
+              )
+    expected = (pd.DataFrame(
+                    data = np.array([[2., 1., 0., 103., 104.],
+                                     [3., 2., 1., 104., 105.],
+                                     [4., 3., 2., 105., 106.]], dtype=np.float32),
+                    index = np.array([4, 5, 6]),
+                    columns = ['lag_1', 'lag_2', 'lag_3', 'exog_step_1', 'exog_step_2']
+                ),
+                pd.DataFrame(
+                    np.array([[3., 4.],
+                              [4., 5.],
+                              [5., 6.]]),
+                    index = np.array([4, 5, 6]),
+                    columns = ['y_step_1', 'y_step_2'])
+               )
+
+    pd.testing.assert_frame_equal(results[0], expected[0])
+    pd.testing.assert_frame_equal(results[1], expected[1])
@@ -45,4 +45,31 @@ def test_fit_last_window_stored():
     expected = pd.Series(np.array([47, 48, 49]), index=[47, 48, 49])
     results = forecaster.last_window
 
-    pd.testing.assert_series_equal(expected, results)
\ No newline at end of file
+    pd.testing.assert_series_equal(expected, results)
+
+def test_fit_same_regressors_and_residuals_when_n_jobs_greater_than_1():
+    """
+    Test the regressors and in-sample residuals are the same when the
+    regressor of each step is fitted in parallel (n_jobs=2).
+    """
+    y = pd.Series(np.random.default_rng(123).normal(size=50))
+    exog = pd.Series(np.random.default_rng(456).normal(size=50), name='exog')
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=3)
+    forecaster.fit(y=y, exog=exog)
+    forecaster_parallel = ForecasterAutoregDirect(LinearRegression(), lags=3,
+                                                  steps=3, n_jobs=2)
+    forecaster_parallel.fit(y=y, exog=exog)
+
+    for step in range(1, 4):
+        np.testing.assert_array_almost_equal(
+            forecaster_parallel.regressors_[step].coef_,
+            forecaster.regressors_[step].coef_
+        )
+        np.testing.assert_array_almost_equal(
+            forecaster_parallel.in_sample_residuals.get(bins=step - 1),
+            forecaster.in_sample_residuals.get(bins=step - 1)
+        )
+    pd.testing.assert_series_equal(
+        forecaster_parallel.predict(exog=exog.iloc[:3].set_axis(range(50, 53))),
+        forecaster.predict(exog=exog.iloc[:3].set_axis(range(50, 53)))
+    )
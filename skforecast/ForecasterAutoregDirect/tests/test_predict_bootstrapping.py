@@ -109,4 +109,24 @@ def test_predict_bootstrapping_output_when_forecaster_is_LinearRegression_steps_
                     index   = pd.RangeIndex(start=50, stop=52)
                 )
     
-    pd.testing.assert_frame_equal(expected, results)        
\ No newline at end of file
+    pd.testing.assert_frame_equal(expected, results)        
+
+def test_predict_bootstrapping_output_when_residuals_of_each_step_have_different_length():
+    """
+    Test output of predict_bootstrapping when the out sample residuals of each
+    step have a different number of values. Each prediction is the sum of the
+    prediction of the step and one of its residuals.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), steps=3, lags=3)
+    forecaster.fit(y=y)
+    forecaster.out_sample_residuals = {1: pd.Series([1.]), 
+                                       2: pd.Series([10., 20.]),
+                                       3: pd.Series([100., 200., 300.])}
+    results = forecaster.predict_bootstrapping(steps=3, n_boot=200, in_sample_residuals=False)
+    predictions = forecaster.predict(steps=3)
+    sample_residuals = results.sub(predictions, axis=0).round(8)
+
+    assert results.shape == (3, 200)
+    assert set(sample_residuals.iloc[0]) == {1.}
+    assert set(sample_residuals.iloc[1]) == {10., 20.}
+    assert set(sample_residuals.iloc[2]) == {100., 200., 300.}
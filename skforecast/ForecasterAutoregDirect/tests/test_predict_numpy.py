@@ -0,0 +1,61 @@
+# Unit test predict_numpy ForecasterAutoregDirect
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+from skforecast.ForecasterAutoregDirect import ForecasterAutoregDirect
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+# Fixtures
+from .fixtures_ForecasterAutoregDirect import y
+from .fixtures_ForecasterAutoregDirect import exog
+from .fixtures_ForecasterAutoregDirect import exog_predict
+
+
+def test_predict_numpy_exception_when_steps_greater_than_forecaster_steps():
+    """
+    Test ValueError is raised when a step is greater than the steps of the
+    forecaster.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=3)
+    forecaster.fit(y=y)
+
+    err_msg = re.escape("`steps` must be between 1 and 3. Got [1 2 3 4].")
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.predict_numpy(steps=4)
+
+
+def test_predict_numpy_exception_when_exog_has_wrong_number_of_columns():
+    """
+    Test ValueError is raised when exog does not have the columns used in fit.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=3)
+    forecaster.fit(y=y, exog=exog)
+
+    err_msg = re.escape("`exog` must be a numpy ndarray with at least 3 rows and 1 columns")
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.predict_numpy(exog=np.ones(shape=(3, 2)))
+
+
+@pytest.mark.parametrize("steps", 
+                         [None, 2, [1, 3]], 
+                         ids = lambda steps : f'steps: {steps}')
+def test_predict_numpy_output_equal_to_predict_exog_and_transformer(steps):
+    """
+    Test predict_numpy returns the same values as predict when exog and
+    transformers are included.
+    """
+    forecaster = ForecasterAutoregDirect(
+                     regressor        = LinearRegression(),
+                     lags             = 5,
+                     steps            = 3,
+                     transformer_y    = StandardScaler(),
+                     transformer_exog = StandardScaler()
+                 )
+    forecaster.fit(y=y, exog=exog)
+
+    expected = forecaster.predict(steps=steps, exog=exog_predict).to_numpy()
+    results = forecaster.predict_numpy(steps=steps, exog=exog_predict.to_numpy())
+
+    np.testing.assert_array_almost_equal(results, expected)
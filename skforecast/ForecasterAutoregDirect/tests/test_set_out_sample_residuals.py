@@ -43,8 +43,7 @@ def test_set_out_sample_residuals_when_residuals_length_is_less_than_1000_and_no
     expected = {1:pd.Series(np.arange(10)), 2:pd.Series(np.arange(10))}
     results = forecaster.out_sample_residuals
 
-    assert expected.keys() == results.keys()
-    assert all(all(expected[k] ==results[k]) for k in expected.keys())
+    assert all(all(expected[k] == results.get(bins=k - 1)) for k in expected.keys())
 
 
 def test_set_out_sample_residuals_when_residuals_length_is_less_than_1000_and_append():
@@ -59,8 +58,7 @@ def test_set_out_sample_residuals_when_residuals_length_is_less_than_1000_and_ap
                 2:pd.concat([pd.Series(np.arange(10)), pd.Series(np.arange(10))], ignore_index=True)}
     results = forecaster.out_sample_residuals
 
-    assert expected.keys() == results.keys()
-    assert all(all(expected[k] == results[k]) for k in expected.keys())
+    assert all(all(expected[k] == results.get(bins=k - 1)) for k in expected.keys())
 
 
 def test_set_out_sample_residuals_when_residuals_length_is_greater_than_1000():
@@ -72,8 +70,8 @@ def test_set_out_sample_residuals_when_residuals_length_is_greater_than_1000():
     forecaster.set_out_sample_residuals(residuals=residuals)
     results = forecaster.out_sample_residuals
 
-    assert list(results.keys()) == [1, 2]
-    assert all(len(value)==1000 for value in results.values())
+    assert results.n_bins == 2
+    assert all(len(results.get(bins=bin_)) == 1000 for bin_ in range(2))
 
 
 def test_set_out_sample_residuals_when_residuals_keys_do_not_match():
@@ -84,7 +82,7 @@ def test_set_out_sample_residuals_when_residuals_keys_do_not_match():
     forecaster.set_out_sample_residuals(residuals=residuals)
     results = forecaster.out_sample_residuals
 
-    assert results == {1: None, 2: None}
+    assert all(len(results.get(bins=bin_)) == 0 for bin_ in range(2))
 
 
 def test_set_out_sample_residuals_when_residuals_keys_partially_match():
@@ -95,6 +93,6 @@ def test_set_out_sample_residuals_when_residuals_keys_partially_match():
     forecaster.set_out_sample_residuals(residuals=residuals)
     results = forecaster.out_sample_residuals
 
-    assert list(results.keys()) == [1, 2]
-    assert all(results[1] == pd.Series(np.arange(10)))
-    assert results[2] is None
\ No newline at end of file
+    assert results.n_bins == 2
+    assert all(results.get(bins=0) == pd.Series(np.arange(10)))
+    assert len(results.get(bins=1)) == 0
\ No newline at end of file
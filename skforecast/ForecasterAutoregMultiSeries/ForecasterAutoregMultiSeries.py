@@ -29,9 +29,18 @@ from ..utils import preprocess_y
 from ..utils import preprocess_last_window
 from ..utils import preprocess_exog
 from ..utils import expand_index
+from ..utils import append_last_window
 from ..utils import check_predict_input
 from ..utils import transform_series
+from ..utils import transform_bootstrapping_matrix
+from ..utils import fit_distribution
 from ..utils import transform_dataframe
+from ..utils import transform_numpy
+from ..utils import transform_exog_numpy
+from ..utils import timed_phase
+from ..utils import allocate_array
+from ..utils import ResidualStore
+from ..utils import to_residual_store
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -84,6 +93,35 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         in `series_weights`. If `None`, all levels have the same weight. See Notes section
         for more details on the use of the weights.
         **New in version 0.6.0**
+
+    dtype : numpy dtype, default `numpy.float64`
+        Data type of the training matrices (lags and numeric exogenous variables)
+        created in `create_train_X_y` and used in `fit`. Use `numpy.float32` to
+        halve the memory needed by regressors that support it.
+        **New in version 0.7.0**
+
+    encoding : str, default `'onehot'`
+        Encoding used to identify the series each training row belongs to.
+            `'onehot'`: one column per series (named as the series) with value 1
+            in the rows of that series and 0 elsewhere.
+            `'ordinal'`: a single column, `_level_skforecast`, with the position
+            of the series in `series_col_names`. Suitable for tree based regressors
+            when there are many series.
+        **New in version 0.7.0**
+
+    memmap_dir : str, default `None`
+        If not `None`, the training matrices (`X_train`, `y_train`) and sample
+        weights are created series by series in memory-mapped files (`numpy.memmap`)
+        in this directory instead of in RAM, so that the data used to fit the 
+        regressor can be larger than the available memory. The files are deleted
+        when they are no longer needed. Exogenous variables must be numeric.
+        **New in version 0.7.0**
+
+    residuals_capacity : int, default `1000`
+        Maximum number of residuals of each series stored in `in_sample_residuals`
+        and `out_sample_residuals`. When more residuals are available, a uniform
+        random sample is kept (reservoir sampling, see `ResidualStore`).
+        **New in version 0.7.0**
     
     Attributes
     ----------
@@ -142,6 +180,24 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         and is used internally to avoid overwriting.
         **New in version 0.6.0**
 
+    dtype : numpy dtype
+        Data type of the training matrices.
+        **New in version 0.7.0**
+
+    encoding : str
+        Encoding used to identify the series each training row belongs to.
+        **New in version 0.7.0**
+
+    memmap_dir : str
+        Directory of the memory-mapped training matrices. If `None`, they are
+        created in RAM.
+        **New in version 0.7.0**
+
+    residuals_capacity : int
+        Maximum number of residuals of each series stored in `in_sample_residuals`
+        and `out_sample_residuals`.
+        **New in version 0.7.0**
+
     max_lag : int
         Maximum value of lag included in `lags`.
         
@@ -182,13 +238,14 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         Names of columns of the matrix created internally for training.
         
     in_sample_residuals : dict
-        Residuals of the model when predicting training data. Only stored up to
-        1000 values in the form `{level: residuals}`.
+        Residuals of the model when predicting training data in the form 
+        `{level: ResidualStore}`. Only stored up to `residuals_capacity` values
+        per level (reservoir sampling).
         
     out_sample_residuals : dict
-        Residuals of the model when predicting non-training data. Only stored
-        up to 1000 values in the form `{level: residuals}`. Use 
-        `set_out_sample_residuals` to set values.
+        Residuals of the model when predicting non-training data in the form
+        `{level: ResidualStore}`. Only stored up to `residuals_capacity` values
+        per level (reservoir sampling). Use `set_out_sample_residuals` to set values.
         
     fitted : Bool
         Tag to identify if the regressor has been fitted (trained).
@@ -232,7 +289,11 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         transformer_series: Optional[Union[object, dict]]=None,
         transformer_exog: Optional[object]=None,
         weight_func: Optional[Union[callable, dict]]=None,
-        series_weights: Optional[dict]=None
+        series_weights: Optional[dict]=None,
+        dtype: type=np.float64,
+        encoding: str='onehot',
+        memmap_dir: Optional[str]=None,
+        residuals_capacity: int=1000
     ) -> None:
         
         self.regressor               = regressor
@@ -244,6 +305,10 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         self.source_code_weight_func = None
         self.series_weights          = series_weights
         self.series_weights_         = None
+        self.dtype                   = dtype
+        self.encoding                = encoding
+        self.memmap_dir              = memmap_dir
+        self.residuals_capacity      = residuals_capacity
         self.index_type              = None
         self.index_freq              = None
         self.index_values            = None
@@ -266,6 +331,11 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         self.max_lag = max(self.lags)
         self.window_size = self.max_lag
 
+        if encoding not in ['onehot', 'ordinal']:
+            raise ValueError(
+                f"Argument `encoding` must be one of 'onehot' or 'ordinal'. Got {encoding}."
+            )
+
         self.weight_func, self.source_code_weight_func, self.series_weights = initialize_weights(
             forecaster_type = type(self).__name__, 
             regressor       = regressor, 
@@ -327,6 +397,9 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         
         Notice that, the returned matrix X_data, contains the lag 1 in the first
         column, the lag 2 in the second column and so on.
+
+        Lags are gathered from a strided view of `y` (no intermediate copies)
+        and `X_data` is created with the forecaster's `dtype`.
         
         Parameters
         ----------        
@@ -350,10 +423,11 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                 f'of the series ({len(y)}).'
             )
         
-        X_data = np.full(shape=(n_splits, len(self.lags)), fill_value=np.nan, dtype=float)
-
-        for i, lag in enumerate(self.lags):
-            X_data[:, i] = y[self.max_lag - lag: -lag]
+        # Row i of `windows` is y[i:i + max_lag], lag `l` is its column `max_lag - l`.
+        windows = np.lib.stride_tricks.sliding_window_view(
+                      y[:-1].astype(self.dtype, copy=False), self.max_lag
+                  )
+        X_data = windows[:, self.max_lag - self.lags]
 
         y_data = y[self.max_lag:]
             
@@ -417,33 +491,6 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                         f" No transformation is applied to these series."
                     )
         
-        X_levels = []
-        X_train_col_names = [f"lag_{lag}" for lag in self.lags]
-
-        for i, serie in enumerate(series.columns):
-
-            y = series[serie]
-            check_y(y=y)
-            y = transform_series(
-                    series            = y,
-                    transformer       = self.transformer_series_[serie],
-                    fit               = True,
-                    inverse_transform = False
-                )
-
-            y_values, y_index = preprocess_y(y=y)
-            X_train_values, y_train_values = self._create_lags(y=y_values)
-
-            if i == 0:
-                X_train = X_train_values
-                y_train = y_train_values
-            else:
-                X_train = np.vstack((X_train, X_train_values))
-                y_train = np.append(y_train, y_train_values)
-
-            X_level = [serie]*len(X_train_values)
-            X_levels.extend(X_level)
-
         if exog is not None:
             if len(exog) != len(series):
                 raise ValueError(
@@ -466,33 +513,73 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                             inverse_transform = False
                        )
             exog_values, exog_index = preprocess_exog(exog=exog)
+            if exog_values.dtype.kind in 'biuf':
+                exog_values = exog_values.astype(self.dtype, copy=False)
+            # The first `self.max_lag` positions have to be removed from exog
+            # since they are not in X_train.
+            exog_values = exog_values[self.max_lag:, ]
+            if exog_values.ndim == 1:
+                exog_values = exog_values.reshape(-1, 1)
+            col_names_exog = exog.columns if isinstance(exog, pd.DataFrame) else [exog.name]
+            X_train_dtype = np.result_type(self.dtype, exog_values.dtype)
+        else:
+            exog_values = np.empty(shape=(max(len(series) - self.max_lag, 0), 0))
+            col_names_exog = []
+            X_train_dtype = self.dtype
+
+        n_lags = len(self.lags)
+        n_exog = exog_values.shape[1]
+        n_rows_serie = max(len(series) - self.max_lag, 0)
+        col_names_levels = series_col_names if self.encoding == 'onehot' else ['_level_skforecast']
+
+        # The matrices are allocated once, in RAM or in a memmap. Rows of each
+        # series are written in their own block: lags, exog (the same for all 
+        # series) and the level encoding.
+        X_train = allocate_array(
+                      shape      = (len(series_col_names) * n_rows_serie,
+                                    n_lags + n_exog + len(col_names_levels)),
+                      dtype      = X_train_dtype,
+                      memmap_dir = self.memmap_dir
+                  )
+        y_train = allocate_array(
+                      shape      = (len(series_col_names) * n_rows_serie,),
+                      dtype      = float,
+                      memmap_dir = self.memmap_dir
+                  )
+
+        for i, serie in enumerate(series.columns):
+
+            y = series[serie]
+            check_y(y=y)
+            y = transform_series(
+                    series            = y,
+                    transformer       = self.transformer_series_[serie],
+                    fit               = True,
+                    inverse_transform = False
+                )
+
+            y_values, y_index = preprocess_y(y=y)
+            X_train_values, y_train_values = self._create_lags(y=y_values)
+
+            rows = slice(i * n_rows_serie, (i + 1) * n_rows_serie)
+            X_train[rows, :n_lags] = X_train_values
+            X_train[rows, n_lags:n_lags + n_exog] = exog_values
+            if self.encoding == 'onehot':
+                X_train[rows, n_lags + n_exog + i] = 1.
+            else:
+                X_train[rows, n_lags + n_exog] = i
+            y_train[rows] = y_train_values
+
+        if exog is not None:
             if not (exog_index[:len(y_index)] == y_index).all():
                 raise ValueError(
                     ('Different index for `series` and `exog`. They must be equal '
                      'to ensure the correct alignment of values.')      
                 )
-            col_names_exog = exog.columns if isinstance(exog, pd.DataFrame) else [exog.name]
-            X_train_col_names.extend(col_names_exog)
-
-            # The first `self.max_lag` positions have to be removed from exog
-            # since they are not in X_train. Then exog is cloned as many times
-            # as series.
-            if exog_values.ndim == 1:
-                X_train = np.column_stack((
-                              X_train,
-                              np.tile(exog_values[self.max_lag:, ], series.shape[1])
-                          )) 
 
-            else:
-                X_train = np.column_stack((
-                              X_train,
-                              np.tile(exog_values[self.max_lag:, ], [series.shape[1], 1])
-                          ))
-
-        X_levels = pd.Series(X_levels)
-        X_levels = pd.get_dummies(X_levels, dtype=float)
-        X_train_col_names.extend(X_levels.columns)
-        X_train = np.column_stack((X_train, X_levels.values))
+        X_train_col_names = [f"lag_{lag}" for lag in self.lags]
+        X_train_col_names.extend(col_names_exog)
+        X_train_col_names.extend(col_names_levels)
 
         X_train = pd.DataFrame(
                       data    = X_train,
@@ -543,9 +630,8 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         
         """
 
-        weights = None
-        weights_samples = None
-        weights_series = None
+        if self.series_weights is None and self.weight_func is None:
+            return None
 
         if self.series_weights is not None:
             # Series not present in series_weights have a weight of 1 in all their samples.
@@ -558,9 +644,6 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                 )
             self.series_weights_ = dict.fromkeys(series.columns, 1.)
             self.series_weights_.update((k, v) for k, v in self.series_weights.items() if k in self.series_weights_)
-            weights_series = [np.repeat(self.series_weights_[serie], sum(X_train[serie])) 
-                              for serie in series.columns]
-            weights_series = np.concatenate(weights_series)
 
         if self.weight_func is not None:
             if isinstance(self.weight_func, Callable):
@@ -575,35 +658,42 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                     )
                 self.weight_func_ = dict.fromkeys(series.columns, lambda index: np.ones_like(index, dtype=float))
                 self.weight_func_.update((k, v) for k, v in self.weight_func.items() if k in self.weight_func_)
-                
-            weights_samples = []
-            for key in self.weight_func_.keys():
-                index = y_train_index[X_train[X_train[key] == 1.0].index]
-                weights_samples.append(self.weight_func_[key](index))
-            weights_samples = np.concatenate(weights_samples)
-
-        if weights_series is not None:
-            weights = weights_series
-            if weights_samples is not None:
-                weights = weights * weights_samples
-        else:
-            if weights_samples is not None:
-                weights = weights_samples
 
-        if weights is not None:
-            if np.isnan(weights).any():
+        # Rows of each series are a contiguous block of the same length in X_train.
+        # Weights are the product of the series weight and the weights of its
+        # samples, they are computed and checked block by block so that they can
+        # be written in a memmap (see `memmap_dir`).
+        n_rows_serie = len(X_train) // len(series.columns)
+        weights = allocate_array(
+                      shape      = (len(X_train),),
+                      dtype      = float,
+                      memmap_dir = self.memmap_dir
+                  )
+        weights_sum = 0.
+        for i, serie in enumerate(series.columns):
+            rows = slice(i * n_rows_serie, (i + 1) * n_rows_serie)
+            weights_block = np.ones(n_rows_serie, dtype=float)
+            if self.series_weights is not None:
+                weights_block = weights_block * self.series_weights_[serie]
+            if self.weight_func is not None:
+                weights_block = weights_block * self.weight_func_[serie](y_train_index[rows])
+
+            if np.isnan(weights_block).any():
                 raise ValueError(
                     "The resulting `weights` cannot have NaN values."
                 )
-            if np.any(weights < 0):
+            if np.any(weights_block < 0):
                 raise ValueError(
                     "The resulting `weights` cannot have negative values."
                 )
-            if np.sum(weights) == 0:
-                raise ValueError(
-                    ("The resulting `weights` cannot be normalized because "
-                     "the sum of the weights is zero.")
-                )
+            weights[rows] = weights_block
+            weights_sum += np.sum(weights_block)
+
+        if weights_sum == 0:
+            raise ValueError(
+                ("The resulting `weights` cannot be normalized because "
+                 "the sum of the weights is zero.")
+            )
 
         return weights
 
@@ -666,17 +756,20 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                      f'    `exog`   columns : {self.exog_col_names}.')
                 )
 
-        X_train, y_train, y_index, y_train_index = self.create_train_X_y(series=series, exog=exog)
+        with timed_phase('create_train_X_y') as phase:
+            X_train, y_train, y_index, y_train_index = self.create_train_X_y(series=series, exog=exog)
+            phase.add_array(X_train)
         sample_weight = self.create_sample_weights(
                             series        = series,
                             X_train       = X_train,
                             y_train_index = y_train_index,
                         )
 
-        if sample_weight is not None:
-            self.regressor.fit(X=X_train, y=y_train, sample_weight=sample_weight)
-        else:
-            self.regressor.fit(X=X_train, y=y_train)
+        with timed_phase('regressor.fit'):
+            if sample_weight is not None:
+                self.regressor.fit(X=X_train, y=y_train, sample_weight=sample_weight)
+            else:
+                self.regressor.fit(X=X_train, y=y_train)
             
         self.fitted = True
         self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
@@ -693,18 +786,30 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         # This is done to save time during fit in functions such as backtesting()
         if store_in_sample_residuals:
 
-            residuals = y_train - self.regressor.predict(X_train)
-
-            for serie in series.columns:
-                in_sample_residuals[serie] = residuals.values[X_train[serie] == 1.]
-                if len(in_sample_residuals[serie]) > 1000:
-                    # Only up to 1000 residuals are stored
-                    rng = np.random.default_rng(seed=123)
-                    in_sample_residuals[serie] = rng.choice(
-                                                     a       = in_sample_residuals[serie], 
-                                                     size    = 1000, 
-                                                     replace = False
-                                                 )
+            # Rows of each series are a contiguous block of the same length in X_train.
+            n_rows_serie = len(X_train) // len(series.columns)
+            if self.memmap_dir is None:
+                with timed_phase('regressor.predict'):
+                    residuals = y_train.to_numpy() - self.regressor.predict(X_train)
+
+            for i, serie in enumerate(series.columns):
+                rows = slice(i * n_rows_serie, (i + 1) * n_rows_serie)
+                if self.memmap_dir is None:
+                    residuals_serie = residuals[rows]
+                else:
+                    # Predicted series by series so that only the rows of one 
+                    # series are loaded in memory at a time.
+                    with timed_phase('regressor.predict'):
+                        residuals_serie = (
+                            y_train.iloc[rows].to_numpy()
+                            - self.regressor.predict(X_train.iloc[rows])
+                        )
+                # Only up to `residuals_capacity` residuals are stored (reservoir sampling).
+                in_sample_residuals[serie] = ResidualStore(
+                                                 capacity     = self.residuals_capacity,
+                                                 random_state = 123
+                                             )
+                in_sample_residuals[serie].append(residuals_serie)
         else:
             for serie in series.columns:
                 in_sample_residuals[serie] = np.array([None])
@@ -716,6 +821,201 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         self.last_window = series.iloc[-self.max_lag:, ].copy()
 
 
+    def update(
+        self,
+        series: pd.DataFrame,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
+        update_residuals: bool=True,
+        partial_fit: bool=False
+    ) -> None:
+        """
+        Update the forecaster with new observations that follow the end of the
+        training data (or of the previous update), without fitting it again on
+        the whole history. `last_window` is moved forward so that `predict()` 
+        starts right after the new observations, the prediction errors of the 
+        new observations are added to `in_sample_residuals` and, optionally, the
+        regressor is updated with its `partial_fit` method.
+
+        Transformers are not fitted again, new values are transformed with the 
+        transformers fitted in `fit`. `last_window` is replaced by a new window
+        (the last `window_size` values are copied), it is not extended in place.
+        
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------
+        series : pandas DataFrame
+            New observations of all the series used in `fit`. They must start 
+            one step ahead of `last_window` end.
+            
+        exog : pandas Series, pandas DataFrame, default `None`
+            Exogenous variable/s of the new observations. Must have the same
+            number of observations as `series` and their indexes must be aligned.
+
+        update_residuals : bool, default `True`
+            If `True`, the errors of the one step ahead predictions of the new 
+            observations (made before `partial_fit`) are added to 
+            `in_sample_residuals` with reservoir sampling.
+
+        partial_fit : bool, default `False`
+            If `True`, the regressor is updated with the new observations using
+            its `partial_fit` method, for example `SGDRegressor`.
+
+        Returns 
+        -------
+        None
+        
+        """
+
+        if not isinstance(series, pd.DataFrame):
+            raise TypeError(f'`series` must be a pandas DataFrame. Got {type(series)}.')
+
+        check_predict_input(
+            forecaster_type  = type(self).__name__,
+            steps            = len(series),
+            fitted           = self.fitted,
+            included_exog    = self.included_exog,
+            index_type       = self.index_type,
+            index_freq       = self.index_freq,
+            window_size      = self.window_size,
+            last_window      = self.last_window,
+            exog             = exog,
+            exog_type        = self.exog_type,
+            exog_col_names   = self.exog_col_names,
+            levels           = self.series_col_names,
+            series_col_names = self.series_col_names
+        )
+
+        if set(series.columns) != set(self.series_col_names):
+            raise ValueError(
+                (f'`series` must have the same columns as the series used in `fit`.\n'
+                 f'    `series` columns : {list(series.columns)}.\n'
+                 f'    Expected columns : {self.series_col_names}.')
+            )
+
+        if series.isnull().values.any():
+            raise ValueError('`series` has missing values.')
+
+        if partial_fit and not hasattr(self.regressor, 'partial_fit'):
+            raise TypeError(
+                (f'`partial_fit` is only available for regressors with a `partial_fit` '
+                 f'method. Got {type(self.regressor).__name__}.')
+            )
+
+        if exog is not None and len(exog) != len(series):
+            raise ValueError(
+                (f'`exog` must have same number of samples as `series`. '
+                 f'length `exog`: ({len(exog)}), length `series`: ({len(series)})')
+            )
+
+        series = series[self.series_col_names]
+        updated_last_window = append_last_window(
+                                  last_window = self.last_window,
+                                  new_values  = series,
+                                  window_size = self.max_lag
+                              )
+
+        if not (update_residuals or partial_fit):
+            self.last_window = updated_last_window
+            return
+
+        if exog is not None:
+            if isinstance(exog, pd.Series):
+                exog = transform_series(
+                           series            = exog,
+                           transformer       = self.transformer_exog,
+                           fit               = False,
+                           inverse_transform = False
+                       )
+            else:
+                exog = transform_dataframe(
+                           df                = exog,
+                           transformer       = self.transformer_exog,
+                           fit               = False,
+                           inverse_transform = False
+                       )
+            exog_values, _ = preprocess_exog(exog=exog)
+            if exog_values.ndim == 1:
+                exog_values = exog_values.reshape(-1, 1)
+            if exog_values.dtype.kind in 'biuf':
+                exog_values = exog_values.astype(self.dtype, copy=False)
+        else:
+            exog_values = np.empty(shape=(len(series), 0))
+
+        # Predictors of the new observations are created from the previous
+        # window followed by the new values, with the same layout as in
+        # `create_train_X_y`: one block of rows per series.
+        n_lags = len(self.lags)
+        n_exog = exog_values.shape[1]
+        n_rows_serie = len(series)
+        X_new = np.zeros(
+                    shape = (len(self.series_col_names) * n_rows_serie,
+                             len(self.X_train_col_names)),
+                    dtype = np.result_type(self.dtype, exog_values.dtype)
+                )
+        y_new = []
+        windows = pd.concat([self.last_window, series])
+
+        for i, serie in enumerate(self.series_col_names):
+            window = transform_series(
+                         series            = windows[serie],
+                         transformer       = self.transformer_series_[serie],
+                         fit               = False,
+                         inverse_transform = False
+                     )
+            X_new_values, y_new_values = self._create_lags(y=window.to_numpy())
+
+            rows = slice(i * n_rows_serie, (i + 1) * n_rows_serie)
+            X_new[rows, :n_lags] = X_new_values
+            X_new[rows, n_lags:n_lags + n_exog] = exog_values
+            if self.encoding == 'onehot':
+                X_new[rows, n_lags + n_exog + i] = 1.
+            else:
+                X_new[rows, n_lags + n_exog] = i
+            y_new.append(y_new_values)
+
+        X_new = pd.DataFrame(
+                    data    = X_new,
+                    columns = self.X_train_col_names
+                )
+        y_new = np.concatenate(y_new)
+
+        if update_residuals:
+            residuals = y_new - self.regressor.predict(X_new)
+            for i, serie in enumerate(self.series_col_names):
+                residuals_serie = residuals[i * n_rows_serie:(i + 1) * n_rows_serie]
+                residuals_stored = self.in_sample_residuals[serie]
+                # `np.array([None])` is stored when fitted with `store_in_sample_residuals=False`.
+                if not isinstance(residuals_stored, ResidualStore) and (residuals_stored == None).any():
+                    residuals_stored = ResidualStore(
+                                           capacity     = self.residuals_capacity,
+                                           random_state = 123
+                                       )
+                self.in_sample_residuals[serie] = to_residual_store(
+                                                      residuals = residuals_stored,
+                                                      capacity  = self.residuals_capacity
+                                                  )
+                self.in_sample_residuals[serie].append(residuals_serie)
+
+        if partial_fit:
+            sample_weight = self.create_sample_weights(
+                                series        = series,
+                                X_train       = X_new,
+                                y_train_index = pd.Index(
+                                                    np.tile(series.index.values, 
+                                                            reps = len(self.series_col_names))
+                                                ),
+                            )
+            if sample_weight is not None:
+                self.regressor.partial_fit(X=X_new, y=y_new, sample_weight=sample_weight)
+            else:
+                self.regressor.partial_fit(X=X_new, y=y_new)
+            self.training_range = pd.Index([self.training_range[0], updated_last_window.index[-1]])
+            self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
+
+        self.last_window = updated_last_window
+
+
     def _recursive_predict(
         self,
         steps: int,
@@ -749,28 +1049,89 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         
         """
         
-        predictions = np.full(shape=steps, fill_value=np.nan)
+        predictions = self._recursive_predict_levels(
+                          steps       = steps,
+                          levels      = [level],
+                          last_window = last_window.reshape(-1, 1),
+                          exog        = exog
+                      ).ravel()
 
-        for i in range(steps):
-            X = last_window[-self.lags].reshape(1, -1)
-            if exog is not None:
-                X = np.column_stack((X, exog[i, ].reshape(1, -1)))
+        return predictions
+
+
+    def _recursive_predict_levels(
+        self,
+        steps: int,
+        levels: list,
+        last_window: np.ndarray,
+        exog: Optional[np.ndarray]=None
+    ) -> np.ndarray:
+        """
+        Predict n steps ahead for several levels at once. All levels advance in
+        lockstep, the predictors of all levels are stacked in one matrix so the
+        regressor is called only once per step.
+        
+        Parameters
+        ----------
+        steps : int
+            Number of future steps predicted.
             
-            levels_dummies = np.zeros(shape=(1, len(self.series_col_names)), dtype=float)
-            levels_dummies[0][self.series_col_names.index(level)] = 1.
+        levels : list
+            Time series to be predicted.
+        
+        last_window : 2d numpy ndarray, shape (window_size, len(levels))
+            Values of the series used to create the predictors (lags) need in the 
+            first iteration of prediction (t + 1). One column per level.
+            
+        exog : numpy ndarray, default `None`
+            Exogenous variable/s included as predictor/s. The same for all levels.
 
-            X = np.column_stack((X, levels_dummies.reshape(1, -1)))
+        Returns 
+        -------
+        predictions : 2d numpy ndarray, shape (steps, len(levels))
+            Predicted values, one column per level.
+        
+        """
+        
+        n_levels = len(levels)
+        n_lags = len(self.lags)
+        if exog is not None and exog.ndim == 1:
+            exog = exog.reshape(-1, 1)
+        n_exog = exog.shape[1] if exog is not None else 0
+
+        # Predictions are written after the initial window in a preallocated
+        # array (one row per level), so the lags of each step are read without
+        # shifting the windows. The predictors of each step are written in the
+        # same reused matrix, level encoding does not change between steps so
+        # it is only written once.
+        windows = np.full(
+                      shape      = (n_levels, self.window_size + steps),
+                      fill_value = np.nan,
+                      dtype      = float
+                  )
+        windows[:, :self.window_size] = last_window[-self.window_size:, ].T
+        idx_levels = np.array([self.series_col_names.index(level) for level in levels])
+        if self.encoding == 'onehot':
+            X = np.zeros(shape=(n_levels, n_lags + n_exog + len(self.series_col_names)), dtype=float)
+            X[np.arange(n_levels), n_lags + n_exog + idx_levels] = 1.
+        else:
+            X = np.zeros(shape=(n_levels, n_lags + n_exog + 1), dtype=float)
+            X[:, n_lags + n_exog] = idx_levels
+
+        for i in range(steps):
+            X[:, :n_lags] = windows[:, self.window_size + i - self.lags]
+            if exog is not None:
+                X[:, n_lags:n_lags + n_exog] = exog[i, ]
 
             with warnings.catch_warnings():
                 # Suppress scikit-learn warning: "X does not have valid feature names,
                 # but NoOpTransformer was fitted with feature names".
                 warnings.simplefilter("ignore")
-                prediction = self.regressor.predict(X)
-                predictions[i] = prediction.ravel()[0]
+                with timed_phase('regressor.predict'):
+                    prediction = self.regressor.predict(X)
+                    windows[:, self.window_size + i] = prediction.ravel()
 
-            # Update `last_window` values. The first position is discarded and 
-            # the new prediction is added at the end.
-            last_window = np.append(last_window[1:], prediction)
+        predictions = windows[:, self.window_size:].T
 
         return predictions
 
@@ -861,46 +1222,151 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         else:
             exog_values = None
 
-        predictions = []
-
-        for level in levels:
-
-            last_window_level = transform_series(
-                                    series            = last_window[level],
-                                    transformer       = self.transformer_series_[level],
-                                    fit               = False,
-                                    inverse_transform = False
-                                )
-            last_window_values, last_window_index = preprocess_last_window(
-                                                        last_window = last_window_level
-                                                    )
-                
-            preds_level = self._recursive_predict(
+        last_window = last_window[levels]
+        last_window_values, last_window_index = preprocess_last_window(
+                                                    last_window = last_window
+                                                )
+        last_window_values = last_window_values.astype(float)
+        for i, level in enumerate(levels):
+            if self.transformer_series_[level] is not None:
+                last_window_values[:, i] = transform_series(
+                                               series            = last_window[level],
+                                               transformer       = self.transformer_series_[level],
+                                               fit               = False,
+                                               inverse_transform = False
+                                           ).to_numpy()
+
+        # All levels are predicted at once, one regressor call per step.
+        with timed_phase('_recursive_predict') as phase:
+            predictions = self._recursive_predict_levels(
                               steps       = steps,
-                              level       = level,
-                              last_window = copy(last_window_values),
+                              levels      = levels,
+                              last_window = last_window_values,
                               exog        = copy(exog_values)
                           )
+            phase.add_array(predictions)
 
-            preds_level = pd.Series(
-                              data  = preds_level,
-                              index = expand_index(
-                                          index = last_window_index,
-                                          steps = steps
-                                      ),
-                              name = level
-                          )
+        predictions = pd.DataFrame(
+                          data    = predictions,
+                          index   = expand_index(
+                                        index = last_window_index,
+                                        steps = steps
+                                    ),
+                          columns = levels
+                      )
 
-            preds_level = transform_series(
-                              series            = preds_level,
-                              transformer       = self.transformer_series_[level],
-                              fit               = False,
-                              inverse_transform = True
-                          )
+        for level in levels:
+            if self.transformer_series_[level] is not None:
+                predictions[level] = transform_series(
+                                         series            = predictions[level],
+                                         transformer       = self.transformer_series_[level],
+                                         fit               = False,
+                                         inverse_transform = True
+                                     )
 
-            predictions.append(preds_level)    
+        return predictions
 
-        predictions = pd.concat(predictions, axis=1)
+
+    def predict_numpy(
+        self,
+        steps: int,
+        levels: Optional[Union[str, list]]=None,
+        last_window: Optional[np.ndarray]=None,
+        exog: Optional[np.ndarray]=None
+    ) -> np.ndarray:
+        """
+        Predict n steps ahead from numpy arrays. Same predictions as `predict`
+        without its input validation, index handling and pandas objects: inputs
+        are only checked against the shapes learned in `fit`. Meant for serving
+        predictions with low latency.
+
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------
+        steps : int
+            Number of future steps predicted.
+
+        levels : str, list, default `None`
+            Time series to be predicted. If `None` all levels will be predicted.
+
+        last_window : numpy ndarray, default `None`
+            2d array with the values of the series used to create the predictors
+            (lags) needed in the first iteration of prediction (t + 1), at least
+            `window_size` rows and one column per level, in the same order as
+            `levels`. If `None`, the values stored in `self.last_window` are used.
+            
+        exog : numpy ndarray, default `None`
+            Values of the exogenous variable/s, one row per step and the columns
+            in the same order as `exog_col_names`.
+
+        Returns 
+        -------
+        predictions : numpy ndarray, shape (steps, len(levels))
+            Predicted values, one column for each level.
+            
+        """
+
+        if not self.fitted:
+            raise sklearn.exceptions.NotFittedError(
+                ('This Forecaster instance is not fitted yet. Call `fit` with '
+                 'appropriate arguments before using predict.')
+            )
+
+        if levels is None:
+            levels = self.series_col_names
+        elif isinstance(levels, str):
+            levels = [levels]
+
+        if last_window is None:
+            last_window = self.last_window[levels].to_numpy()
+        elif last_window.ndim != 2 or last_window.shape[0] < self.window_size \
+             or last_window.shape[1] != len(levels):
+            raise ValueError(
+                (f'`last_window` must be a 2d numpy ndarray with at least '
+                 f'{self.window_size} rows and one column per level ({len(levels)}). '
+                 f'Got shape {last_window.shape}.')
+            )
+        last_window = last_window[-self.window_size:].astype(float)
+        for i, level in enumerate(levels):
+            last_window[:, i] = transform_numpy(
+                                    array             = last_window[:, i],
+                                    transformer       = self.transformer_series_[level],
+                                    inverse_transform = False
+                                )
+
+        if (exog is None) == self.included_exog:
+            raise ValueError(
+                ('`exog` must be provided if, and only if, the forecaster was '
+                 'trained with exogenous variable/s.')
+            )
+        if exog is not None:
+            exog = np.asarray(exog)
+            if len(exog) < steps or (exog.shape[1] if exog.ndim == 2 else 1) != len(self.exog_col_names):
+                raise ValueError(
+                    (f'`exog` must be a numpy ndarray with at least {steps} rows and '
+                     f'{len(self.exog_col_names)} columns, in the same order as '
+                     f'{self.exog_col_names}. Got shape {exog.shape}.')
+                )
+            exog = transform_exog_numpy(
+                       exog           = exog[:steps],
+                       exog_col_names = self.exog_col_names,
+                       transformer    = self.transformer_exog
+                   )
+
+        predictions = self._recursive_predict_levels(
+                          steps       = steps,
+                          levels      = levels,
+                          last_window = last_window,
+                          exog        = exog
+                      )
+
+        for i, level in enumerate(levels):
+            predictions[:, i] = transform_numpy(
+                                    array             = predictions[:, i],
+                                    transformer       = self.transformer_series_[level],
+                                    inverse_transform = True
+                                )
 
         return predictions
 
@@ -975,7 +1441,12 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
             levels = [levels]
 
         for level in levels:
-            if in_sample_residuals and (self.in_sample_residuals[level] == None).any():
+            residuals_level = self.in_sample_residuals[level]
+            if (
+                in_sample_residuals
+                and not isinstance(residuals_level, ResidualStore)
+                and (residuals_level == None).any()
+            ):
                 raise ValueError(
                     (f"`forecaster.in_sample_residuals['{level}']` contains `None` values. "
                       "Try using `fit` method with `in_sample_residuals=True` or set in "
@@ -1069,6 +1540,11 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                 residuals = self.in_sample_residuals[level]
             else:
                 residuals = self.out_sample_residuals[level]
+            # Residuals assigned directly to the attribute are stored first.
+            residuals = to_residual_store(
+                            residuals = residuals,
+                            capacity  = self.residuals_capacity
+                        )
 
             for i in range(n_boot):
                 # In each bootstraping iteration the initial last_window and exog 
@@ -1076,12 +1552,7 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                 last_window_boot = last_window_values.copy()
                 exog_boot = exog_values.copy() if exog is not None else None
 
-                rng = np.random.default_rng(seed=seeds[i])
-                sample_residuals = rng.choice(
-                                       a       = residuals,
-                                       size    = steps,
-                                       replace = True
-                                   )
+                sample_residuals = residuals.sample(size=steps, random_state=seeds[i])
 
                 for step in range(steps):
 
@@ -1108,14 +1579,11 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                                          columns = [f"pred_boot_{i}" for i in range(n_boot)]
                                      )
 
-            if self.transformer_series_[level]:
-                for col in level_boot_predictions.columns:
-                    level_boot_predictions[col] = transform_series(
-                                                      series            = level_boot_predictions[col],
-                                                      transformer       = self.transformer_series_[level],
-                                                      fit               = False,
-                                                      inverse_transform = True
-                                                  )
+            level_boot_predictions = transform_bootstrapping_matrix(
+                                         boot_predictions  = level_boot_predictions,
+                                         transformer       = self.transformer_series_[level],
+                                         inverse_transform = True
+                                     )
             
             boot_predictions[level] = level_boot_predictions
         
@@ -1242,7 +1710,9 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
         n_boot: int=500,
         random_state: int=123,
-        in_sample_residuals: bool=True
+        in_sample_residuals: bool=True,
+        fit_method: str='mle',
+        n_jobs: int=1
     ) -> pd.DataFrame:
         """
         Fit a given probability distribution for each step. After generating 
@@ -1287,6 +1757,17 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
             calculated and stored the residuals within the forecaster (see
             `set_out_sample_residuals()`).
 
+        fit_method : str, default `'mle'`
+            Method used to estimate the parameters of the distribution, `'mle'`
+            (maximum likelihood) or `'moments'` (method of moments, available for 
+            `norm`, `lognorm` and `gamma`). See `skforecast.utils.fit_distribution`.
+            **New in version 0.7.0**
+
+        n_jobs : int, default `1`
+            Number of jobs used to fit by maximum likelihood the distributions
+            with no vectorized estimator. If `-1`, all processors are used.
+            **New in version 0.7.0**
+
         Returns 
         -------
         predictions : pandas DataFrame
@@ -1310,14 +1791,21 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                        )
 
         param_names = [p for p in inspect.signature(distribution._pdf).parameters if not p=='x'] + ["loc","scale"]
+        # The steps of all levels are fitted with a single call.
+        param_values = fit_distribution(
+                           boot_samples = np.vstack([boot_samples[level] for level in levels]),
+                           distribution = distribution,
+                           method       = fit_method,
+                           n_jobs       = n_jobs
+                       )
+        param_values = np.split(param_values, len(levels))
         predictions = []
 
-        for level in levels:
-            param_values = np.apply_along_axis(lambda x: distribution.fit(x), axis=1, arr=boot_samples[level])
+        for level, level_param_values in zip(levels, param_values):
             level_param_names = [f'{level}_{p}' for p in param_names]
 
             pred_level = pd.DataFrame(
-                             data    = param_values,
+                             data    = level_param_values,
                              columns = level_param_names,
                              index   = boot_samples[level].index
                          )
@@ -1393,14 +1881,16 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
         Parameters
         ----------
         residuals : pandas DataFrame
-            Values of residuals. If len(residuals) > 1000, only a random sample
-            of 1000 values are stored. Columns must be the same as `levels`.
+            Values of residuals. If len(residuals) > `residuals_capacity`, only
+            a random sample of `residuals_capacity` values are stored. Columns
+            must be the same as `levels`.
             
         append : bool, default `True`
             If `True`, new residuals are added to the once already stored in the
-            attribute `out_sample_residuals`. Once the limit of 1000 values is
-            reached, no more values are appended. If False, `out_sample_residuals`
-            is overwritten with the new residuals.
+            attribute `out_sample_residuals`. Once the limit of `residuals_capacity`
+            values of a level is reached, new residuals replace stored ones with
+            reservoir sampling. If False, `out_sample_residuals` is overwritten
+            with the new residuals.
 
         transform : bool, default `True`
             If `True`, new residuals are transformed using self.transformer_series.
@@ -1457,10 +1947,6 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                                           inverse_transform = False
                                       )
 
-                if len(residuals_level) > 1000:
-                    rng = np.random.default_rng(seed=random_state)
-                    residuals_level = rng.choice(a=residuals_level, size=1000, replace=False)
-        
                 if append and self.out_sample_residuals is not None:
 
                     if not level in self.out_sample_residuals.keys():
@@ -1468,19 +1954,18 @@ class ForecasterAutoregMultiSeries(ForecasterBase):
                             f'{level} does not exists in `forecaster.out_sample_residuals` keys: {list(self.out_sample_residuals.keys())}'
                         )
 
-                    free_space = max(0, 1000 - len(self.out_sample_residuals[level]))
-                    if len(residuals_level) < free_space:
-                        residuals_level = np.hstack((
-                                              self.out_sample_residuals[level],
-                                              residuals_level
-                                          ))
-                    else:
-                        residuals_level = np.hstack((
-                                              self.out_sample_residuals[level],
-                                              residuals_level[:free_space]
-                                          ))
-
-                out_sample_residuals[level] = np.array(residuals_level)
+                    out_sample_residuals[level] = to_residual_store(
+                                                      residuals    = self.out_sample_residuals[level],
+                                                      capacity     = self.residuals_capacity,
+                                                      random_state = random_state
+                                                  )
+                else:
+                    out_sample_residuals[level] = ResidualStore(
+                                                      capacity     = self.residuals_capacity,
+                                                      random_state = random_state
+                                                  )
+
+                out_sample_residuals[level].append(residuals_level)
 
         self.out_sample_residuals = out_sample_residuals
 
@@ -54,4 +54,20 @@ def test_create_lags_output_interspersed_lags():
                np.array([7., 8., 9.]))
 
     assert (results[0] == expected[0]).all()
-    assert (results[1] == expected[1]).all()
\ No newline at end of file
+    assert (results[1] == expected[1]).all()
+
+def test_create_lags_output_when_dtype_is_float32():
+    """
+    Test matrix of lags is created with dtype float32 when the forecaster is
+    created with `dtype=np.float32`.
+    """
+    forecaster = ForecasterAutoregMultiSeries(LinearRegression(), lags=[1, 3],
+                                              dtype=np.float32)
+    X_data, y_data = forecaster._create_lags(y=np.arange(6, dtype=float))
+    expected = np.array([[2., 0.],
+                         [3., 1.],
+                         [4., 2.]], dtype=np.float32)
+
+    assert X_data.dtype == np.float32
+    np.testing.assert_array_equal(X_data, expected)
+    np.testing.assert_array_equal(y_data, np.array([3., 4., 5.]))
@@ -272,4 +272,38 @@ def test_create_train_X_y_output_when_series_and_exog_is_dataframe_datetime_inde
         elif isinstance(expected[i], pd.Series):
             pd.testing.assert_series_equal(results[i], expected[i])
         else:
-            assert (results[i] == expected[i]).all()
\ No newline at end of file
+            assert (results[i] == expected[i]).all()
+
+def test_create_train_X_y_output_when_encoding_is_ordinal_and_series_not_sorted():
+    """
+    Test the output of create_train_X_y when `encoding='ordinal'` and the
+    columns of series are not in alphabetical order. The level column is the
+    position of each series in `series`.
+    """
+    forecaster = ForecasterAutoregMultiSeries(LinearRegression(), lags=2,
+                                              encoding='ordinal')
+    series = pd.DataFrame({'b': pd.Series(np.arange(4, dtype=float)), 
+                           'a': pd.Series(np.arange(10, 14, dtype=float))
+                          })
+
+    results = forecaster.create_train_X_y(
+                  series = series,
+                  exog   = pd.Series(np.arange(100, 104), name='exog')
+              )
+    expected = (pd.DataFrame(
+                    data = np.array([[1., 0., 102., 0.],
+                                     [2., 1., 103., 0.],
+                                     [11., 10., 102., 1.],
+                                     [12., 11., 103., 1.]]),
+                    index   = np.array([0, 1, 2, 3]),
+                    columns = ['lag_1', 'lag_2', 'exog', '_level_skforecast']
+                ),
+                pd.Series(
+                    data  = np.array([2., 3., 12., 13.]),
+                    index = np.array([0, 1, 2, 3]),
+                    name  = 'y'
+                )
+               )
+
+    pd.testing.assert_frame_equal(results[0], expected[0])
+    pd.testing.assert_series_equal(results[1], expected[1])
@@ -234,4 +234,51 @@ def test_fit_last_window_stored():
                             })
     expected.index = pd.RangeIndex(start=2, stop=5, step=1)
 
-    pd.testing.assert_frame_equal(forecaster.last_window, expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(forecaster.last_window, expected)
+
+def test_fit_memmap_dir_same_results_as_in_memory(tmp_path):
+    """
+    Test that training with `memmap_dir` creates memory-mapped training matrices
+    and sample weights and gives the same coefficients, residuals and predictions
+    as training in memory. No files are left in `memmap_dir`.
+    """
+    series = pd.DataFrame({'1': pd.Series(np.arange(20, dtype=float)**1.5), 
+                           '2': pd.Series(np.sin(np.arange(20)))
+                          })
+    exog = pd.Series(np.cos(np.arange(20)), name='exog')
+
+    forecaster = ForecasterAutoregMultiSeries(
+                     regressor      = LinearRegression(), 
+                     lags           = 3,
+                     series_weights = {'1': 2., '2': 1.}
+                 )
+    forecaster.fit(series=series, exog=exog)
+    forecaster_memmap = ForecasterAutoregMultiSeries(
+                            regressor      = LinearRegression(), 
+                            lags           = 3,
+                            series_weights = {'1': 2., '2': 1.},
+                            memmap_dir     = str(tmp_path)
+                        )
+    forecaster_memmap.fit(series=series, exog=exog)
+
+    X_train, y_train, _, y_train_index = forecaster_memmap.create_train_X_y(series=series, exog=exog)
+    sample_weight = forecaster_memmap.create_sample_weights(
+                        series        = series,
+                        X_train       = X_train,
+                        y_train_index = y_train_index
+                    )
+
+    assert isinstance(y_train.values, np.memmap)
+    assert isinstance(sample_weight, np.memmap)
+    np.testing.assert_array_almost_equal(forecaster_memmap.regressor.coef_, forecaster.regressor.coef_)
+    for serie in ['1', '2']:
+        np.testing.assert_array_almost_equal(
+            forecaster_memmap.in_sample_residuals[serie], forecaster.in_sample_residuals[serie]
+        )
+    pd.testing.assert_frame_equal(
+        forecaster_memmap.predict(steps=3, exog=exog.iloc[:3].set_axis(pd.RangeIndex(20, 23))),
+        forecaster.predict(steps=3, exog=exog.iloc[:3].set_axis(pd.RangeIndex(20, 23)))
+    )
+
+    del X_train, y_train, sample_weight
+    assert list(tmp_path.iterdir()) == []
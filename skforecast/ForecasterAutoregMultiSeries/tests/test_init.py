@@ -10,3 +10,13 @@ from sklearn.linear_model import LinearRegression
 from sklearn.neighbors import KNeighborsRegressor
 
 
+
+def test_init_exception_when_encoding_is_not_valid():
+    """
+    Test exception is raised when `encoding` is not 'onehot' or 'ordinal'.
+    """
+    err_msg = re.escape(
+                "Argument `encoding` must be one of 'onehot' or 'ordinal'. Got dummies."
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        ForecasterAutoregMultiSeries(LinearRegression(), lags=3, encoding='dummies')
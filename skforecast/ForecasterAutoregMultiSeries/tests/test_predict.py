@@ -209,4 +209,26 @@ def test_predict_output_when_regressor_is_LinearRegression_with_transform_series
                    columns = ['1']
                )
     
-    pd.testing.assert_frame_equal(predictions, expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(predictions, expected)
+
+@pytest.mark.parametrize("encoding", ['onehot', 'ordinal'])
+def test_predict_output_when_series_columns_not_sorted(encoding):
+    """
+    Test predict output when the columns of series are not in alphabetical
+    order. Each level is predicted with its own level encoding.
+    """
+    series_unsorted = pd.DataFrame({'b': pd.Series(np.arange(start=50, stop=100)),
+                                    'a': pd.Series(np.arange(start=0, stop=50))})
+    forecaster = ForecasterAutoregMultiSeries(LinearRegression(), lags=5,
+                                              encoding=encoding)
+    forecaster.fit(series=series_unsorted)
+    predictions = forecaster.predict(steps=3)
+    expected = pd.DataFrame(
+                   data    = np.array([[100., 50.],
+                                       [101., 51.],
+                                       [102., 52.]]),
+                   index   = pd.RangeIndex(start=50, stop=53, step=1),
+                   columns = ['b', 'a']
+               )
+
+    pd.testing.assert_frame_equal(predictions, expected)
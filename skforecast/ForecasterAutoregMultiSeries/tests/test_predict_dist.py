@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 from skforecast.ForecasterAutoregMultiSeries import ForecasterAutoregMultiSeries
 from scipy.stats import norm
+from scipy.stats import gamma
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import StandardScaler
 from sklearn.preprocessing import OneHotEncoder
@@ -91,4 +92,42 @@ def test_predict_dist_output_when_forecaster_is_LinearRegression_steps_is_2_in_s
                    index   = pd.RangeIndex(start=50, stop=52)
                )
 
-    pd.testing.assert_frame_equal(results, expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(results, expected)
+
+
+def test_predict_dist_output_when_fit_method_moments_equal_to_fit_each_level():
+    """
+    Test output of predict_dist with gamma distribution and fit_method 'moments'
+    is the same when all levels are predicted at once and when each level is
+    predicted alone.
+    """
+    forecaster = ForecasterAutoregMultiSeries(
+                     regressor          = LinearRegression(),
+                     lags               = 3,
+                     transformer_series = StandardScaler(),
+                     transformer_exog   = transformer_exog,
+                 )
+    forecaster.fit(series=series, exog=exog)
+    results = forecaster.predict_dist(
+                  steps        = 3,
+                  distribution = gamma,
+                  levels       = ['1', '2'],
+                  exog         = exog_predict,
+                  n_boot       = 50,
+                  fit_method   = 'moments'
+              )
+    expected = pd.concat(
+                   [forecaster.predict_dist(
+                        steps        = 3,
+                        distribution = gamma,
+                        levels       = level,
+                        exog         = exog_predict,
+                        n_boot       = 50,
+                        fit_method   = 'moments'
+                    )
+                    for level in ['1', '2']],
+                   axis = 1
+               )
+
+    assert results.columns.tolist() == ['1_a', '1_loc', '1_scale', '2_a', '2_loc', '2_scale']
+    pd.testing.assert_frame_equal(results, expected)
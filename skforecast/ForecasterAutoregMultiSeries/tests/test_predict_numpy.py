@@ -0,0 +1,59 @@
+# Unit test predict_numpy ForecasterAutoregMultiSeries
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+from skforecast.ForecasterAutoregMultiSeries import ForecasterAutoregMultiSeries
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import OneHotEncoder
+from sklearn.preprocessing import StandardScaler
+
+# Fixtures
+from .fixtures_ForecasterAutoregMultiSeries import series
+from .fixtures_ForecasterAutoregMultiSeries import exog
+from .fixtures_ForecasterAutoregMultiSeries import exog_predict
+
+transformer_exog = ColumnTransformer(
+                       [('scale', StandardScaler(), ['col_1']),
+                        ('onehot', OneHotEncoder(), ['col_2'])],
+                       remainder = 'passthrough',
+                       verbose_feature_names_out = False
+                   )
+
+
+def test_predict_numpy_exception_when_last_window_has_wrong_shape():
+    """
+    Test ValueError is raised when last_window does not have one column per level.
+    """
+    forecaster = ForecasterAutoregMultiSeries(LinearRegression(), lags=3)
+    forecaster.fit(series=series)
+
+    err_msg = re.escape(
+                ('`last_window` must be a 2d numpy ndarray with at least '
+                 '3 rows and one column per level (2). Got shape (5, 1).')
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.predict_numpy(steps=1, last_window=np.ones(shape=(5, 1)))
+
+
+@pytest.mark.parametrize("levels", 
+                         [None, ['2'], ['2', '1']], 
+                         ids = lambda levels : f'levels: {levels}')
+def test_predict_numpy_output_equal_to_predict_exog_and_transformer(levels):
+    """
+    Test predict_numpy returns the same values as predict when exog and
+    transformers are included.
+    """
+    forecaster = ForecasterAutoregMultiSeries(
+                     regressor          = LinearRegression(),
+                     lags               = 5,
+                     transformer_series = StandardScaler(),
+                     transformer_exog   = transformer_exog
+                 )
+    forecaster.fit(series=series, exog=exog)
+
+    expected = forecaster.predict(steps=5, levels=levels, exog=exog_predict).to_numpy()
+    results = forecaster.predict_numpy(steps=5, levels=levels, exog=exog_predict.to_numpy())
+
+    np.testing.assert_array_almost_equal(results, expected)
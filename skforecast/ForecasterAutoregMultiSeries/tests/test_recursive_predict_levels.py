@@ -0,0 +1,47 @@
+# Unit test _recursive_predict_levels ForecasterAutoregMultiSeries
+# ==============================================================================
+import numpy as np
+import pandas as pd
+from skforecast.ForecasterAutoregMultiSeries import ForecasterAutoregMultiSeries
+from sklearn.linear_model import LinearRegression
+
+
+def test_recursive_predict_levels_output_equal_to_recursive_predict_of_each_level():
+    """
+    Test _recursive_predict_levels output is equal to calling _recursive_predict
+    for each level, and the regressor is called once per step.
+    """
+    rng = np.random.default_rng(123)
+    series = pd.DataFrame({'1': rng.normal(size=50), 
+                           '2': rng.normal(size=50),
+                           '3': rng.normal(size=50)})
+    exog = pd.Series(rng.normal(size=55), name='exog')
+
+    forecaster = ForecasterAutoregMultiSeries(LinearRegression(), lags=3)
+    forecaster.fit(series=series, exog=exog.iloc[:50])
+    levels = ['3', '1']
+    last_window = forecaster.last_window[levels].to_numpy()
+    exog_predict = exog.iloc[50:].to_numpy()
+
+    n_calls = []
+    predict = forecaster.regressor.predict
+    forecaster.regressor.predict = lambda X: n_calls.append(len(X)) or predict(X)
+    results = forecaster._recursive_predict_levels(
+                  steps       = 4,
+                  levels      = levels,
+                  last_window = last_window,
+                  exog        = exog_predict
+              )
+    forecaster.regressor.predict = predict
+    expected = np.column_stack([
+                   forecaster._recursive_predict(
+                       steps       = 4,
+                       level       = level,
+                       last_window = last_window[:, i],
+                       exog        = exog_predict
+                   )
+                   for i, level in enumerate(levels)
+               ])
+
+    assert n_calls == [2, 2, 2, 2]
+    np.testing.assert_array_almost_equal(results, expected)
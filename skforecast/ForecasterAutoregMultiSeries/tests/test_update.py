@@ -0,0 +1,79 @@
+# Unit test update ForecasterAutoregMultiSeries
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from skforecast.ForecasterAutoregMultiSeries import ForecasterAutoregMultiSeries
+from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+
+# Fixtures
+from .fixtures_ForecasterAutoregMultiSeries import series
+from .fixtures_ForecasterAutoregMultiSeries import exog
+
+
+def test_update_exception_when_series_has_different_columns():
+    """
+    Test ValueError is raised when series does not have the columns used in fit.
+    """
+    forecaster = ForecasterAutoregMultiSeries(LinearRegression(), lags=3)
+    forecaster.fit(series=series[:40])
+
+    err_msg = re.escape(
+                ("`series` must have the same columns as the series used in `fit`.\n"
+                 "    `series` columns : ['1'].\n"
+                 "    Expected columns : ['1', '2'].")
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.update(series=series[40:][['1']])
+
+
+@pytest.mark.parametrize("encoding", 
+                         ['onehot', 'ordinal'], 
+                         ids = lambda enc : f'encoding: {enc}')
+def test_update_predict_equal_to_predict_with_last_window_exog_and_transformer(encoding):
+    """
+    Test predictions after update are the same as predictions using the whole
+    series as last_window, and new residuals are the one step ahead errors of
+    the new observations.
+    """
+    forecaster = ForecasterAutoregMultiSeries(
+                     regressor          = LinearRegression(),
+                     lags               = 3,
+                     transformer_series = StandardScaler(),
+                     encoding           = encoding
+                 )
+    forecaster.fit(series=series[:40], exog=exog['col_1'][:40])
+    expected = forecaster.predict(steps=5, last_window=series[:45], exog=exog['col_1'][45:])
+    expected_residuals = [
+        (series['2'].iloc[i] - forecaster.predict(steps=1, levels='2', last_window=series[:i], exog=exog['col_1'][i:]).iloc[0, 0])
+        / forecaster.transformer_series_['2'].scale_[0]
+        for i in range(40, 45)
+    ]
+
+    forecaster.update(series=series[40:45][['2', '1']], exog=exog['col_1'][40:45])
+    results = forecaster.predict(steps=5, exog=exog['col_1'][45:])
+
+    pd.testing.assert_frame_equal(results, expected)
+    pd.testing.assert_frame_equal(forecaster.last_window, series[42:45])
+    assert len(forecaster.in_sample_residuals['2']) == 37 + 5
+    np.testing.assert_array_almost_equal(
+        forecaster.in_sample_residuals['2'].values[-5:], expected_residuals
+    )
+
+
+def test_update_partial_fit_when_in_sample_residuals_not_stored():
+    """
+    Test partial_fit=True updates the regressor and in_sample_residuals only
+    contain the new residuals when they were not stored in fit.
+    """
+    forecaster = ForecasterAutoregMultiSeries(SGDRegressor(random_state=123), lags=3)
+    forecaster.fit(series=series[:40], store_in_sample_residuals=False)
+    coef = forecaster.regressor.coef_.copy()
+    forecaster.update(series=series[40:], partial_fit=True)
+
+    assert (forecaster.regressor.coef_ != coef).any()
+    assert forecaster.training_range.to_list() == [0, 49]
+    assert len(forecaster.in_sample_residuals['1']) == 10
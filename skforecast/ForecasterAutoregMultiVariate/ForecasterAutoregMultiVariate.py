@@ -17,6 +17,7 @@ import sklearn.pipeline
 from sklearn.base import clone
 from copy import deepcopy
 from itertools import chain
+from joblib import Parallel, delayed
 
 import skforecast
 from ..ForecasterBase import ForecasterBase
@@ -28,10 +29,12 @@ from ..utils import preprocess_y
 from ..utils import preprocess_last_window
 from ..utils import preprocess_exog
 from ..utils import exog_to_direct
+from ..utils import DirectTrainMatrix
 from ..utils import expand_index
 from ..utils import check_predict_input
 from ..utils import transform_series
 from ..utils import transform_dataframe
+from ..utils import timed_phase
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -84,6 +87,18 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
         Ignored if `regressor` does not have the argument `sample_weight` in its
         `fit` method. The resulting `sample_weight` cannot have negative values.
 
+    dtype : numpy dtype, default `numpy.float64`
+        Data type of the training matrices (lags and numeric exogenous variables)
+        created in `create_train_X_y` and used in `fit`. Use `numpy.float32` to
+        halve the memory needed by regressors that support it.
+        **New in version 0.7.0**
+
+    n_jobs : int, default `1`
+        The number of jobs to run in parallel to fit the regressor of each step
+        (joblib). If `-1`, all processors are used. Use the joblib context manager
+        `parallel_backend` to choose between processes (default) and threads.
+        **New in version 0.7.0**
+
     Attributes
     ----------
     regressor : regressor or pipeline compatible with the scikit-learn API
@@ -137,6 +152,14 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
     source_code_weight_func : str
         Source code of the custom function used to create weights.
 
+    dtype : numpy dtype
+        Data type of the training matrices.
+        **New in version 0.7.0**
+
+    n_jobs : int
+        The number of jobs to run in parallel to fit the regressor of each step.
+        **New in version 0.7.0**
+
     max_lag : int
         Maximum value of lag included in `lags`.
         
@@ -198,7 +221,9 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
         lags: Union[int, np.ndarray, list, dict],
         transformer_series: Optional[Union[object, dict]]=None,
         transformer_exog: Optional[object]=None,
-        weight_func: Optional[callable]=None
+        weight_func: Optional[callable]=None,
+        dtype: type=np.float64,
+        n_jobs: int=1
     ) -> None:
         
         self.regressor               = regressor
@@ -209,6 +234,8 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
         self.transformer_exog        = transformer_exog
         self.weight_func             = weight_func
         self.source_code_weight_func = None
+        self.dtype                   = dtype
+        self.n_jobs                  = n_jobs
         self.max_lag                 = None
         self.window_size             = None
         self.last_window             = None
@@ -318,6 +345,9 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
         
         Notice that, the returned matrix X_data, contains the lag 1 in the first
         column, the lag 2 in the second column and so on.
+
+        Lags are gathered from a strided view of `y` (no intermediate copies)
+        and `X_data` is created with the forecaster's `dtype`.
         
         Parameters
         ----------
@@ -344,13 +374,16 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
                 f'of the series minus the number of steps ({len(y)-(self.steps-1)}).'
             )
         
-        X_data = np.full(shape=(n_splits, len(lags)), fill_value=np.nan, dtype=float)
-        for i, lag in enumerate(lags):
-            X_data[:, i] = y[self.max_lag - lag : -(lag + self.steps - 1)] 
+        # Row i of `windows` is y[i:i + max_lag], lag `l` is its column `max_lag - l`.
+        windows = np.lib.stride_tricks.sliding_window_view(
+                      y[:-self.steps].astype(self.dtype, copy=False), self.max_lag
+                  )
+        X_data = windows[:, self.max_lag - lags]
 
-        y_data = np.full(shape=(n_splits, self.steps), fill_value=np.nan, dtype=float)
-        for step in range(self.steps):
-            y_data[:, step] = y[self.max_lag + step : self.max_lag + step + n_splits]
+        # Row i of `y_data` is y[i + max_lag:i + max_lag + steps].
+        y_data = np.lib.stride_tricks.sliding_window_view(
+                     y[self.max_lag:], self.steps
+                 ).astype(float)
             
         return X_data, y_data
 
@@ -385,6 +418,39 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
         
         """
 
+        X_train, y_train = self._create_train_matrix(series=series, exog=exog).to_frame()
+
+        return X_train, y_train
+
+
+    def _create_train_matrix(
+        self,
+        series: pd.DataFrame,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None
+    ) -> DirectTrainMatrix:
+        """
+        Create the training matrices of all the regressors as a `DirectTrainMatrix`.
+        Lags and exogenous variables are stored only once, the predictors of 
+        each step are created with its method `get_step`.
+
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------        
+        series : pandas DataFrame
+            Training time series.
+            
+        exog : pandas Series, pandas DataFrame, default `None`
+            Exogenous variable/s included as predictor/s. Must have the same
+            number of observations as `series` and their indexes must be aligned.
+
+        Returns 
+        -------
+        train_matrix : DirectTrainMatrix
+            Training matrices of all the regressors.
+        
+        """
+
         if not isinstance(series, pd.DataFrame):
             raise TypeError(f'`series` must be a pandas DataFrame. Got {type(series)}.')
         
@@ -434,7 +500,9 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
                     )
         
         y_train_col_names = [f"{self.level}_step_{i+1}" for i in range(self.steps)]
-        X_train_col_names = [f"{key}_lag_{lag}" for key in self.lags_ for lag in self.lags_[key]]
+        X_lags_col_names = [f"{key}_lag_{lag}" for key in self.lags_ for lag in self.lags_[key]]
+        X_exog = None
+        col_names_exog = None
 
         for i, serie in enumerate(series.columns):
 
@@ -451,9 +519,9 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
             X_train_values, y_train_values = self._create_lags(y=y_values, lags=self.lags_[serie])
 
             if i == 0:
-                X_train = X_train_values
+                X_lags = X_train_values
             else:
-                X_train = np.hstack((X_train, X_train_values))
+                X_lags = np.hstack((X_lags, X_train_values))
 
             if serie == self.level:
                 y_train = y_train_values
@@ -482,6 +550,8 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
                             inverse_transform = False
                        )
             exog_values, exog_index = preprocess_exog(exog=exog)
+            if exog_values.dtype.kind in 'biuf':
+                exog_values = exog_values.astype(self.dtype, copy=False)
             if not (exog_index[:len(y_index)] == y_index).all():
                 raise ValueError(
                     ('Different index for `series` and `exog`. They must be equal '
@@ -489,29 +559,27 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
                 )
             col_names_exog = exog.columns if isinstance(exog, pd.DataFrame) else [exog.name]
 
-            # Transform exog to match direct format
-            X_exog = exog_to_direct(exog=exog_values, steps=self.steps)
-            col_names_exog = [f"{col_name}_step_{i+1}" for col_name in col_names_exog for i in range(self.steps)]
-            X_train_col_names.extend(col_names_exog)
-
-            # The first `self.max_lag` positions have to be removed from X_exog
-            # since they are not in X_lags.
-            X_exog = X_exog[-X_train.shape[0]:, ]
-            X_train = np.column_stack((X_train, X_exog))
-
-        X_train = pd.DataFrame(
-                      data    = X_train,
-                      columns = X_train_col_names,
-                      index   = y_index[self.max_lag + (self.steps -1): ]
-                  )
-        self.X_train_col_names = X_train_col_names
-        y_train = pd.DataFrame(
-                      data    = y_train,
-                      index   = y_index[self.max_lag + (self.steps -1): ],
-                      columns = y_train_col_names,
-                  )
+            # Transform exog to match direct format. The first `self.max_lag` 
+            # positions are removed since they are not in X_lags. Values are 
+            # copied once, the values of each step are a view of them.
+            X_exog = exog_to_direct(
+                         exog        = exog_values[self.max_lag:].copy(),
+                         steps       = self.steps,
+                         return_view = True
+                     )
+
+        train_matrix = DirectTrainMatrix(
+                           X_lags            = X_lags,
+                           y_train           = y_train,
+                           index             = y_index[self.max_lag + (self.steps -1): ],
+                           X_lags_col_names  = X_lags_col_names,
+                           y_train_col_names = y_train_col_names,
+                           X_exog            = X_exog,
+                           exog_col_names    = col_names_exog
+                       )
+        self.X_train_col_names = train_matrix.X_train_col_names
                         
-        return X_train, y_train
+        return train_matrix
 
     
     def filter_train_X_y_for_step(
@@ -577,9 +645,10 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
 
         Parameters
         ----------
-        X_train : pandas DataFrame
+        X_train : pandas DataFrame, DirectTrainMatrix
             Dataframe generated with the methods `create_train_X_y` and 
-            `filter_train_X_y_for_step`, first return.
+            `filter_train_X_y_for_step`, first return, or with
+            `_create_train_matrix`. Only its index is used.
 
         Returns
         -------
@@ -667,35 +736,55 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
                      f'    `exog`   columns : {self.exog_col_names}.')
                 )
 
-        X_train, y_train = self.create_train_X_y(series=series, exog=exog)
+        with timed_phase('create_train_X_y') as phase:
+            train_matrix = self._create_train_matrix(series=series, exog=exog)
+            phase.add_array(train_matrix)
        
-        # Train one regressor for each step
-        for step in range(1, self.steps + 1):
-            # self.regressors_ and self.filter_train_X_y_for_step expect
-            # first step to start at value 1
-            X_train_step, y_train_step = self.filter_train_X_y_for_step(
-                                             step    = step,
-                                             X_train = X_train,
-                                             y_train = y_train
-                                         )
-            sample_weight = self.create_sample_weights(X_train=X_train_step)
+        def fit_forecaster(regressor, X_train_step, y_train_step, sample_weight, step):
+            """
+            Auxiliary function to fit the regressor of one step. The fits of the
+            steps are independent, so they can run in parallel.
+            """
             if sample_weight is not None:
-                self.regressors_[step].fit(
+                regressor.fit(
                     X = X_train_step,
                     y = y_train_step,
                     sample_weight = sample_weight
                 )
             else:
-                self.regressors_[step].fit(X=X_train_step, y=y_train_step)
+                regressor.fit(X=X_train_step, y=y_train_step)
+
+            return step, regressor
+
+        # All steps share the index of the training matrices, and therefore 
+        # the weights.
+        sample_weight = self.create_sample_weights(X_train=train_matrix)
+
+        # Train one regressor for each step. self.regressors_ and
+        # train_matrix.get_step expect first step to start at value 1.
+        # The matrices of each step are created when its job is dispatched.
+        with timed_phase('regressor.fit'):
+            results_fit = Parallel(n_jobs=self.n_jobs)(
+                              delayed(fit_forecaster)(
+                                  self.regressors_[step],
+                                  *train_matrix.get_step(step=step),
+                                  sample_weight,
+                                  step
+                              )
+                              for step in range(1, self.steps + 1)
+                          )
+
+        for step, regressor in results_fit:
+            self.regressors_[step] = regressor
         
         self.fitted = True
         self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
         self.training_range = preprocess_y(y=series[self.level])[1][[0, -1]]
-        self.index_type = type(X_train.index)
-        if isinstance(X_train.index, pd.DatetimeIndex):
-            self.index_freq = X_train.index.freqstr
+        self.index_type = type(train_matrix.index)
+        if isinstance(train_matrix.index, pd.DatetimeIndex):
+            self.index_freq = train_matrix.index.freqstr
         else: 
-            self.index_freq = X_train.index.step
+            self.index_freq = train_matrix.index.step
 
         self.last_window = series.iloc[-self.max_lag:].copy()
 
@@ -836,7 +925,8 @@ class ForecasterAutoregMultiVariate(ForecasterBase):
                 # Suppress scikit-learn warning: "X does not have valid feature names,
                 # but NoOpTransformer was fitted with feature names".
                 warnings.simplefilter("ignore")
-                predictions[i] = regressor.predict(X)
+                with timed_phase('regressor.predict'):
+                    predictions[i] = regressor.predict(X)
 
         idx = expand_index(index=last_window_index, steps=max(steps))
 
@@ -115,4 +115,24 @@ def test_create_lags_when_lags_is_3_steps_5_and_y_is_numpy_arange_10():
                           [5., 6., 7., 8., 9.]]))
 
     assert (results[0] == expected[0]).all()
-    assert (results[1] == expected[1]).all()
\ No newline at end of file
+    assert (results[1] == expected[1]).all()
+
+def test_create_lags_when_dtype_is_float32():
+    """
+    Test matrix of lags is created with dtype float32 when the forecaster is
+    created with `dtype=np.float32`. y_data is float64.
+    """
+    forecaster = ForecasterAutoregMultiVariate(LinearRegression(), level='l1', 
+                                               lags=3, steps=2, dtype=np.float32)
+    results = forecaster._create_lags(y=np.arange(7), lags=np.array([1, 3]))
+    expected = (np.array([[2., 0.],
+                          [3., 1.],
+                          [4., 2.]], dtype=np.float32),
+                np.array([[3., 4.],
+                          [4., 5.],
+                          [5., 6.]]))
+
+    assert results[0].dtype == np.float32
+    assert results[1].dtype == np.float64
+    np.testing.assert_array_equal(results[0], expected[0])
+    np.testing.assert_array_equal(results[1], expected[1])
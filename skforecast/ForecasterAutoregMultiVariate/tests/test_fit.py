@@ -136,4 +136,20 @@ def test_fit_last_window_stored_when_different_lags():
                             })
     expected.index = pd.RangeIndex(start=5, stop=10, step=1)
 
-    pd.testing.assert_frame_equal(forecaster.last_window, expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(forecaster.last_window, expected)
+
+def test_fit_same_predictions_when_n_jobs_greater_than_1():
+    """
+    Test predictions are the same when the regressor of each step is fitted
+    in parallel (n_jobs=2).
+    """
+    series = pd.DataFrame({'l1': np.random.default_rng(123).normal(size=50),
+                           'l2': np.random.default_rng(456).normal(size=50)})
+    forecaster = ForecasterAutoregMultiVariate(LinearRegression(), level='l1',
+                                               lags=3, steps=3)
+    forecaster.fit(series=series)
+    forecaster_parallel = ForecasterAutoregMultiVariate(LinearRegression(), level='l1',
+                                                        lags=3, steps=3, n_jobs=2)
+    forecaster_parallel.fit(series=series)
+
+    pd.testing.assert_frame_equal(forecaster_parallel.predict(), forecaster.predict())
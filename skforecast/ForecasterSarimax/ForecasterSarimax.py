@@ -23,7 +23,9 @@ from ..utils import check_exog
 from ..utils import check_predict_input
 from ..utils import expand_index
 from ..utils import transform_series
+from ..utils import transform_bootstrapping_matrix
 from ..utils import transform_dataframe
+from ..utils import timed_phase
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -52,6 +54,16 @@ class ForecasterSarimax():
         An instance of a transformer (preprocessor) compatible with the scikit-learn
         preprocessing API. The transformation is applied to `exog` before training the
         forecaster. `inverse_transform` is not available when using ColumnTransformers.
+
+    bounded_state : bool, default `False`
+        If `True`, the forecaster only keeps the state needed to forecast from
+        the last observation seen. When predicting with `last_window`, the
+        internal statsmodels SARIMAX is updated with its `extend` method, which
+        keeps only the new observations and the Kalman filter state at the end
+        of the previous ones, instead of `append`, which stores the whole
+        history. Memory and latency stay constant across rolling predictions.
+        Not available when the ARIMA uses `simple_differencing`.
+        **New in version 0.7.0**
     
     Attributes
     ----------
@@ -73,18 +85,24 @@ class ForecasterSarimax():
         preprocessing API. The transformation is applied to `exog` before training the
         forecaster. `inverse_transform` is not available when using ColumnTransformers.
    
+    bounded_state : bool
+        If `True`, the forecaster only keeps the state needed to forecast from
+        the last observation seen.
+
     window_size : int, `1` 
         Not used, present here for API consistency by convention.
 
     last_window : pandas Series
         Last window the forecaster has seen during trained. It stores the
         values needed to predict the next `step` right after the training data.
+        If `bounded_state=True`, only the last observation is stored.
 
     extended_index : pandas Index
         When predicting using `last_window` and `last_window_exog`, the internal
-        statsmodels SARIMAX will be updated using its append method. To do this,
-        `last_window` data must start at the end of the index seen by the 
-        forecaster, this is stored in forecaster.extended_index.
+        statsmodels SARIMAX will be updated using its append method (`extend`
+        if `bounded_state=True`). To do this, `last_window` data must start at 
+        the end of the index seen by the forecaster, this is stored in 
+        forecaster.extended_index.
 
         Check https://www.statsmodels.org/dev/generated/statsmodels.tsa.arima.model.ARIMAResults.append.html
         to know more about statsmodels append method.
@@ -130,11 +148,13 @@ class ForecasterSarimax():
         regressor: ARIMA,
         transformer_y: Optional[object]=None,
         transformer_exog: Optional[object]=None,
+        bounded_state: bool=False
     ) -> None:
         
         self.regressor         = regressor
         self.transformer_y     = transformer_y
         self.transformer_exog  = transformer_exog
+        self.bounded_state     = bounded_state
         self.window_size       = 1
         self.last_window       = None
         self.extended_index    = None
@@ -224,6 +244,14 @@ class ForecasterSarimax():
                 )
             check_exog(exog=exog)
 
+        if self.bounded_state and \
+           self.regressor.sarimax_kwargs is not None and \
+           self.regressor.sarimax_kwargs.get('simple_differencing', False):
+            raise ValueError(
+                ("`bounded_state=True` is not available when the ARIMA uses "
+                 "`simple_differencing`.")
+            )
+
         # Reset values in case the forecaster has already been fitted.
         self.index_type          = None
         self.index_freq          = None
@@ -262,7 +290,8 @@ class ForecasterSarimax():
                        inverse_transform = False
                    )
         
-        self.regressor.fit(y=y, X=exog)
+        with timed_phase('regressor.fit'):
+            self.regressor.fit(y=y, X=exog)
         self.fitted = True
         self.fit_date = pd.Timestamp.today().strftime('%Y-%m-%d %H:%M:%S')
         self.training_range = y.index[[0, -1]]
@@ -272,8 +301,12 @@ class ForecasterSarimax():
         else: 
             self.index_freq = y.index.step
 
-        self.last_window = y.copy()
-        self.extended_index = self.regressor.arima_res_.fittedvalues.index.copy()
+        if self.bounded_state:
+            self.last_window = y.iloc[-self.window_size:].copy()
+            self.extended_index = self.regressor.arima_res_.fittedvalues.index[-self.window_size:]
+        else:
+            self.last_window = y.copy()
+            self.extended_index = self.regressor.arima_res_.fittedvalues.index.copy()
         self.params = self.regressor.get_params(deep=True)
 
 
@@ -292,9 +325,10 @@ class ForecasterSarimax():
         for the predict procedure and will fail otherwise.
         
         When predicting using `last_window` and `last_window_exog`, the internal
-        statsmodels SARIMAX will be updated using its append method. To do this,
-        `last_window` data must start at the end of the index seen by the 
-        forecaster, this is stored in forecaster.extended_index.
+        statsmodels SARIMAX will be updated using its append method (`extend`
+        if `bounded_state=True`). To do this, `last_window` data must start at 
+        the end of the index seen by the forecaster, this is stored in 
+        forecaster.extended_index.
 
         Check https://www.statsmodels.org/dev/generated/statsmodels.tsa.arima.model.ARIMAResults.append.html
         to know more about statsmodels append method.
@@ -327,7 +361,7 @@ class ForecasterSarimax():
         """
 
         # Needs to be a new variable to avoid arima_res_.append if not needed
-        last_window_check = last_window.copy() if last_window is not None else self.last_window.copy()
+        last_window_check = last_window if last_window is not None else self.last_window
 
         check_predict_input(
             forecaster_type  = type(self).__name__,
@@ -417,12 +451,25 @@ class ForecasterSarimax():
                                        inverse_transform = False
                                    )
 
-            self.regressor.arima_res_ = self.regressor.arima_res_.append(
-                                            endog = last_window,
-                                            exog  = last_window_exog,
-                                            refit = False
-                                        )
-            self.extended_index = self.regressor.arima_res_.fittedvalues.index
+            if self.bounded_state:
+                # extend keeps only the new observations, the filter starts
+                # from the state at the end of the previous results. The time
+                # trend continues from the observations already seen (statsmodels
+                # default ignores the offset of results created by extend).
+                arima_res = self.regressor.arima_res_
+                self.regressor.arima_res_ = arima_res.extend(
+                                                endog        = last_window,
+                                                exog         = last_window_exog,
+                                                trend_offset = arima_res.model.trend_offset + arima_res.nobs
+                                            )
+                self.extended_index = self.regressor.arima_res_.fittedvalues.index[-self.window_size:]
+            else:
+                self.regressor.arima_res_ = self.regressor.arima_res_.append(
+                                                endog = last_window,
+                                                exog  = last_window_exog,
+                                                refit = False
+                                            )
+                self.extended_index = self.regressor.arima_res_.fittedvalues.index
                         
         # Exog
         if exog is not None:
@@ -439,10 +486,11 @@ class ForecasterSarimax():
             exog = exog.iloc[:steps, ]
 
         # Get following n steps predictions
-        predictions = self.regressor.predict(
-                          n_periods = steps,
-                          X         = exog
-                      )
+        with timed_phase('regressor.predict'):
+            predictions = self.regressor.predict(
+                              n_periods = steps,
+                              X         = exog
+                          )
 
         # Reverse the transformation if needed
         predictions = transform_series(
@@ -473,9 +521,10 @@ class ForecasterSarimax():
         they will be expected for the predict procedure and will fail otherwise.
         
         When predicting using `last_window` and `last_window_exog`, the internal
-        statsmodels SARIMAX will be updated using its append method. To do this,
-        `last_window` data must start at the end of the index seen by the 
-        forecaster, this is stored in forecaster.extended_index.
+        statsmodels SARIMAX will be updated using its append method (`extend`
+        if `bounded_state=True`). To do this, `last_window` data must start at 
+        the end of the index seen by the forecaster, this is stored in 
+        forecaster.extended_index.
 
         Check https://www.statsmodels.org/dev/generated/statsmodels.tsa.arima.model.ARIMAResults.append.html
         to know more about statsmodels append method.
@@ -520,7 +569,7 @@ class ForecasterSarimax():
         """
 
         # Needs to be a new variable to avoid arima_res_.append if not needed
-        last_window_check = last_window.copy() if last_window is not None else self.last_window.copy()
+        last_window_check = last_window if last_window is not None else self.last_window
 
         check_predict_input(
             forecaster_type  = type(self).__name__,
@@ -620,12 +669,25 @@ class ForecasterSarimax():
                                        inverse_transform = False
                                    )
 
-            self.regressor.arima_res_ = self.regressor.arima_res_.append(
-                                            endog = last_window,
-                                            exog  = last_window_exog,
-                                            refit = False
-                                        )
-            self.extended_index = self.regressor.arima_res_.fittedvalues.index
+            if self.bounded_state:
+                # extend keeps only the new observations, the filter starts
+                # from the state at the end of the previous results. The time
+                # trend continues from the observations already seen (statsmodels
+                # default ignores the offset of results created by extend).
+                arima_res = self.regressor.arima_res_
+                self.regressor.arima_res_ = arima_res.extend(
+                                                endog        = last_window,
+                                                exog         = last_window_exog,
+                                                trend_offset = arima_res.model.trend_offset + arima_res.nobs
+                                            )
+                self.extended_index = self.regressor.arima_res_.fittedvalues.index[-self.window_size:]
+            else:
+                self.regressor.arima_res_ = self.regressor.arima_res_.append(
+                                                endog = last_window,
+                                                exog  = last_window_exog,
+                                                refit = False
+                                            )
+                self.extended_index = self.regressor.arima_res_.fittedvalues.index
 
         # Exog
         if exog is not None:
@@ -642,26 +704,24 @@ class ForecasterSarimax():
             exog = exog.iloc[:steps, ]
 
         # Get following n steps predictions with intervals
-        predicted_mean, conf_int = self.regressor.predict(
-                                       n_periods       = steps,
-                                       X               = exog,
-                                       alpha           = alpha,
-                                       return_conf_int = True
-                                   )
+        with timed_phase('regressor.predict'):
+            predicted_mean, conf_int = self.regressor.predict(
+                                           n_periods       = steps,
+                                           X               = exog,
+                                           alpha           = alpha,
+                                           return_conf_int = True
+                                       )
                                     
         predictions = predicted_mean.to_frame(name="pred")
         predictions['lower_bound'] = conf_int[:, 0]
         predictions['upper_bound'] = conf_int[:, 1]
 
         # Reverse the transformation if needed
-        if self.transformer_y:
-            for col in predictions.columns:
-                predictions[col] = transform_series(
-                                    series            = predictions[col],
-                                    transformer       = self.transformer_y,
-                                    fit               = False,
-                                    inverse_transform = True
-                               )
+        predictions = transform_bootstrapping_matrix(
+                          boot_predictions  = predictions,
+                          transformer       = self.transformer_y,
+                          inverse_transform = True
+                      )
 
         return predictions
 
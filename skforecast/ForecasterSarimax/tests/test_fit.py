@@ -80,4 +80,34 @@ def test_fit_extended_index_stored(y, idx):
     forecaster = ForecasterSarimax(regressor = ARIMA(order=(1,1,1)))
     forecaster.fit(y=y)
 
-    pd.testing.assert_index_equal(forecaster.extended_index, idx)
\ No newline at end of file
+    pd.testing.assert_index_equal(forecaster.extended_index, idx)
+
+def test_fit_last_window_and_extended_index_stored_when_bounded_state():
+    """
+    Test that only the last observation is stored in last_window and 
+    extended_index when bounded_state=True.
+    """
+    forecaster = ForecasterSarimax(regressor = ARIMA(order=(1,1,1)), bounded_state=True)
+    forecaster.fit(y=pd.Series(np.arange(50)))
+    expected = pd.Series(np.arange(50)).iloc[-1:]
+
+    pd.testing.assert_series_equal(forecaster.last_window, expected)
+    pd.testing.assert_index_equal(forecaster.extended_index, pd.RangeIndex(start=49, stop=50))
+
+
+def test_fit_ValueError_when_bounded_state_and_simple_differencing():
+    """
+    Test ValueError is raised when bounded_state=True and the ARIMA uses 
+    simple_differencing.
+    """
+    forecaster = ForecasterSarimax(
+                     regressor     = ARIMA(order=(1,1,1), simple_differencing=True),
+                     bounded_state = True
+                 )
+
+    err_msg = re.escape(
+                ("`bounded_state=True` is not available when the ARIMA uses "
+                 "`simple_differencing`.")
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        forecaster.fit(y=y)
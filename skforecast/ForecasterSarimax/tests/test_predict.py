@@ -361,4 +361,34 @@ def test_predict_ForecasterSarimax_updates_extended_index_twice(y, idx):
     forecaster.predict(steps=5, last_window=lw_2)
 
     pd.testing.assert_index_equal(result_1, expected_1)
-    pd.testing.assert_index_equal(forecaster.extended_index, idx)
\ No newline at end of file
+    pd.testing.assert_index_equal(forecaster.extended_index, idx)
+
+@pytest.mark.parametrize("trend", 
+                         [None, 'c', 't', 'ct'], 
+                         ids = lambda trend : f'trend: {trend}')
+@pytest.mark.parametrize("y          , idx", 
+                         [(y         , pd.RangeIndex(start=0, stop=50)), 
+                          (y_datetime, pd.date_range(start='2000', periods=50, freq='A'))], 
+                         ids = lambda values : f'y, index: {values}')
+def test_predict_ForecasterSarimax_bounded_state_same_predictions_and_bounded_nobs(y, idx, trend):
+    """
+    Test that predictions with bounded_state=True are equal to the ones with
+    bounded_state=False when predicting twice with `last_window`, and that the
+    internal statsmodels results only keep the last window.
+    """
+    predictions = []
+    for bounded_state in [False, True]:
+        forecaster = ForecasterSarimax(
+                         regressor     = ARIMA(maxiter=1000, trend=trend, method='nm', ftol=1e-19, order=(1,0,0)),
+                         bounded_state = bounded_state
+                     )
+        forecaster.fit(y=y.iloc[:30])
+        predictions_bounded_state = [
+            forecaster.predict(steps=5, last_window=y.iloc[i:i + 5])
+            for i in range(30, 50, 5)
+        ]
+        predictions.append(pd.concat(predictions_bounded_state))
+
+    pd.testing.assert_series_equal(predictions[0], predictions[1])
+    assert forecaster.regressor.arima_res_.nobs == 5
+    pd.testing.assert_index_equal(forecaster.extended_index, idx[-1:])
@@ -0,0 +1,319 @@
+################################################################################
+#                               LinearPredictor                                #
+#                                                                              #
+# This work by Joaquin Amat Rodrigo and Javier Escobar Ortiz is licensed       #
+# under a Creative Commons Attribution 4.0 International License.              #
+################################################################################
+# coding=utf-8
+
+from typing import Optional
+import numpy as np
+
+# Only numpy is needed to load and use a LinearPredictor.
+
+
+class LinearPredictor():
+    """
+    Predict-only version of a `ForecasterAutoreg` fitted with a linear regressor
+    (LinearRegression, Ridge, Lasso, ElasticNet...). The forecaster is reduced
+    to the linear recurrence
+
+        y[t] = intercept + coef_lags · y[t - lags] + coef_exog · exog[t]
+
+    in the original scale of the series: affine transformers (StandardScaler,
+    MinMaxScaler) of `y` and `exog` are folded into the coefficients. Predictions
+    are a numpy loop of dot products, with no scikit-learn, pandas or index
+    handling, and several series can be predicted at once.
+
+    Create it with `LinearPredictor.from_forecaster(forecaster)`.
+
+    **New in version 0.7.0**
+    
+    Parameters
+    ----------
+    lags : numpy ndarray
+        Lags used as predictors.
+
+    coef_lags : numpy ndarray
+        Coefficient of each lag.
+
+    intercept : float
+        Independent term of the recurrence.
+
+    coef_exog : numpy ndarray, default `None`
+        Coefficient of each exogenous variable.
+
+    last_window : numpy ndarray, default `None`
+        Last values of the training series, used when `predict` is called 
+        without `last_window`.
+
+    exog_col_names : list, default `None`
+        Names of the exogenous variables, in the order expected by `predict`.
+
+    Attributes
+    ----------
+    lags : numpy ndarray
+        Lags used as predictors.
+
+    max_lag : int
+        Maximum value of lag included in `lags`.
+
+    window_size : int
+        Size of the window needed to create the predictors. It is equal to
+        `max_lag`.
+
+    coef_lags : numpy ndarray
+        Coefficient of each lag.
+
+    intercept : float
+        Independent term of the recurrence.
+
+    coef_exog : numpy ndarray
+        Coefficient of each exogenous variable.
+
+    last_window : numpy ndarray
+        Last values of the training series.
+
+    exog_col_names : list
+        Names of the exogenous variables, in the order expected by `predict`.
+
+    """
+
+    def __init__(
+        self,
+        lags: np.ndarray,
+        coef_lags: np.ndarray,
+        intercept: float,
+        coef_exog: Optional[np.ndarray]=None,
+        last_window: Optional[np.ndarray]=None,
+        exog_col_names: Optional[list]=None
+    ) -> None:
+
+        self.lags           = np.asarray(lags, dtype=int)
+        self.max_lag        = int(self.lags.max())
+        self.window_size    = self.max_lag
+        self.coef_lags      = np.asarray(coef_lags, dtype=float)
+        self.intercept      = float(intercept)
+        self.coef_exog      = None if coef_exog is None else np.asarray(coef_exog, dtype=float)
+        self.last_window    = None if last_window is None else np.asarray(last_window, dtype=float)
+        self.exog_col_names = exog_col_names
+
+
+    def __repr__(
+        self
+    ) -> str:
+
+        return (
+            f"{type(self).__name__}(lags={self.lags}, "
+            f"n_exog={0 if self.coef_exog is None else len(self.coef_exog)})"
+        )
+
+
+    @classmethod
+    def from_forecaster(
+        cls,
+        forecaster: object
+    ) -> object:
+        """
+        Create a LinearPredictor from a fitted `ForecasterAutoreg` whose regressor
+        is a linear model of scikit-learn (`coef_` and `intercept_` attributes).
+        `transformer_y` and `transformer_exog` must be `None`, StandardScaler or
+        MinMaxScaler. Exogenous variables must be numeric.
+
+        Parameters
+        ----------
+        forecaster : ForecasterAutoreg
+            Fitted forecaster.
+
+        Returns
+        -------
+        linear_predictor : LinearPredictor
+            Predict-only version of the forecaster.
+
+        """
+
+        if type(forecaster).__name__ != 'ForecasterAutoreg':
+            raise TypeError(
+                f'`forecaster` must be a ForecasterAutoreg. Got {type(forecaster).__name__}.'
+            )
+        if not forecaster.fitted:
+            raise ValueError(
+                'The forecaster must be fitted before being exported.'
+            )
+
+        regressor = forecaster.regressor
+        if not (type(regressor).__module__.startswith('sklearn.linear_model')
+                and hasattr(regressor, 'coef_') and hasattr(regressor, 'intercept_')):
+            raise TypeError(
+                (f'Only forecasters with a linear regressor of `sklearn.linear_model` '
+                 f'can be exported. Got {type(regressor).__name__}.')
+            )
+
+        coef = np.asarray(regressor.coef_, dtype=float).ravel()
+        intercept = float(np.ravel(regressor.intercept_)[0])
+        n_lags = len(forecaster.lags)
+        coef_lags = coef[:n_lags]
+        coef_exog = coef[n_lags:] if forecaster.included_exog else None
+
+        if coef_exog is not None:
+            exog_col_names = forecaster.exog_col_names
+            if not isinstance(exog_col_names, list):
+                exog_col_names = [exog_col_names]
+            if len(coef_exog) != len(exog_col_names):
+                raise TypeError(
+                    ('`transformer_exog` must keep one column per exogenous '
+                     'variable to export the forecaster.')
+                )
+            # exog is transformed as exog * scale + offset.
+            exog_scale, exog_offset = _affine_transformer_params(
+                                          transformer = forecaster.transformer_exog,
+                                          name        = 'transformer_exog'
+                                      )
+            intercept = intercept + np.sum(coef_exog * exog_offset)
+            coef_exog = coef_exog * exog_scale
+        else:
+            exog_col_names = None
+
+        # The recurrence is learned in the transformed scale z = y * scale + offset.
+        # Written in the original scale of y:
+        # y[t] = (intercept + offset * (sum(coef_lags) - 1)) / scale
+        #        + coef_lags · y[t - lags] + coef_exog · exog[t] / scale
+        y_scale, y_offset = _affine_transformer_params(
+                                transformer = forecaster.transformer_y,
+                                name        = 'transformer_y'
+                            )
+        y_scale, y_offset = float(y_scale[0]), float(y_offset[0])
+        intercept = (intercept + y_offset * (np.sum(coef_lags) - 1)) / y_scale
+        if coef_exog is not None:
+            coef_exog = coef_exog / y_scale
+
+        linear_predictor = cls(
+                               lags           = forecaster.lags,
+                               coef_lags      = coef_lags,
+                               intercept      = intercept,
+                               coef_exog      = coef_exog,
+                               last_window    = forecaster.last_window.to_numpy(),
+                               exog_col_names = exog_col_names
+                           )
+
+        return linear_predictor
+
+
+    def predict(
+        self,
+        steps: int,
+        last_window: Optional[np.ndarray]=None,
+        exog: Optional[np.ndarray]=None
+    ) -> np.ndarray:
+        """
+        Predict n steps ahead.
+
+        Parameters
+        ----------
+        steps : int
+            Number of future steps predicted.
+
+        last_window : numpy ndarray, default `None`
+            Values of the series used to create the predictors (lags) needed in 
+            the first iteration of prediction (t + 1), at least `window_size`
+            values. 1d array for one series, 2d array with one series per row to
+            predict several series at once. If `None`, the last window of the 
+            training series is used.
+
+        exog : numpy ndarray, default `None`
+            Values of the exogenous variables, shape (steps, n_exog), the 
+            same for all the series. Columns in the same order as `exog_col_names`.
+
+        Returns
+        -------
+        predictions : numpy ndarray
+            Predicted values, shape (steps,) for one series or (n_series, steps).
+
+        """
+
+        if last_window is None:
+            last_window = self.last_window
+        last_window = np.asarray(last_window, dtype=float)
+        if last_window.shape[-1] < self.window_size:
+            raise ValueError(
+                (f'`last_window` must have at least {self.window_size} values. '
+                 f'Got shape {last_window.shape}.')
+            )
+
+        if (exog is None) != (self.coef_exog is None):
+            raise ValueError(
+                ('`exog` must be provided if, and only if, the forecaster was '
+                 'trained with exogenous variable/s.')
+            )
+
+        # Terms that do not depend on the predictions are computed for all
+        # steps at once.
+        constant = np.full(shape=steps, fill_value=self.intercept)
+        if exog is not None:
+            exog = np.asarray(exog, dtype=float)
+            if exog.ndim == 1:
+                exog = exog.reshape(-1, 1)
+            if exog.shape[0] < steps or exog.shape[1] != len(self.coef_exog):
+                raise ValueError(
+                    (f'`exog` must have shape ({steps}, {len(self.coef_exog)}). '
+                     f'Got {exog.shape}.')
+                )
+            constant += exog[:steps] @ self.coef_exog
+
+        window = np.empty(shape=last_window.shape[:-1] + (self.window_size + steps,))
+        window[..., :self.window_size] = last_window[..., -self.window_size:]
+        idx_lags = self.window_size - self.lags
+
+        for i in range(steps):
+            window[..., self.window_size + i] = (
+                window[..., idx_lags + i] @ self.coef_lags + constant[i]
+            )
+
+        predictions = window[..., self.window_size:]
+
+        return predictions
+
+
+def _affine_transformer_params(
+    transformer: object,
+    name: str
+) -> tuple:
+    """
+    Scale and offset of an affine transformer, `X * scale + offset`.
+
+    Parameters
+    ----------
+    transformer : StandardScaler, MinMaxScaler, None
+        Fitted transformer.
+
+    name : str
+        Name of the argument, used in the error message.
+
+    Returns
+    -------
+    scale : numpy ndarray
+        Scale of each feature.
+
+    offset : numpy ndarray
+        Offset of each feature.
+
+    """
+
+    if transformer is None:
+        return np.ones(1), np.zeros(1)
+
+    transformer_name = type(transformer).__name__
+    if transformer_name == 'StandardScaler':
+        scale = 1 / transformer.scale_ if transformer.scale_ is not None else np.ones(transformer.n_features_in_)
+        mean = transformer.mean_ if transformer.mean_ is not None else np.zeros(transformer.n_features_in_)
+        offset = -mean * scale
+    elif transformer_name == 'MinMaxScaler' and not transformer.clip:
+        scale = transformer.scale_
+        offset = transformer.min_
+    else:
+        raise TypeError(
+            (f'Only StandardScaler and MinMaxScaler (clip=False) can be folded '
+             f'into the coefficients. Got {transformer_name} as `{name}`.')
+        )
+
+    return np.asarray(scale, dtype=float), np.asarray(offset, dtype=float)
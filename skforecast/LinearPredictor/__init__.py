@@ -0,0 +1 @@
+from .LinearPredictor import LinearPredictor
\ No newline at end of file
@@ -0,0 +1,134 @@
+# Unit test from_forecaster LinearPredictor
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import Ridge
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import MinMaxScaler
+from sklearn.preprocessing import PowerTransformer
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from skforecast.ForecasterAutoregCustom import ForecasterAutoregCustom
+from skforecast.LinearPredictor import LinearPredictor
+
+# Fixtures
+y = pd.Series(np.arange(50, dtype=float) + np.sin(np.arange(50)), name='y')
+exog = pd.DataFrame({'exog_1': np.cos(np.arange(60)),
+                     'exog_2': np.arange(60, dtype=float)})
+
+
+def test_from_forecaster_TypeError_when_forecaster_is_not_ForecasterAutoreg():
+    """
+    Test TypeError is raised when forecaster is not a ForecasterAutoreg.
+    """
+    forecaster = ForecasterAutoregCustom(
+                     regressor      = LinearRegression(),
+                     fun_predictors = lambda y: y[-1:],
+                     window_size    = 1
+                 )
+    err_msg = re.escape('`forecaster` must be a ForecasterAutoreg. Got ForecasterAutoregCustom.')
+    with pytest.raises(TypeError, match = err_msg):
+        LinearPredictor.from_forecaster(forecaster)
+
+
+def test_from_forecaster_ValueError_when_forecaster_not_fitted():
+    """
+    Test ValueError is raised when the forecaster is not fitted.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    err_msg = re.escape('The forecaster must be fitted before being exported.')
+    with pytest.raises(ValueError, match = err_msg):
+        LinearPredictor.from_forecaster(forecaster)
+
+
+def test_from_forecaster_TypeError_when_regressor_is_not_linear():
+    """
+    Test TypeError is raised when the regressor is not a linear model.
+    """
+    forecaster = ForecasterAutoreg(RandomForestRegressor(n_estimators=2), lags=3)
+    forecaster.fit(y=y)
+    err_msg = re.escape(
+                ('Only forecasters with a linear regressor of `sklearn.linear_model` '
+                 'can be exported. Got RandomForestRegressor.')
+              )
+    with pytest.raises(TypeError, match = err_msg):
+        LinearPredictor.from_forecaster(forecaster)
+
+
+def test_from_forecaster_TypeError_when_transformer_is_not_affine():
+    """
+    Test TypeError is raised when transformer_y is not StandardScaler or 
+    MinMaxScaler.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor     = LinearRegression(),
+                     lags          = 3,
+                     transformer_y = PowerTransformer()
+                 )
+    forecaster.fit(y=y)
+    err_msg = re.escape(
+                ('Only StandardScaler and MinMaxScaler (clip=False) can be folded '
+                 'into the coefficients. Got PowerTransformer as `transformer_y`.')
+              )
+    with pytest.raises(TypeError, match = err_msg):
+        LinearPredictor.from_forecaster(forecaster)
+
+
+def test_from_forecaster_folds_transformers_into_coefficients():
+    """
+    Test coefficients and intercept of the exported predictor when transformer_y
+    is a StandardScaler.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor     = LinearRegression(),
+                     lags          = 2,
+                     transformer_y = StandardScaler()
+                 )
+    forecaster.fit(y=y)
+    linear_predictor = LinearPredictor.from_forecaster(forecaster)
+
+    mean = forecaster.transformer_y.mean_[0]
+    coef = forecaster.regressor.coef_
+    expected_intercept = (
+        forecaster.regressor.intercept_ * forecaster.transformer_y.scale_[0]
+        + mean * (1 - coef.sum())
+    )
+
+    np.testing.assert_array_equal(linear_predictor.lags, np.array([1, 2]))
+    np.testing.assert_array_almost_equal(linear_predictor.coef_lags, coef)
+    assert linear_predictor.intercept == pytest.approx(expected_intercept)
+    assert linear_predictor.coef_exog is None
+    np.testing.assert_array_equal(linear_predictor.last_window, y.to_numpy()[-2:])
+
+
+@pytest.mark.parametrize("regressor", 
+                         [LinearRegression(), Ridge(alpha=0.5)], 
+                         ids = lambda reg : f'regressor: {type(reg).__name__}')
+@pytest.mark.parametrize("transformer_y", 
+                         [None, StandardScaler(), MinMaxScaler()], 
+                         ids = lambda tr : f'transformer_y: {type(tr).__name__}')
+@pytest.mark.parametrize("transformer_exog", 
+                         [None, StandardScaler(), MinMaxScaler()], 
+                         ids = lambda tr : f'transformer_exog: {type(tr).__name__}')
+def test_from_forecaster_predictions_equal_forecaster_predict(regressor, transformer_y, transformer_exog):
+    """
+    Test predictions of the exported predictor are equal to the predictions
+    of the forecaster.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor        = regressor,
+                     lags             = [1, 2, 5],
+                     transformer_y    = transformer_y,
+                     transformer_exog = transformer_exog
+                 )
+    forecaster.fit(y=y, exog=exog.iloc[:50])
+    linear_predictor = LinearPredictor.from_forecaster(forecaster)
+
+    expected = forecaster.predict(steps=10, exog=exog.iloc[50:]).to_numpy()
+    results = linear_predictor.predict(steps=10, exog=exog.iloc[50:].to_numpy())
+
+    assert linear_predictor.exog_col_names == ['exog_1', 'exog_2']
+    np.testing.assert_array_almost_equal(results, expected)
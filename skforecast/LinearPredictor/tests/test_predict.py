@@ -0,0 +1,78 @@
+# Unit test predict LinearPredictor
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from skforecast.LinearPredictor import LinearPredictor
+
+# Fixtures
+y = pd.Series(np.arange(50, dtype=float) + np.sin(np.arange(50)), name='y')
+exog = pd.Series(np.cos(np.arange(60)), name='exog')
+
+
+def test_predict_ValueError_when_last_window_too_short():
+    """
+    Test ValueError is raised when last_window has less values than window_size.
+    """
+    linear_predictor = LinearPredictor(lags=[1, 2, 3], coef_lags=[0.5, 0.3, 0.1], intercept=1.)
+    err_msg = re.escape('`last_window` must have at least 3 values. Got shape (2,).')
+    with pytest.raises(ValueError, match = err_msg):
+        linear_predictor.predict(steps=2, last_window=np.array([1., 2.]))
+
+
+@pytest.mark.parametrize("coef_exog, exog_values", 
+                         [(None, np.ones(2)), ([1.], None)], 
+                         ids = lambda x : f'{x}')
+def test_predict_ValueError_when_exog_does_not_match_training(coef_exog, exog_values):
+    """
+    Test ValueError is raised when exog is passed to a predictor without
+    exogenous coefficients and vice versa.
+    """
+    linear_predictor = LinearPredictor(lags=[1], coef_lags=[0.5], intercept=1., coef_exog=coef_exog)
+    err_msg = re.escape(
+                ('`exog` must be provided if, and only if, the forecaster was '
+                 'trained with exogenous variable/s.')
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        linear_predictor.predict(steps=2, last_window=np.array([1.]), exog=exog_values)
+
+
+def test_predict_output_when_manual_coefficients():
+    """
+    Test predict output of the recurrence y[t] = 1 + 0.5 * y[t-1] + 2 * exog[t].
+    """
+    linear_predictor = LinearPredictor(lags=[1], coef_lags=[0.5], intercept=1., coef_exog=[2.])
+    results = linear_predictor.predict(
+                  steps       = 3,
+                  last_window = np.array([4.]),
+                  exog        = np.array([0., 1., 2.])
+              )
+    expected = np.array([3., 4.5, 7.25])
+
+    np.testing.assert_array_almost_equal(results, expected)
+
+
+def test_predict_output_when_last_window_is_2d():
+    """
+    Test predict with a 2d last_window returns the predictions of each series
+    in a row, equal to the forecaster predictions with the same last_window.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster.fit(y=y)
+    linear_predictor = LinearPredictor.from_forecaster(forecaster)
+
+    last_window = np.vstack([y.to_numpy()[10:20], y.to_numpy()[-10:]])
+    results = linear_predictor.predict(
+                  steps       = 5,
+                  last_window = last_window
+              )
+    expected = np.vstack([
+                   forecaster.predict(steps=5, last_window=y.iloc[10:20]).to_numpy(),
+                   forecaster.predict(steps=5).to_numpy()
+               ])
+
+    assert results.shape == (2, 5)
+    np.testing.assert_array_almost_equal(results, expected)
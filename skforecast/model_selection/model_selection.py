@@ -12,6 +12,7 @@ import pandas as pd
 import warnings
 import logging
 from copy import deepcopy
+from joblib import Parallel, delayed, effective_n_jobs
 from tqdm import tqdm
 from sklearn.metrics import mean_squared_error 
 from sklearn.metrics import mean_absolute_error
@@ -26,6 +27,9 @@ optuna.logging.set_verbosity(optuna.logging.WARNING) # disable optuna logs
 from skopt.utils import use_named_args
 from skopt import gp_minimize
 
+from ..utils import TrainMatrixCache
+from ..utils import timed_phase
+
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
     level  = logging.INFO,
@@ -253,6 +257,89 @@ def _backtesting_forecaster_verbose(
     return
 
 
+def _fit_predict_folds(
+    forecaster,
+    y: pd.Series,
+    folds: list,
+    exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
+    interval: Optional[list]=None,
+    n_boot: int=500,
+    random_state: int=123,
+    in_sample_residuals: bool=True
+) -> list:
+    """
+    Fit the forecaster and predict the test set of each fold in `folds`. Folds
+    are run sequentially with the same forecaster, it is the unit of work that
+    `_backtesting_forecaster_refit` sends to each job.
+    
+    Parameters
+    ----------
+    forecaster : ForecasterAutoreg, ForecasterAutoregCustom, ForecasterAutoregDirect
+        Forecaster model.
+        
+    y : pandas Series
+        Training time series.
+
+    folds : list
+        Folds to run. Each element is a tuple (fold, train_idx_start, train_idx_end,
+        steps) with the positions of the training set and the number of steps
+        predicted right after it.
+        
+    exog : pandas Series, pandas DataFrame, default `None`
+        Exogenous variable/s included as predictor/s. Must have the same
+        number of observations as `y` and should be aligned so that y[i] is
+        regressed on exog[i].
+
+    interval : list, default `None`
+        Confidence of the prediction interval estimated. If `None`, no
+        intervals are estimated.
+    
+    n_boot : int, default `500`
+        Number of bootstrapping iterations used to estimate prediction
+        intervals.
+
+    random_state : int, default `123`
+        Sets a seed to the random generator, so that boot intervals are always 
+        deterministic.
+
+    in_sample_residuals : bool, default `True`
+        If `True`, residuals from the training data are used as proxy of
+        prediction error to create prediction intervals. If `False`, out_sample_residuals
+        are used if they are already stored inside the forecaster.
+
+    Returns 
+    -------
+    fold_predictions : list
+        Predictions of each fold, in the same order as `folds`.
+    
+    """
+
+    fold_predictions = []
+
+    for fold, train_idx_start, train_idx_end, steps in folds:
+        with timed_phase('fold', fold=fold):
+            exog_train_values = exog.iloc[train_idx_start:train_idx_end, ] if exog is not None else None
+            next_window_exog = exog.iloc[train_idx_end:train_idx_end + steps, ] if exog is not None else None
+
+            forecaster.fit(y=y.iloc[train_idx_start:train_idx_end, ], exog=exog_train_values)
+
+            if interval is None:
+                pred = forecaster.predict(steps=steps, exog=next_window_exog)
+            else:
+                pred = forecaster.predict_interval(
+                           steps               = steps,
+                           exog                = next_window_exog,
+                           interval            = interval,
+                           n_boot              = n_boot,
+                           random_state        = random_state,
+                           in_sample_residuals = in_sample_residuals
+                       )
+            
+            fold_predictions.append(pred)
+
+    return fold_predictions
+
+
 def _backtesting_forecaster_refit(
     forecaster,
     y: pd.Series,
@@ -265,6 +352,7 @@ def _backtesting_forecaster_refit(
     n_boot: int=500,
     random_state: int=123,
     in_sample_residuals: bool=True,
+    n_jobs: int=1,
     verbose: bool=False
 ) -> Tuple[Union[float, list], pd.DataFrame]:
     """
@@ -336,6 +424,13 @@ def _backtesting_forecaster_refit(
         If `True`, residuals from the training data are used as proxy of
         prediction error to create prediction intervals. If `False`, out_sample_residuals
         are used if they are already stored inside the forecaster.
+
+    n_jobs : int, default `1`
+        Number of jobs used to fit and predict the folds in parallel. Folds are
+        distributed among the jobs, each job receives one copy of the forecaster.
+        If `-1`, all processors are used. If `1`, folds are run sequentially.
+        Whatever the value of `n_jobs`, folds are run on a copy of `forecaster`,
+        so the forecaster passed to the function is never fitted or modified.
             
     verbose : bool, default `False`
         Print number of folds and index of training and validation sets used for backtesting.
@@ -361,8 +456,6 @@ def _backtesting_forecaster_refit(
         metrics = [_get_metric(metric=m) if isinstance(m, str) else m for m in metric]
     else:
         metrics = metric
-
-    backtest_predictions = []
     
     folds = int(np.ceil((len(y) - initial_train_size) / steps))
     remainder = (len(y) - initial_train_size) % steps
@@ -391,35 +484,50 @@ def _backtesting_forecaster_refit(
             fixed_train_size   = fixed_train_size
         )
     
+    folds_info = []
     for i in range(folds):
         # In each iteration the model is fitted before making predictions.
         # if fixed_train_size the train size doesn't increase but moves by `steps` in each iteration.
         # if false the train size increases by `steps` in each iteration.
         train_idx_start = i * steps if fixed_train_size else 0
         train_idx_end = initial_train_size + i * steps
-
-        exog_train_values = exog.iloc[train_idx_start:train_idx_end, ] if exog is not None else None
-        next_window_exog = exog.iloc[train_idx_end:train_idx_end + steps, ] if exog is not None else None
-
-        forecaster.fit(y=y.iloc[train_idx_start:train_idx_end, ], exog=exog_train_values)
-
-        if i == folds - 1: # last fold
-            # If remainder > 0, only the remaining steps need to be predicted
-            steps = steps if remainder == 0 else remainder
-
-        if interval is None:
-            pred = forecaster.predict(steps=steps, exog=next_window_exog)
-        else:
-            pred = forecaster.predict_interval(
-                       steps               = steps,
-                       exog                = next_window_exog,
-                       interval            = interval,
-                       n_boot              = n_boot,
-                       random_state        = random_state,
-                       in_sample_residuals = in_sample_residuals
-                   )
-            
-        backtest_predictions.append(pred)
+        # If remainder > 0, only the remaining steps need to be predicted in
+        # the last fold.
+        steps_fold = remainder if (i == folds - 1 and remainder != 0) else steps
+        folds_info.append((i, train_idx_start, train_idx_end, steps_fold))
+
+    n_jobs = min(effective_n_jobs(n_jobs), folds)
+
+    if n_jobs == 1:
+        backtest_predictions = _fit_predict_folds(
+                                   forecaster          = forecaster,
+                                   y                   = y,
+                                   folds               = folds_info,
+                                   exog                = exog,
+                                   interval            = interval,
+                                   n_boot              = n_boot,
+                                   random_state        = random_state,
+                                   in_sample_residuals = in_sample_residuals
+                               )
+    else:
+        # Folds are distributed alternately among jobs so that, when the train
+        # size increases, expensive folds are not concentrated in the same job.
+        folds_jobs = Parallel(n_jobs=n_jobs)(
+                         delayed(_fit_predict_folds)(
+                             forecaster          = forecaster,
+                             y                   = y,
+                             folds               = folds_info[job::n_jobs],
+                             exog                = exog,
+                             interval            = interval,
+                             n_boot              = n_boot,
+                             random_state        = random_state,
+                             in_sample_residuals = in_sample_residuals
+                         )
+                         for job in range(n_jobs)
+                     )
+        backtest_predictions = [
+            folds_jobs[i % n_jobs][i // n_jobs] for i in range(folds)
+        ]
     
     backtest_predictions = pd.concat(backtest_predictions)
     if isinstance(backtest_predictions, pd.Series):
@@ -569,37 +677,38 @@ def _backtesting_forecaster_no_refit(
         )
 
     for i in range(folds):
-        # Since the model is only fitted with the initial_train_size, last_window
-        # and next_window_exog must be updated to include the data needed to make
-        # predictions.
-        last_window_end   = initial_train_size + i * steps
-        last_window_start = last_window_end - window_size 
-        last_window_y     = y.iloc[last_window_start:last_window_end]
-        
-        next_window_exog = exog.iloc[last_window_end:last_window_end + steps, ] if exog is not None else None
-    
-        if i == folds - 1: # last fold
-            # If remainder > 0, only the remaining steps need to be predicted
-            steps = steps if remainder == 0 else remainder
-        
-        if interval is None:
-            pred = forecaster.predict(
-                       steps       = steps,
-                       last_window = last_window_y,
-                       exog        = next_window_exog
-                   )
-        else:
-            pred = forecaster.predict_interval(
-                       steps               = steps,
-                       last_window         = last_window_y,
-                       exog                = next_window_exog,
-                       interval            = interval,
-                       n_boot              = n_boot,
-                       random_state        = random_state,
-                       in_sample_residuals = in_sample_residuals
-                   )
+        with timed_phase('fold', fold=i):
+            # Since the model is only fitted with the initial_train_size, last_window
+            # and next_window_exog must be updated to include the data needed to make
+            # predictions.
+            last_window_end   = initial_train_size + i * steps
+            last_window_start = last_window_end - window_size 
+            last_window_y     = y.iloc[last_window_start:last_window_end]
+        
+            next_window_exog = exog.iloc[last_window_end:last_window_end + steps, ] if exog is not None else None
+    
+            if i == folds - 1: # last fold
+                # If remainder > 0, only the remaining steps need to be predicted
+                steps = steps if remainder == 0 else remainder
+        
+            if interval is None:
+                pred = forecaster.predict(
+                           steps       = steps,
+                           last_window = last_window_y,
+                           exog        = next_window_exog
+                       )
+            else:
+                pred = forecaster.predict_interval(
+                           steps               = steps,
+                           last_window         = last_window_y,
+                           exog                = next_window_exog,
+                           interval            = interval,
+                           n_boot              = n_boot,
+                           random_state        = random_state,
+                           in_sample_residuals = in_sample_residuals
+                       )
             
-        backtest_predictions.append(pred)
+            backtest_predictions.append(pred)
 
     backtest_predictions = pd.concat(backtest_predictions)
     if isinstance(backtest_predictions, pd.Series):
@@ -633,6 +742,7 @@ def backtesting_forecaster(
     n_boot: int=500,
     random_state: int=123,
     in_sample_residuals: bool=True,
+    n_jobs: int=1,
     verbose: bool=False
 ) -> Tuple[Union[float, list], pd.DataFrame]:
     """
@@ -705,6 +815,13 @@ def backtesting_forecaster(
         If `True`, residuals from the training data are used as proxy of
         prediction error to create prediction intervals.  If `False`, out_sample_residuals
         are used if they are already stored inside the forecaster.
+
+    n_jobs : int, default `1`
+        Number of jobs used to fit and predict the folds in parallel. Only used
+        if `refit` is `True`. If `-1`, all processors are used. Whatever the 
+        value of `n_jobs`, backtesting is run on a copy of `forecaster`, so the
+        forecaster passed to the function is never fitted or modified.
+        **New in version 0.7.0**
                   
     verbose : bool, default `False`
         Print number of folds and index of training and validation sets used for backtesting.
@@ -781,6 +898,7 @@ def backtesting_forecaster(
             n_boot              = n_boot,
             random_state        = random_state,
             in_sample_residuals = in_sample_residuals,
+            n_jobs              = n_jobs,
             verbose             = verbose
         )
     else:
@@ -813,6 +931,7 @@ def grid_search_forecaster(
     lags_grid: Optional[list]=None,
     refit: bool=False,
     return_best: bool=True,
+    n_jobs: int=1,
     verbose: bool=True
 ) -> pd.DataFrame:
     """
@@ -867,6 +986,13 @@ def grid_search_forecaster(
         
     return_best : bool, default `True`
         Refit the `forecaster` using the best found parameters on the whole data.
+
+    n_jobs : int, default `1`
+        Number of jobs used to evaluate the combinations of lags and parameters
+        in parallel. Each job evaluates a group of parameters with the same lags
+        using its own copy of the forecaster, so training matrices are reused
+        within the job. If `-1`, all processors are used.
+        **New in version 0.7.0**
         
     verbose : bool, default `True`
         Print number of folds used for cv or backtesting.
@@ -896,6 +1022,7 @@ def grid_search_forecaster(
         lags_grid           = lags_grid,
         refit               = refit,
         return_best         = return_best,
+        n_jobs              = n_jobs,
         verbose             = verbose
     )
 
@@ -916,6 +1043,7 @@ def random_search_forecaster(
     n_iter: int=10,
     random_state: int=123,
     return_best: bool=True,
+    n_jobs: int=1,
     verbose: bool=True
 ) -> pd.DataFrame:
     """
@@ -977,6 +1105,13 @@ def random_search_forecaster(
 
     return_best : bool, default `True`
         Refit the `forecaster` using the best found parameters on the whole data.
+
+    n_jobs : int, default `1`
+        Number of jobs used to evaluate the combinations of lags and parameters
+        in parallel. Each job evaluates a group of parameters with the same lags
+        using its own copy of the forecaster, so training matrices are reused
+        within the job. If `-1`, all processors are used.
+        **New in version 0.7.0**
         
     verbose : bool, default `True`
         Print number of folds used for cv or backtesting.
@@ -1006,12 +1141,127 @@ def random_search_forecaster(
         lags_grid           = lags_grid,
         refit               = refit,
         return_best         = return_best,
+        n_jobs              = n_jobs,
         verbose             = verbose
     )
 
     return results
 
 
+def _evaluate_candidate(
+    forecaster,
+    lags: Any,
+    params: dict,
+    y: pd.Series,
+    steps: int,
+    metric: list,
+    initial_train_size: int,
+    fixed_train_size: bool=True,
+    exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
+    refit: bool=False,
+    verbose: bool=True
+) -> list:
+    """
+    Set `lags` and `params` in the forecaster and evaluate them using time
+    series backtesting. The forecaster is modified in place.
+    
+    Parameters
+    ----------
+    forecaster : ForecasterAutoreg, ForecasterAutoregCustom, ForecasterAutoregDirect
+        Forcaster model.
+
+    lags : numpy ndarray, str
+        Lags to evaluate. Ignored if forecaster is an instance of 
+        `ForecasterAutoregCustom`.
+
+    params : dict
+        Parameters of the regressor to evaluate.
+        
+    y : pandas Series
+        Training time series values. 
+
+    steps : int
+        Number of steps to predict.
+        
+    metric : list
+        Metrics used to quantify the goodness of fit of the model.
+
+    initial_train_size : int 
+        Number of samples in the initial train split.
+ 
+    fixed_train_size : bool, default `True`
+        If True, train size doesn't increase but moves by `steps` in each iteration.
+
+    exog : pandas Series, pandas DataFrame, default `None`
+        Exogenous variable/s included as predictor/s. Must have the same
+        number of observations as `y` and should be aligned so that y[i] is
+        regressed on exog[i].
+        
+    refit : bool, default `False`
+        Whether to re-fit the forecaster in each iteration of backtesting.
+        
+    verbose : bool, default `True`
+        Print number of folds used for cv or backtesting.
+
+    Returns 
+    -------
+    metrics_values : list
+        Value of each metric.
+
+    """
+
+    if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
+        forecaster.set_lags(lags)
+    forecaster.set_params(**params)
+
+    metrics_values = backtesting_forecaster(
+                         forecaster         = forecaster,
+                         y                  = y,
+                         steps              = steps,
+                         metric             = metric,
+                         initial_train_size = initial_train_size,
+                         fixed_train_size   = fixed_train_size,
+                         exog               = exog,
+                         refit              = refit,
+                         interval           = None,
+                         verbose            = verbose
+                     )[0]
+
+    return metrics_values
+
+
+def _evaluate_candidates_job(
+    forecaster,
+    lags: Any,
+    params_list: list,
+    **kwargs
+) -> list:
+    """
+    Run `_evaluate_candidate` in a parallel job for all the parameters in 
+    `params_list`, evaluated with the same `lags`. The job uses its own copy of
+    the forecaster with its own `TrainMatrixCache`, so training matrices are
+    created once per job. Warnings filters are not shared with the workers, so
+    the warning about the number of fits, ignored by the sequential loop after
+    the first candidate, is ignored here.
+    """
+
+    forecaster = deepcopy(forecaster)
+    forecaster._train_matrix_cache = TrainMatrixCache()
+    metrics_list = []
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=RuntimeWarning, message= "The forecaster will be fit.*")
+        for params in params_list:
+            metrics_values = _evaluate_candidate(
+                                 forecaster = forecaster,
+                                 lags       = lags,
+                                 params     = params,
+                                 **kwargs
+                             )
+            metrics_list.append(metrics_values)
+
+    return metrics_list
+
+
 def _evaluate_grid_hyperparameters(
     forecaster,
     y: pd.Series,
@@ -1024,6 +1274,7 @@ def _evaluate_grid_hyperparameters(
     lags_grid: Optional[list]=None,
     refit: bool=False,
     return_best: bool=True,
+    n_jobs: int=1,
     verbose: bool=True
 ) -> pd.DataFrame:
     """
@@ -1077,6 +1328,13 @@ def _evaluate_grid_hyperparameters(
         
     return_best : bool, default `True`
         Refit the `forecaster` using the best found parameters on the whole data.
+
+    n_jobs : int, default `1`
+        Number of jobs used to evaluate the combinations of lags and parameters
+        in parallel. Each job evaluates a group of parameters with the same lags
+        using its own copy of the forecaster, so training matrices are reused
+        within the job. If `-1`, all processors are used.
+        **New in version 0.7.0**
         
     verbose : bool, default `True`
         Print number of folds used for cv or backtesting.
@@ -1121,33 +1379,91 @@ def _evaluate_grid_hyperparameters(
 
     print(f"Number of models compared: {len(param_grid)*len(lags_grid)}.")
 
-    for lags in tqdm(lags_grid, desc='loop lags_grid', position=0, ncols=90):
-        
-        if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
-            forecaster.set_lags(lags)
-            lags = forecaster.lags.copy()
-        
-        for params in tqdm(param_grid, desc='loop param_grid', position=1, leave=False, ncols=90):
-
-            forecaster.set_params(**params)
-            metrics_values = backtesting_forecaster(
-                                 forecaster         = forecaster,
-                                 y                  = y,
-                                 steps              = steps,
-                                 metric             = metric,
-                                 initial_train_size = initial_train_size,
-                                 fixed_train_size   = fixed_train_size,
-                                 exog               = exog,
-                                 refit              = refit,
-                                 interval           = None,
-                                 verbose            = verbose
-                             )[0]
-            warnings.filterwarnings('ignore', category=RuntimeWarning, message= "The forecaster will be fit.*")
-            lags_list.append(lags)
-            params_list.append(params)
-            for m, m_value in zip(metric, metrics_values):
-                m_name = m if isinstance(m, str) else m.__name__
-                metric_dict[m_name].append(m_value)
+    metrics_list = []
+    n_jobs = effective_n_jobs(n_jobs)
+
+    if n_jobs == 1:
+
+        # Training matrices only depend on lags, transformers and data, so they
+        # are created once and reused for all the parameters evaluated.
+        forecaster._train_matrix_cache = TrainMatrixCache()
+        try:
+            for lags in tqdm(lags_grid, desc='loop lags_grid', position=0, ncols=90):
+            
+                if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
+                    forecaster.set_lags(lags)
+                    lags = forecaster.lags.copy()
+            
+                for params in tqdm(param_grid, desc='loop param_grid', position=1, leave=False, ncols=90):
+
+                    metrics_values = _evaluate_candidate(
+                                         forecaster         = forecaster,
+                                         lags               = lags,
+                                         params             = params,
+                                         y                  = y,
+                                         steps              = steps,
+                                         metric             = metric,
+                                         initial_train_size = initial_train_size,
+                                         fixed_train_size   = fixed_train_size,
+                                         exog               = exog,
+                                         refit              = refit,
+                                         verbose            = verbose
+                                     )
+                    warnings.filterwarnings('ignore', category=RuntimeWarning, message= "The forecaster will be fit.*")
+                    lags_list.append(lags)
+                    params_list.append(params)
+                    metrics_list.append(metrics_values)
+        finally:
+            # The cache is removed even if the search fails or is interrupted.
+            forecaster._train_matrix_cache = None
+
+    else:
+
+        # Parameters of each lags are split in groups, at least `n_jobs` jobs 
+        # are created. Each job evaluates a group with its own training matrix
+        # cache.
+        param_grid = list(param_grid)
+        n_groups = min(int(np.ceil(n_jobs / len(lags_grid))), len(param_grid))
+        jobs = []
+        for lags in lags_grid:
+            if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
+                forecaster.set_lags(lags)
+                lags = forecaster.lags.copy()
+            for params_group in np.array_split(np.arange(len(param_grid)), n_groups):
+                params_group = [param_grid[i] for i in params_group]
+                jobs.append((lags, params_group))
+                lags_list.extend([lags] * len(params_group))
+                params_list.extend(params_group)
+
+        # Jobs are dispatched in batches so that the progress bar is updated
+        # when their evaluation has finished, not when they are sent.
+        with Parallel(n_jobs=n_jobs) as parallel:
+            with tqdm(total=len(params_list), desc='loop candidates', ncols=90) as pbar:
+                for start in range(0, len(jobs), n_jobs):
+                    metrics_batch = parallel(
+                        delayed(_evaluate_candidates_job)(
+                            forecaster         = forecaster,
+                            lags               = lags,
+                            params_list        = params_group,
+                            y                  = y,
+                            steps              = steps,
+                            metric             = metric,
+                            initial_train_size = initial_train_size,
+                            fixed_train_size   = fixed_train_size,
+                            exog               = exog,
+                            refit              = refit,
+                            verbose            = verbose
+                        )
+                        for lags, params_group in jobs[start:start + n_jobs]
+                    )
+                    for metrics_job in metrics_batch:
+                        metrics_list.extend(metrics_job)
+                        pbar.update(len(metrics_job))
+
+    for metrics_values in metrics_list:
+        for m, m_value in zip(metric, metrics_values):
+            m_name = m if isinstance(m, str) else m.__name__
+            metric_dict[m_name].append(m_value)
 
     results = pd.DataFrame({
                  'lags'  : lags_list,
@@ -1520,50 +1836,57 @@ def _bayesian_search_optuna(
          {n_trials} bayesian search in each lag configuration."""
     )
 
-    for lags in tqdm(lags_grid, desc='loop lags_grid', position=0, ncols=90):
+    # Training matrices only depend on lags, transformers and data, so they
+    # are created once and reused for all the parameters evaluated.
+    forecaster._train_matrix_cache = TrainMatrixCache()
+    try:
+        for lags in tqdm(lags_grid, desc='loop lags_grid', position=0, ncols=90):
                 
-        metric_values = [] # This variable will be modified inside _objective function. 
-        # It is a trick to extract multiple values from _objective function since
-        # only the optimized value can be returned.
+            metric_values = [] # This variable will be modified inside _objective function. 
+            # It is a trick to extract multiple values from _objective function since
+            # only the optimized value can be returned.
 
-        if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
-            forecaster.set_lags(lags)
-            lags = forecaster.lags.copy()
+            if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
+                forecaster.set_lags(lags)
+                lags = forecaster.lags.copy()
         
-        if 'sampler' in kwargs_create_study.keys():
-            kwargs_create_study['sampler']._rng = np.random.RandomState(random_state)
-            kwargs_create_study['sampler']._random_sampler = RandomSampler(seed=random_state)    
+            if 'sampler' in kwargs_create_study.keys():
+                kwargs_create_study['sampler']._rng = np.random.RandomState(random_state)
+                kwargs_create_study['sampler']._random_sampler = RandomSampler(seed=random_state)    
 
-        study = optuna.create_study(**kwargs_create_study)
+            study = optuna.create_study(**kwargs_create_study)
 
-        if 'sampler' not in kwargs_create_study.keys():
-            study.sampler = TPESampler(seed=random_state)
+            if 'sampler' not in kwargs_create_study.keys():
+                study.sampler = TPESampler(seed=random_state)
 
-        study.optimize(_objective, n_trials=n_trials, **kwargs_study_optimize)
+            study.optimize(_objective, n_trials=n_trials, **kwargs_study_optimize)
 
-        best_trial = study.best_trial
+            best_trial = study.best_trial
 
-        if search_space(best_trial).keys() != best_trial.params.keys():
-            raise ValueError(
-                f"""Some of the key values do not match the search_space key names.
+            if search_space(best_trial).keys() != best_trial.params.keys():
+                raise ValueError(
+                    f"""Some of the key values do not match the search_space key names.
                 Dict keys     : {list(search_space(best_trial).keys())}
                 Trial objects : {list(best_trial.params.keys())}."""
-            )
+                )
         
-        for i, trial in enumerate(study.get_trials()):
-            params_list.append(trial.params)
-            lags_list.append(lags)
+            for i, trial in enumerate(study.get_trials()):
+                params_list.append(trial.params)
+                lags_list.append(lags)
 
-            for m, m_values in zip(metric, metric_values[i]):
-                m_name = m if isinstance(m, str) else m.__name__
-                metric_dict[m_name].append(m_values)
+                for m, m_values in zip(metric, metric_values[i]):
+                    m_name = m if isinstance(m, str) else m.__name__
+                    metric_dict[m_name].append(m_values)
         
-        if results_opt_best is None:
-            results_opt_best = best_trial
-        else:
-            if best_trial.value < results_opt_best.value:
+            if results_opt_best is None:
                 results_opt_best = best_trial
-        
+            else:
+                if best_trial.value < results_opt_best.value:
+                    results_opt_best = best_trial
+    finally:
+        # The cache is removed even if the search fails or is interrupted.
+        forecaster._train_matrix_cache = None
+
     results = pd.DataFrame({
                 'lags'  : lags_list,
                 'params': params_list,
@@ -1759,41 +2082,48 @@ def _bayesian_search_skopt(
          {n_trials} bayesian search in each lag configuration."""
     )
 
-    for lags in tqdm(lags_grid, desc='loop lags_grid', position=0, ncols=90):
-
-        metric_values = [] # This variable will be modified inside _objective function. 
-        # It is a trick to extract multiple values from _objective function since
-        # only the optimized value can be returned.
-        
-        if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
-            forecaster.set_lags(lags)
-            lags = forecaster.lags.copy()
-        
-        results_opt = gp_minimize(
-                        func         = _objective,
-                        dimensions   = search_space,
-                        n_calls      = n_trials,
-                        random_state = random_state,
-                        **kwargs_gp_minimize
-                      )
-
-        for i in range(len(results_opt.x_iters)):
-            params = {param.name: results_opt.x_iters[i][j] 
-                      for j, param in enumerate(search_space)}
+    # Training matrices only depend on lags, transformers and data, so they
+    # are created once and reused for all the parameters evaluated.
+    forecaster._train_matrix_cache = TrainMatrixCache()
+    try:
+        for lags in tqdm(lags_grid, desc='loop lags_grid', position=0, ncols=90):
+
+            metric_values = [] # This variable will be modified inside _objective function. 
+            # It is a trick to extract multiple values from _objective function since
+            # only the optimized value can be returned.
+        
+            if type(forecaster).__name__ in ['ForecasterAutoreg', 'ForecasterAutoregDirect']:
+                forecaster.set_lags(lags)
+                lags = forecaster.lags.copy()
+        
+            results_opt = gp_minimize(
+                            func         = _objective,
+                            dimensions   = search_space,
+                            n_calls      = n_trials,
+                            random_state = random_state,
+                            **kwargs_gp_minimize
+                          )
+
+            for i in range(len(results_opt.x_iters)):
+                params = {param.name: results_opt.x_iters[i][j] 
+                          for j, param in enumerate(search_space)}
  
-            params_list.append(params)
-            lags_list.append(lags)
+                params_list.append(params)
+                lags_list.append(lags)
 
-            for m, m_values in zip(metric, metric_values[i]):
-                m_name = m if isinstance(m, str) else m.__name__
-                metric_dict[m_name].append(m_values)
+                for m, m_values in zip(metric, metric_values[i]):
+                    m_name = m if isinstance(m, str) else m.__name__
+                    metric_dict[m_name].append(m_values)
 
-        if results_opt_best is None:
-            results_opt_best = results_opt
-        else:
-            if results_opt.fun < results_opt_best.fun:
+            if results_opt_best is None:
                 results_opt_best = results_opt
-        
+            else:
+                if results_opt.fun < results_opt_best.fun:
+                    results_opt_best = results_opt
+    finally:
+        # The cache is removed even if the search fails or is interrupted.
+        forecaster._train_matrix_cache = None
+
     results = pd.DataFrame({
                   'lags'  : lags_list,
                   'params': params_list,
@@ -1,5 +1,6 @@
 # Unit test _backtesting_forecaster_refit
 # ==============================================================================
+import pytest
 import numpy as np
 import pandas as pd
 from pytest import approx
@@ -736,4 +737,104 @@ def test_output_backtesting_forecaster_refit_fixed_train_size_yes_exog_yes_remai
                                    )
                                    
     assert expected_metric == approx(metric)
-    pd.testing.assert_frame_equal(expected_predictions, backtest_predictions)
\ No newline at end of file
+    pd.testing.assert_frame_equal(expected_predictions, backtest_predictions)
+
+# ******************************************************************************
+# * Parallel folds (n_jobs)                                                    *
+# ******************************************************************************
+
+def test_output_backtesting_forecaster_refit_interval_yes_exog_yes_remainder_n_jobs_2_with_mocked():
+    """
+    Test output of _backtesting_forecaster_refit with backtesting mocked, interval yes,
+    n_jobs=2. Folds are run in parallel and predictions must be returned in fold order.
+    Regressor is LinearRegression with lags=3, Series y is mocked, exog is mocked, 
+    12 observations to backtest, steps=5 (2 remainder), metric='mean_squared_error',
+    'in_sample_residuals = True'
+    """
+    expected_metric = 0.061723961096013524
+    expected_predictions = pd.DataFrame({
+    'pred':np.array([0.59059622, 0.47257504, 0.53024098, 0.46163343, 0.50035119, 0.43595809,
+                     0.4349167 , 0.42381237, 0.55165332, 0.53442833, 0.65361802, 0.51297419]),
+    'lower_bound':np.array([0.24619375, 0.10545295, 0.13120713, 0.08044217, 0.13725077, 0.08041239,
+                            0.05015513, 0.07677812, 0.17434611, 0.16051962, 0.29167326, 0.15775686]),
+    'upper_bound':np.array([0.95777604, 0.88685543, 0.90755063, 0.87811336, 0.86891022, 0.74808834,
+                            0.80296989, 0.77919033, 0.97680126, 0.8877086 , 1.07608747, 0.90555785])                                                                 
+                                                                         }, index=np.arange(38, 50))
+
+    forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=3)
+
+    n_backtest = 12
+    y_train = y[:-n_backtest]
+
+    metric, backtest_predictions = _backtesting_forecaster_refit(
+                                        forecaster          = forecaster,
+                                        y                   = y,
+                                        exog                = exog,
+                                        initial_train_size  = len(y_train),
+                                        fixed_train_size    = False,
+                                        steps               = 5,
+                                        metric              = 'mean_squared_error',
+                                        interval            = [5, 95],
+                                        n_boot              = 500,
+                                        random_state        = 123,
+                                        in_sample_residuals = True,
+                                        n_jobs              = 2,
+                                        verbose             = False
+                                   )
+
+    assert expected_metric == approx(metric)
+    pd.testing.assert_frame_equal(expected_predictions, backtest_predictions)
+
+
+def test_output_backtesting_forecaster_refit_n_jobs_2_equal_to_n_jobs_1_when_more_folds_than_jobs():
+    """
+    Test output of _backtesting_forecaster_refit with n_jobs=2 is the same as 
+    with n_jobs=1 when there are more folds than jobs (several folds per job).
+    ForecasterAutoregDirect with lags=3, exog is mocked, fixed_train_size=True,
+    12 observations to backtest, steps=2 (6 folds).
+    """
+    forecaster = ForecasterAutoregDirect(regressor=LinearRegression(), lags=3, steps=2)
+
+    kwargs = dict(
+        forecaster          = forecaster,
+        y                   = y,
+        exog                = exog,
+        initial_train_size  = 38,
+        fixed_train_size    = True,
+        steps               = 2,
+        metric              = 'mean_squared_error',
+        verbose             = False
+    )
+    metric_1, backtest_predictions_1 = _backtesting_forecaster_refit(n_jobs=1, **kwargs)
+    metric_2, backtest_predictions_2 = _backtesting_forecaster_refit(n_jobs=2, **kwargs)
+
+    assert metric_1 == approx(metric_2)
+    pd.testing.assert_frame_equal(backtest_predictions_1, backtest_predictions_2)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2], ids = lambda n: f'n_jobs: {n}')
+def test_backtesting_forecaster_refit_does_not_modify_forecaster(n_jobs):
+    """
+    Test _backtesting_forecaster_refit runs the folds on a copy of the forecaster,
+    so the forecaster passed is neither fitted nor modified, whatever the value
+    of n_jobs.
+    """
+    forecaster = ForecasterAutoreg(regressor=LinearRegression(), lags=3)
+    forecaster.fit(y=y[:20])
+    last_window = forecaster.last_window.copy()
+    coef = forecaster.regressor.coef_.copy()
+
+    _backtesting_forecaster_refit(
+        forecaster          = forecaster,
+        y                   = y,
+        initial_train_size  = 38,
+        fixed_train_size    = False,
+        steps               = 5,
+        metric              = 'mean_squared_error',
+        n_jobs              = n_jobs,
+        verbose             = False
+    )
+
+    pd.testing.assert_series_equal(forecaster.last_window, last_window)
+    np.testing.assert_array_equal(forecaster.regressor.coef_, coef)
+
@@ -344,4 +344,132 @@ def test_evaluate_grid_hyperparameters_when_return_best_and_list_metrics():
     expected_alpha = 1.
     
     assert (expected_lags == forecaster.lags).all()
-    assert expected_alpha == forecaster.regressor.alpha
\ No newline at end of file
+    assert expected_alpha == forecaster.regressor.alpha
+
+def test_output_evaluate_grid_hyperparameters_ForecasterAutoreg_metric_list_n_jobs_2_with_mocked():
+    """
+    Test output of _evaluate_grid_hyperparameters in ForecasterAutoreg with mocked,
+    multiple metrics and n_jobs=2. Results must be the same as when the
+    candidates are evaluated sequentially (mocked done in Skforecast v0.4.3).
+    """
+    forecaster = ForecasterAutoreg(
+                    regressor = Ridge(random_state=123),
+                    lags      = 2 # Placeholder, the value will be overwritten
+                 )
+
+    steps = 3
+    n_validation = 12
+    y_train = y[:-n_validation]
+    lags_grid = [2, 4]
+    param_grid = [{'alpha': 0.01}, {'alpha': 0.1}, {'alpha': 1}]
+    idx = len(lags_grid)*len(param_grid)
+
+    results = _evaluate_grid_hyperparameters(
+                            forecaster  = forecaster,
+                            y           = y,
+                            lags_grid   = lags_grid,
+                            param_grid  = param_grid,
+                            steps       = steps,
+                            refit       = False,
+                            metric      = ['mean_squared_error', mean_absolute_error],
+                            initial_train_size = len(y_train),
+                            fixed_train_size   = False,
+                            return_best = False,
+                            n_jobs      = 2,
+                            verbose     = False
+              )
+    
+    expected_results = pd.DataFrame({
+                            'lags'  : [[1, 2], [1, 2], [1, 2], [1, 2, 3, 4], 
+                                       [1, 2, 3, 4], [1, 2, 3, 4]],
+                            'params': [{'alpha': 0.01}, {'alpha': 0.1}, {'alpha': 1}, 
+                                       {'alpha': 0.01}, {'alpha': 0.1}, {'alpha': 1}],
+                            'mean_squared_error': np.array([0.06464646, 0.06502362, 0.06745534, 
+                                                            0.06779272, 0.06802481, 0.06948609]),   
+                            'mean_absolute_error': np.array([0.20278812, 0.20314819, 0.20519952, 
+                                                             0.20601567, 0.206323, 0.20747017]),                                                          
+                            'alpha': np.array([0.01, 0.1 , 1.  , 0.01, 0.1 , 1.  ])},
+                            index = np.arange(idx)
+                       )
+
+    pd.testing.assert_frame_equal(results, expected_results)
+
+
+def test_output_evaluate_grid_hyperparameters_ForecasterAutoregCustom_n_jobs_2_with_mocked():
+    """
+    Test output of _evaluate_grid_hyperparameters in ForecasterAutoregCustom with mocked
+    and n_jobs=2 (mocked done in Skforecast v0.4.3).
+    """
+    def create_predictors(y):
+        """
+        Create first 4 lags of a time series, used in ForecasterAutoregCustom.
+        """
+
+        lags = y[-1:-5:-1]
+
+        return lags
+    
+    forecaster = ForecasterAutoregCustom(
+                        regressor      = Ridge(random_state=123),
+                        fun_predictors = create_predictors,
+                        window_size    = 4
+                 )
+
+    steps = 3
+    n_validation = 12
+    y_train = y[:-n_validation]
+    param_grid = [{'alpha': 0.01}, {'alpha': 0.1}, {'alpha': 1}]
+    idx = len(param_grid)
+
+    results = _evaluate_grid_hyperparameters(
+                            forecaster  = forecaster,
+                            y           = y,
+                            param_grid  = param_grid,
+                            steps       = steps,
+                            refit       = False,
+                            metric      = 'mean_squared_error',
+                            initial_train_size = len(y_train),
+                            fixed_train_size   = False,
+                            return_best = False,
+                            n_jobs      = 2,
+                            verbose     = False
+              )
+    
+    expected_results = pd.DataFrame({
+            'lags'  :['custom predictors', 'custom predictors', 'custom predictors'],
+            'params':[{'alpha': 0.01}, {'alpha': 0.1}, {'alpha': 1}],
+            'mean_squared_error':np.array([0.06779272, 0.06802481, 0.06948609]),                                                               
+            'alpha' :np.array([0.01, 0.1 , 1.])
+                                     },
+            index=np.arange(idx)
+                                   )
+    
+    pd.testing.assert_frame_equal(results, expected_results)
+
+
+def test_evaluate_grid_hyperparameters_train_matrix_cache_removed_when_candidate_raises():
+    """
+    Test the TrainMatrixCache is removed from the forecaster when the 
+    evaluation of a candidate raises an exception.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor = Ridge(random_state=123),
+                     lags      = 2
+                 )
+
+    with pytest.raises(Exception):
+        _evaluate_grid_hyperparameters(
+            forecaster         = forecaster,
+            y                  = y,
+            lags_grid          = [2, 4],
+            param_grid         = [{'alpha': 0.01}, {'alpha': 'not_valid'}],
+            steps              = 3,
+            refit              = False,
+            metric             = 'mean_squared_error',
+            initial_train_size = len(y)-12,
+            fixed_train_size   = False,
+            return_best        = False,
+            verbose            = False
+        )
+
+    assert forecaster._train_matrix_cache is None
@@ -19,6 +19,7 @@ from sklearn.exceptions import NotFittedError
 
 from ..model_selection.model_selection import _get_metric
 from ..model_selection.model_selection import _backtesting_forecaster_verbose
+from ..utils import timed_phase
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -180,43 +181,44 @@ def _backtesting_forecaster_multiseries_refit(
     store_in_sample_residuals = False if interval is None else True
 
     for i in range(folds):
-        # In each iteration the model is fitted before making predictions.
-        # if fixed_train_size the train size doesn't increase but moves by `steps` in each iteration.
-        # if false the train size increases by `steps` in each iteration.
-        train_idx_start = i * steps if fixed_train_size else 0
-        train_idx_end = initial_train_size + i * steps
+        with timed_phase('fold', fold=i):
+            # In each iteration the model is fitted before making predictions.
+            # if fixed_train_size the train size doesn't increase but moves by `steps` in each iteration.
+            # if false the train size increases by `steps` in each iteration.
+            train_idx_start = i * steps if fixed_train_size else 0
+            train_idx_end = initial_train_size + i * steps
         
-        exog_train_values = exog.iloc[train_idx_start:train_idx_end, ] if exog is not None else None
-        next_window_exog = exog.iloc[train_idx_end:train_idx_end + steps, ] if exog is not None else None
+            exog_train_values = exog.iloc[train_idx_start:train_idx_end, ] if exog is not None else None
+            next_window_exog = exog.iloc[train_idx_end:train_idx_end + steps, ] if exog is not None else None
 
-        forecaster.fit(
-            series                    = series.iloc[train_idx_start:train_idx_end, ], 
-            exog                      = exog_train_values,
-            store_in_sample_residuals = store_in_sample_residuals
-        )
+            forecaster.fit(
+                series                    = series.iloc[train_idx_start:train_idx_end, ], 
+                exog                      = exog_train_values,
+                store_in_sample_residuals = store_in_sample_residuals
+            )
 
-        if i == folds - 1: # last fold
-            # If remainder > 0, only the remaining steps need to be predicted
-            steps = steps if remainder == 0 else remainder
-
-        if interval is None:
-            pred = forecaster.predict(
-                       steps       = steps, 
-                       levels      = levels, 
-                       exog        = next_window_exog
-                   )
-        else:
-            pred = forecaster.predict_interval(
-                       steps               = steps,
-                       levels              = levels, 
-                       exog                = next_window_exog,
-                       interval            = interval,
-                       n_boot              = n_boot,
-                       random_state        = random_state,
-                       in_sample_residuals = in_sample_residuals
-                   )
-
-        backtest_predictions.append(pred)
+            if i == folds - 1: # last fold
+                # If remainder > 0, only the remaining steps need to be predicted
+                steps = steps if remainder == 0 else remainder
+
+            if interval is None:
+                pred = forecaster.predict(
+                           steps       = steps, 
+                           levels      = levels, 
+                           exog        = next_window_exog
+                       )
+            else:
+                pred = forecaster.predict_interval(
+                           steps               = steps,
+                           levels              = levels, 
+                           exog                = next_window_exog,
+                           interval            = interval,
+                           n_boot              = n_boot,
+                           random_state        = random_state,
+                           in_sample_residuals = in_sample_residuals
+                       )
+
+            backtest_predictions.append(pred)
     
     backtest_predictions = pd.concat(backtest_predictions)
 
@@ -386,39 +388,40 @@ def _backtesting_forecaster_multiseries_no_refit(
         )
 
     for i in range(folds):
-        # Since the model is only fitted with the initial_train_size, last_window
-        # and next_window_exog must be updated to include the data needed to make
-        # predictions.
-        last_window_end    = initial_train_size + i * steps
-        last_window_start  = last_window_end - window_size 
-        last_window_series = series.iloc[last_window_start:last_window_end, ]
-
-        next_window_exog = exog.iloc[last_window_end:last_window_end + steps, ] if exog is not None else None
-
-        if i == folds - 1: # last fold
-            # If remainder > 0, only the remaining steps need to be predicted
-            steps = steps if remainder == 0 else remainder
-
-        if interval is None:
-            pred = forecaster.predict(
-                       steps       = steps,
-                       levels      = levels, 
-                       last_window = last_window_series,
-                       exog        = next_window_exog
-                   )
-        else:
-            pred = forecaster.predict_interval(
-                       steps               = steps,
-                       levels              = levels, 
-                       last_window         = last_window_series,
-                       exog                = next_window_exog,
-                       interval            = interval,
-                       n_boot              = n_boot,
-                       random_state        = random_state,
-                       in_sample_residuals = in_sample_residuals
-                   )
+        with timed_phase('fold', fold=i):
+            # Since the model is only fitted with the initial_train_size, last_window
+            # and next_window_exog must be updated to include the data needed to make
+            # predictions.
+            last_window_end    = initial_train_size + i * steps
+            last_window_start  = last_window_end - window_size 
+            last_window_series = series.iloc[last_window_start:last_window_end, ]
+
+            next_window_exog = exog.iloc[last_window_end:last_window_end + steps, ] if exog is not None else None
+
+            if i == folds - 1: # last fold
+                # If remainder > 0, only the remaining steps need to be predicted
+                steps = steps if remainder == 0 else remainder
+
+            if interval is None:
+                pred = forecaster.predict(
+                           steps       = steps,
+                           levels      = levels, 
+                           last_window = last_window_series,
+                           exog        = next_window_exog
+                       )
+            else:
+                pred = forecaster.predict_interval(
+                           steps               = steps,
+                           levels              = levels, 
+                           last_window         = last_window_series,
+                           exog                = next_window_exog,
+                           interval            = interval,
+                           n_boot              = n_boot,
+                           random_state        = random_state,
+                           in_sample_residuals = in_sample_residuals
+                       )
             
-        backtest_predictions.append(pred)
+            backtest_predictions.append(pred)
 
     backtest_predictions = pd.concat(backtest_predictions)
 
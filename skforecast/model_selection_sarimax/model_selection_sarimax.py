@@ -7,12 +7,14 @@
 # coding=utf-8
 
 
-from typing import Union, Tuple, Optional, Any
+from typing import Union, Tuple, Optional, Any, Callable
 import numpy as np
 import pandas as pd
+import time
 import warnings
 import logging
 from copy import deepcopy
+from joblib import Parallel, delayed, effective_n_jobs
 from tqdm import tqdm
 from sklearn.model_selection import ParameterGrid
 from sklearn.model_selection import ParameterSampler
@@ -20,6 +22,7 @@ from sklearn.exceptions import NotFittedError
 
 from ..model_selection.model_selection import _get_metric
 from ..model_selection.model_selection import _backtesting_forecaster_verbose
+from ..utils import timed_phase
 
 logging.basicConfig(
     format = '%(name)-10s %(levelname)-5s %(message)s', 
@@ -35,8 +38,11 @@ def _backtesting_sarimax_refit(
     initial_train_size: int,
     fixed_train_size: bool=True,
     exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
+    refit: Union[bool, int]=True,
     alpha: Optional[float]=None,
     interval: Optional[list]=None,
+    warm_start: bool=False,
+    fold_callback: Optional[Callable]=None,
     verbose: bool=False
 ) -> Tuple[Union[float, list], pd.DataFrame]:
     """
@@ -49,6 +55,11 @@ def _backtesting_sarimax_refit(
         - The training set increases with `steps` observations.
         - The model is re-fitted using the new training set.
 
+    If `refit` is an integer, the parameters are only re-estimated every `refit`
+    folds. In the folds in between, the observations since the previous fold are
+    appended to the statsmodels results of the last fitted model (`arima_res_.append`
+    with `refit=False`), the parameters are kept and only the state is updated.
+
     In order to apply backtesting with refit, an initial training set must be
     available, otherwise it would not be possible to increase the training set 
     after each iteration. `initial_train_size` must be provided.
@@ -88,6 +99,10 @@ def _backtesting_sarimax_refit(
         Exogenous variable/s included as predictor/s. Must have the same
         number of observations as `y` and should be aligned so that y[i] is
         regressed on exog[i].
+
+    refit : bool, int, default `True`
+        If `True`, the parameters are re-estimated in every fold. If an integer,
+        they are re-estimated every `refit` folds.
             
     alpha : float, default `0.05`
         The confidence intervals for the forecasts are (1 - alpha) %.
@@ -99,6 +114,16 @@ def _backtesting_sarimax_refit(
         0 and 100 inclusive. For example, interval of 95% should be as 
         `interval = [2.5, 97.5]`. If both, `alpha` and `interval` are 
         provided, `alpha` will be used.
+
+    warm_start : bool, default `False`
+        If `True`, the optimizer of each re-estimation starts from the parameters
+        estimated in the previous one (`start_params` of pmdarima ARIMA) instead
+        of the default initial values.
+
+    fold_callback : callable, default `None`
+        Function called after each fold with the list of predictions of the
+        folds already evaluated. If it returns `True`, the backtesting stops and
+        the metrics are computed with the predictions available.
             
     verbose : bool, default `False`
         Print number of folds and index of training and validation sets used for backtesting.
@@ -130,9 +155,10 @@ def _backtesting_sarimax_refit(
     folds = int(np.ceil((len(y) - initial_train_size) / steps))
     remainder = (len(y) - initial_train_size) % steps
     
-    if folds > 50:
+    n_fits = int(np.ceil(folds / (1 if refit is True else refit)))
+    if n_fits > 50:
         warnings.warn(
-            (f"The forecaster will be fit {folds} times. This can take substantial amounts of time. "
+            (f"The forecaster will be fit {n_fits} times. This can take substantial amounts of time. "
              f"If not feasible, try with `refit = False`. \n"),
             RuntimeWarning
         )
@@ -148,33 +174,59 @@ def _backtesting_sarimax_refit(
             fixed_train_size   = fixed_train_size
         )
     
+    refit_every = 1 if refit is True else refit
+    last_window_start = None
+
     for i in range(folds):
-        # In each iteration the model is fitted before making predictions.
-        # if fixed_train_size the train size doesn't increase but moves by `steps` in each iteration.
-        # if false the train size increases by `steps` in each iteration.
-        train_idx_start = i * steps if fixed_train_size else 0
-        train_idx_end = initial_train_size + i * steps
-
-        exog_train_values = exog.iloc[train_idx_start:train_idx_end, ] if exog is not None else None
-        next_window_exog = exog.iloc[train_idx_end:train_idx_end + steps, ] if exog is not None else None
-
-        forecaster.fit(y=y.iloc[train_idx_start:train_idx_end, ], exog=exog_train_values)
-
-        if i == folds - 1: # last fold
-            # If remainder > 0, only the remaining steps need to be predicted
-            steps = steps if remainder == 0 else remainder
-
-        if alpha is None and interval is None:
-            pred = forecaster.predict(steps=steps, exog=next_window_exog)
-        else:
-            pred = forecaster.predict_interval(
-                       steps    = steps,
-                       alpha    = alpha,
-                       interval = interval,
-                       exog     = next_window_exog,
-                   )
+        with timed_phase('fold', fold=i):
+            # In each iteration the model is fitted before making predictions.
+            # if fixed_train_size the train size doesn't increase but moves by `steps` in each iteration.
+            # if false the train size increases by `steps` in each iteration.
+            train_idx_start = i * steps if fixed_train_size else 0
+            train_idx_end = initial_train_size + i * steps
+
+            next_window_exog = exog.iloc[train_idx_end:train_idx_end + steps, ] if exog is not None else None
+
+            if i % refit_every == 0:
+                exog_train_values = exog.iloc[train_idx_start:train_idx_end, ] if exog is not None else None
+                if warm_start and i > 0:
+                    forecaster.regressor.set_params(
+                        start_params = np.asarray(forecaster.regressor.arima_res_.params)
+                    )
+                forecaster.fit(y=y.iloc[train_idx_start:train_idx_end, ], exog=exog_train_values)
+                last_window = None
+                last_window_exog = None
+            else:
+                # Parameters are not re-estimated, observations since the previous
+                # fold are appended to the model (see `ForecasterSarimax.predict`).
+                last_window = y.iloc[last_window_start:train_idx_end]
+                last_window_exog = exog.iloc[last_window_start:train_idx_end, ] if exog is not None else None
+            last_window_start = train_idx_end
+
+            if i == folds - 1: # last fold
+                # If remainder > 0, only the remaining steps need to be predicted
+                steps = steps if remainder == 0 else remainder
+
+            if alpha is None and interval is None:
+                pred = forecaster.predict(
+                           steps            = steps,
+                           last_window      = last_window,
+                           last_window_exog = last_window_exog,
+                           exog             = next_window_exog
+                       )
+            else:
+                pred = forecaster.predict_interval(
+                           steps            = steps,
+                           last_window      = last_window,
+                           last_window_exog = last_window_exog,
+                           alpha            = alpha,
+                           interval         = interval,
+                           exog             = next_window_exog,
+                       )
             
-        backtest_predictions.append(pred)
+            backtest_predictions.append(pred)
+            if fold_callback is not None and fold_callback(backtest_predictions):
+                break
     
     backtest_predictions = pd.concat(backtest_predictions)
     if isinstance(backtest_predictions, pd.Series):
@@ -204,6 +256,7 @@ def _backtesting_sarimax_no_refit(
     exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
     alpha: Optional[float]=None,
     interval: Optional[list]=None,
+    fold_callback: Optional[Callable]=None,
     verbose: bool=False
 ) -> Tuple[Union[float, list], pd.DataFrame]:
     """
@@ -260,6 +313,11 @@ def _backtesting_sarimax_no_refit(
         `interval = [2.5, 97.5]`. If both, `alpha` and `interval` are 
         provided, `alpha` will be used.
             
+    fold_callback : callable, default `None`
+        Function called after each fold with the list of predictions of the
+        folds already evaluated. If it returns `True`, the backtesting stops and
+        the metrics are computed with the predictions available.
+
     verbose : bool, default `False`
         Print number of folds and index of training and validation sets used for backtesting.
 
@@ -305,38 +363,41 @@ def _backtesting_sarimax_no_refit(
         )
 
     for i in range(folds):
-        # Since the model is only fitted with the initial_train_size, last_window
-        # and next_window_exog must be updated to include the data needed to make
-        # predictions.
-        last_window_start = initial_train_size + steps * (i-1)
-        last_window_end   = initial_train_size + steps * i
-
-        last_window_y    = y.iloc[last_window_start:last_window_end] if i != 0 else None
-        last_window_exog = exog.iloc[last_window_start:last_window_end, ] if exog is not None and i != 0 else None 
-        next_window_exog = exog.iloc[last_window_end:last_window_end + steps, ] if exog is not None else None
-    
-        if i == folds - 1: # last fold
-            # If remainder > 0, only the remaining steps need to be predicted
-            steps = steps if remainder == 0 else remainder
-        
-        if alpha is None and interval is None:
-            pred = forecaster.predict(
-                       steps            = steps,
-                       last_window      = last_window_y,
-                       last_window_exog = last_window_exog,
-                       exog             = next_window_exog
-                   )
-        else:
-            pred = forecaster.predict_interval(
-                       steps            = steps,
-                       exog             = next_window_exog,
-                       alpha            = alpha,
-                       interval         = interval,
-                       last_window      = last_window_y,
-                       last_window_exog = last_window_exog
-                   )
-        
-        backtest_predictions.append(pred)
+        with timed_phase('fold', fold=i):
+            # Since the model is only fitted with the initial_train_size, last_window
+            # and next_window_exog must be updated to include the data needed to make
+            # predictions.
+            last_window_start = initial_train_size + steps * (i-1)
+            last_window_end   = initial_train_size + steps * i
+
+            last_window_y    = y.iloc[last_window_start:last_window_end] if i != 0 else None
+            last_window_exog = exog.iloc[last_window_start:last_window_end, ] if exog is not None and i != 0 else None 
+            next_window_exog = exog.iloc[last_window_end:last_window_end + steps, ] if exog is not None else None
+    
+            if i == folds - 1: # last fold
+                # If remainder > 0, only the remaining steps need to be predicted
+                steps = steps if remainder == 0 else remainder
+        
+            if alpha is None and interval is None:
+                pred = forecaster.predict(
+                           steps            = steps,
+                           last_window      = last_window_y,
+                           last_window_exog = last_window_exog,
+                           exog             = next_window_exog
+                       )
+            else:
+                pred = forecaster.predict_interval(
+                           steps            = steps,
+                           exog             = next_window_exog,
+                           alpha            = alpha,
+                           interval         = interval,
+                           last_window      = last_window_y,
+                           last_window_exog = last_window_exog
+                       )
+        
+            backtest_predictions.append(pred)
+            if fold_callback is not None and fold_callback(backtest_predictions):
+                break
 
     backtest_predictions = pd.concat(backtest_predictions)
     if isinstance(backtest_predictions, pd.Series):
@@ -357,6 +418,58 @@ def _backtesting_sarimax_no_refit(
     return metrics_values, backtest_predictions
 
 
+def _check_backtesting_sarimax_input(
+    forecaster,
+    y: pd.Series,
+    initial_train_size: int,
+    refit: Union[bool, int]
+) -> None:
+    """
+    Check the arguments of `backtesting_sarimax`.
+
+    Parameters
+    ----------
+    forecaster : ForecasterSarimax
+        Forecaster model.
+
+    y : pandas Series
+        Training time series.
+
+    initial_train_size : int
+        Number of samples in the initial train split.
+
+    refit : bool, int
+        Whether to re-fit the forecaster in each iteration, or every `refit`
+        iterations.
+
+    Returns
+    -------
+    None
+
+    """
+
+    if initial_train_size is None:
+        raise ValueError(
+            '`initial_train_size` must be an int smaller than the length of `y`.'
+        )
+
+    if initial_train_size is not None and initial_train_size >= len(y):
+        raise ValueError(
+            '`initial_train_size` must be an int smaller than the length of `y`.'
+        )
+        
+    if initial_train_size is not None and initial_train_size < forecaster.window_size:
+        raise ValueError(
+            (f"`initial_train_size` must be greater than "
+             f"forecaster's window_size ({forecaster.window_size}).")
+        )
+
+    if not isinstance(refit, (bool, int)) or (not isinstance(refit, bool) and refit < 1):
+        raise TypeError(
+            f'`refit` must be boolean (`True`, `False`) or an integer greater than 0. Got {refit}.'
+        )
+
+
 def backtesting_sarimax(
     forecaster,
     y: pd.Series,
@@ -365,9 +478,10 @@ def backtesting_sarimax(
     initial_train_size: int,
     fixed_train_size: bool=True,
     exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
-    refit: bool=False,
+    refit: Union[bool, int]=False,
     alpha: Optional[float]=None,
     interval: Optional[list]=None,
+    warm_start: bool=False,
     verbose: bool=False
 ) -> Tuple[Union[float, list], pd.DataFrame]:
     """
@@ -375,8 +489,10 @@ def backtesting_sarimax(
 
     If `refit` is False, the model is trained only once using the `initial_train_size`
     first observations. If `refit` is True, the model is trained in each iteration
-    increasing the training set. A copy of the original forecaster is created so 
-    it is not modified during the process.
+    increasing the training set. If `refit` is an integer, the model is trained
+    every `refit` iterations and, in the iterations in between, the new observations
+    are appended to the fitted model without re-estimating its parameters. A copy
+    of the original forecaster is created so it is not modified during the process.
 
     Parameters
     ----------
@@ -414,8 +530,10 @@ def backtesting_sarimax(
         number of observations as `y` and should be aligned so that y[i] is
         regressed on exog[i].
 
-    refit : bool, default `False`
-        Whether to re-fit the forecaster in each iteration.
+    refit : bool, int, default `False`
+        Whether to re-fit the forecaster in each iteration. If an integer, the
+        forecaster is re-fitted every `refit` iterations.
+        **Changed in version 0.7.0**
             
     alpha : float, default `0.05`
         The confidence intervals for the forecasts are (1 - alpha) %.
@@ -427,6 +545,14 @@ def backtesting_sarimax(
         0 and 100 inclusive. For example, interval of 95% should be as 
         `interval = [2.5, 97.5]`. If both, `alpha` and `interval` are 
         provided, `alpha` will be used.
+
+    warm_start : bool, default `False`
+        Only used when `refit` is not `False`. If `True`, the optimizer of each
+        re-fit starts from the parameters estimated in the previous one instead
+        of the default initial values of pmdarima ARIMA (`start_params`). It
+        usually needs fewer iterations since consecutive folds share most of 
+        their data.
+        **New in version 0.7.0**
                   
     verbose : bool, default `False`
         Print number of folds and index of training and validation sets used for backtesting.
@@ -444,26 +570,12 @@ def backtesting_sarimax(
     
     """
 
-    if initial_train_size is None:
-        raise ValueError(
-            '`initial_train_size` must be an int smaller than the length of `y`.'
-        )
-
-    if initial_train_size is not None and initial_train_size >= len(y):
-        raise ValueError(
-            '`initial_train_size` must be an int smaller than the length of `y`.'
-        )
-        
-    if initial_train_size is not None and initial_train_size < forecaster.window_size:
-        raise ValueError(
-            (f"`initial_train_size` must be greater than "
-             f"forecaster's window_size ({forecaster.window_size}).")
-        )
-
-    if not isinstance(refit, bool):
-        raise TypeError(
-            f'`refit` must be boolean: `True`, `False`.'
-        )
+    _check_backtesting_sarimax_input(
+        forecaster         = forecaster,
+        y                  = y,
+        initial_train_size = initial_train_size,
+        refit              = refit
+    )
     
     if refit:
         metrics_values, backtest_predictions = _backtesting_sarimax_refit(
@@ -474,8 +586,10 @@ def backtesting_sarimax(
             initial_train_size  = initial_train_size,
             fixed_train_size    = fixed_train_size,
             exog                = exog,
+            refit               = refit,
             alpha               = alpha,
             interval            = interval,
+            warm_start          = warm_start,
             verbose             = verbose
         )
     else:
@@ -503,8 +617,11 @@ def grid_search_sarimax(
     initial_train_size: int,
     fixed_train_size: bool=True,
     exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
-    refit: bool=False,
+    refit: Union[bool, int]=False,
     return_best: bool=True,
+    n_jobs: int=1,
+    abandon_margin: Optional[float]=None,
+    candidate_timeout: Optional[float]=None,
     verbose: bool=True
 ) -> pd.DataFrame:
     """
@@ -551,11 +668,37 @@ def grid_search_sarimax(
         number of observations as `y` and should be aligned so that y[i] is
         regressed on exog[i].
         
-    refit : bool, default `False`
-        Whether to re-fit the forecaster in each iteration of backtesting.
+    refit : bool, int, default `False`
+        Whether to re-fit the forecaster in each iteration of backtesting. If
+        `refit` is an integer, the forecaster is re-fitted every `refit`
+        iterations (see `backtesting_sarimax`).
         
     return_best : bool, default `True`
         Refit the `forecaster` using the best found parameters on the whole data.
+
+    n_jobs : int, default `1`
+        Number of jobs used to evaluate the candidates in parallel. Each job
+        receives one copy of the forecaster. If `-1`, all processors are used.
+        If `1`, candidates are evaluated sequentially.
+        **New in version 0.7.0**
+
+    abandon_margin : float, default `None`
+        If not `None`, the backtesting of a candidate is stopped as soon as the
+        first metric, computed with the folds already evaluated, is greater than
+        `best * (1 + abandon_margin)`. `best` is the value of the first metric
+        of the best candidate found so far computed with the same folds, so 
+        that both values are comparable. Abandoned candidates get `NaN` metrics.
+        With `n_jobs` other than 1, the best candidate is updated between 
+        batches of candidates.
+        **New in version 0.7.0**
+
+    candidate_timeout : float, default `None`
+        Maximum number of seconds spent on the backtesting of a candidate. It is
+        a soft limit: the time is checked after each fold, so a single fit is 
+        never interrupted and a fit that hangs still blocks the search (the
+        `maxiter` argument of the ARIMA model bounds it). Candidates that
+        exceed the timeout get `NaN` metrics.
+        **New in version 0.7.0**
         
     verbose : bool, default `True`
         Print number of folds used for cv or backtesting.
@@ -584,6 +727,9 @@ def grid_search_sarimax(
         exog                = exog,
         refit               = refit,
         return_best         = return_best,
+        n_jobs              = n_jobs,
+        abandon_margin      = abandon_margin,
+        candidate_timeout   = candidate_timeout,
         verbose             = verbose
     )
 
@@ -599,10 +745,13 @@ def random_search_sarimax(
     initial_train_size: int,
     fixed_train_size: bool=True,
     exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
-    refit: bool=False,
+    refit: Union[bool, int]=False,
     n_iter: int=10,
     random_state: int=123,
     return_best: bool=True,
+    n_jobs: int=1,
+    abandon_margin: Optional[float]=None,
+    candidate_timeout: Optional[float]=None,
     verbose: bool=True
 ) -> pd.DataFrame:
     """
@@ -649,8 +798,10 @@ def random_search_sarimax(
         number of observations as `y` and should be aligned so that y[i] is
         regressed on exog[i].
         
-    refit : bool, default `False`
-        Whether to re-fit the forecaster in each iteration of backtesting.
+    refit : bool, int, default `False`
+        Whether to re-fit the forecaster in each iteration of backtesting. If
+        `refit` is an integer, the forecaster is re-fitted every `refit`
+        iterations (see `backtesting_sarimax`).
 
     n_iter : int, default `10`
         Number of parameter settings that are sampled. 
@@ -661,6 +812,30 @@ def random_search_sarimax(
 
     return_best : bool, default `True`
         Refit the `forecaster` using the best found parameters on the whole data.
+
+    n_jobs : int, default `1`
+        Number of jobs used to evaluate the candidates in parallel. Each job
+        receives one copy of the forecaster. If `-1`, all processors are used.
+        If `1`, candidates are evaluated sequentially.
+        **New in version 0.7.0**
+
+    abandon_margin : float, default `None`
+        If not `None`, the backtesting of a candidate is stopped as soon as the
+        first metric, computed with the folds already evaluated, is greater than
+        `best * (1 + abandon_margin)`. `best` is the value of the first metric
+        of the best candidate found so far computed with the same folds, so 
+        that both values are comparable. Abandoned candidates get `NaN` metrics.
+        With `n_jobs` other than 1, the best candidate is updated between 
+        batches of candidates.
+        **New in version 0.7.0**
+
+    candidate_timeout : float, default `None`
+        Maximum number of seconds spent on the backtesting of a candidate. It is
+        a soft limit: the time is checked after each fold, so a single fit is 
+        never interrupted and a fit that hangs still blocks the search (the
+        `maxiter` argument of the ARIMA model bounds it). Candidates that
+        exceed the timeout get `NaN` metrics.
+        **New in version 0.7.0**
         
     verbose : bool, default `True`
         Print number of folds used for cv or backtesting.
@@ -689,12 +864,173 @@ def random_search_sarimax(
         exog                = exog,
         refit               = refit,
         return_best         = return_best,
+        n_jobs              = n_jobs,
+        abandon_margin      = abandon_margin,
+        candidate_timeout   = candidate_timeout,
         verbose             = verbose
     )
 
     return results
 
 
+def _evaluate_candidate_sarimax(
+    forecaster,
+    params: dict,
+    y: pd.Series,
+    steps: int,
+    metric: list,
+    initial_train_size: int,
+    fixed_train_size: bool=True,
+    exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
+    refit: Union[bool, int]=False,
+    best_fold_metrics: Optional[list]=None,
+    abandon_margin: Optional[float]=None,
+    candidate_timeout: Optional[float]=None,
+    verbose: bool=True
+) -> Tuple[list, list]:
+    """
+    Set `params` in the forecaster and evaluate them using time series
+    backtesting. The forecaster is modified in place. The backtesting is
+    stopped, and `NaN` metrics are returned, if the candidate is abandoned
+    or exceeds `candidate_timeout`.
+    
+    Parameters
+    ----------
+    forecaster : ForecasterSarimax
+        Forcaster model.
+
+    params : dict
+        Parameters of the regressor to evaluate.
+        
+    y : pandas Series
+        Training time series values. 
+
+    steps : int
+        Number of steps to predict.
+        
+    metric : list
+        Metrics used to quantify the goodness of fit of the model.
+
+    initial_train_size : int 
+        Number of samples in the initial train split.
+ 
+    fixed_train_size : bool, default `True`
+        If True, train size doesn't increase but moves by `steps` in each iteration.
+
+    exog : pandas Series, pandas DataFrame, default `None`
+        Exogenous variable/s included as predictor/s. Must have the same
+        number of observations as `y` and should be aligned so that y[i] is
+        regressed on exog[i].
+        
+    refit : bool, int, default `False`
+        Whether to re-fit the forecaster in each iteration of backtesting, or
+        every `refit` iterations.
+
+    best_fold_metrics : list, default `None`
+        Value of the first metric of the best candidate found so far, computed 
+        with the predictions of the first 1, 2, ..., n folds.
+
+    abandon_margin : float, default `None`
+        The candidate is abandoned when the first metric, computed with the
+        folds already evaluated, is greater than the value in `best_fold_metrics`
+        for the same folds times `(1 + abandon_margin)`.
+
+    candidate_timeout : float, default `None`
+        Maximum number of seconds spent on the backtesting. Checked after each fold,
+        a running fit is not interrupted.
+        
+    verbose : bool, default `True`
+        Print number of folds used for cv or backtesting.
+
+    Returns 
+    -------
+    metrics_values : list
+        Value of each metric.
+
+    fold_metrics : list
+        Value of the first metric computed with the predictions of the first
+        1, 2, ..., n folds. Empty if `abandon_margin` is `None`.
+
+    """
+
+    _check_backtesting_sarimax_input(
+        forecaster         = forecaster,
+        y                  = y,
+        initial_train_size = initial_train_size,
+        refit              = refit
+    )
+
+    forecaster.set_params(**params)
+
+    check_abandon = abandon_margin is not None
+    fold_callback = None
+    fold_metrics = []
+    stopped = []
+    if check_abandon or candidate_timeout is not None:
+
+        first_metric = _get_metric(metric[0]) if isinstance(metric[0], str) else metric[0]
+        start_time = time.monotonic()
+
+        def fold_callback(backtest_predictions):
+            if candidate_timeout is not None and time.monotonic() - start_time > candidate_timeout:
+                stopped.append('timeout')
+                return True
+            if check_abandon:
+                pred = pd.concat(backtest_predictions)
+                if isinstance(pred, pd.DataFrame):
+                    pred = pred['pred']
+                running_metric = first_metric(y_true=y.loc[pred.index], y_pred=pred)
+                fold_metrics.append(running_metric)
+                # The running metric is compared with the one of the best
+                # candidate computed with the same folds.
+                fold = len(fold_metrics) - 1
+                if best_fold_metrics is not None and fold < len(best_fold_metrics) \
+                   and running_metric > best_fold_metrics[fold] * (1 + abandon_margin):
+                    stopped.append('abandoned')
+                    return True
+            return False
+
+    kwargs = dict(
+        forecaster         = forecaster,
+        y                  = y,
+        steps              = steps,
+        metric             = metric,
+        initial_train_size = initial_train_size,
+        exog               = exog,
+        fold_callback      = fold_callback,
+        verbose            = verbose
+    )
+    if refit:
+        metrics_values = _backtesting_sarimax_refit(
+                             fixed_train_size = fixed_train_size,
+                             refit            = refit,
+                             **kwargs
+                         )[0]
+    else:
+        metrics_values = _backtesting_sarimax_no_refit(**kwargs)[0]
+
+    if stopped:
+        metrics_values = [np.nan] * len(metric)
+
+    return metrics_values, fold_metrics
+
+
+def _evaluate_candidate_sarimax_job(
+    **kwargs
+) -> Tuple[list, list]:
+    """
+    Run `_evaluate_candidate_sarimax` in a parallel job. Warnings filters are
+    not shared with the workers, so the warning about the number of fits, 
+    ignored by the sequential loop after the first candidate, is ignored here.
+    """
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=RuntimeWarning, message= "The forecaster will be fit.*")
+        results = _evaluate_candidate_sarimax(**kwargs)
+
+    return results
+
+
 def _evaluate_grid_hyperparameters_sarimax(
     forecaster,
     y: pd.Series,
@@ -704,8 +1040,11 @@ def _evaluate_grid_hyperparameters_sarimax(
     initial_train_size: int,
     fixed_train_size: bool=True,
     exog: Optional[Union[pd.Series, pd.DataFrame]]=None,
-    refit: bool=False,
+    refit: Union[bool, int]=False,
     return_best: bool=True,
+    n_jobs: int=1,
+    abandon_margin: Optional[float]=None,
+    candidate_timeout: Optional[float]=None,
     verbose: bool=True
 ) -> pd.DataFrame:
     """
@@ -751,11 +1090,37 @@ def _evaluate_grid_hyperparameters_sarimax(
         number of observations as `y` and should be aligned so that y[i] is
         regressed on exog[i].
         
-    refit : bool, default `False`
-        Whether to re-fit the forecaster in each iteration of backtesting.
+    refit : bool, int, default `False`
+        Whether to re-fit the forecaster in each iteration of backtesting. If
+        `refit` is an integer, the forecaster is re-fitted every `refit`
+        iterations (see `backtesting_sarimax`).
         
     return_best : bool, default `True`
         Refit the `forecaster` using the best found parameters on the whole data.
+
+    n_jobs : int, default `1`
+        Number of jobs used to evaluate the candidates in parallel. Each job
+        receives one copy of the forecaster. If `-1`, all processors are used.
+        If `1`, candidates are evaluated sequentially.
+        **New in version 0.7.0**
+
+    abandon_margin : float, default `None`
+        If not `None`, the backtesting of a candidate is stopped as soon as the
+        first metric, computed with the folds already evaluated, is greater than
+        `best * (1 + abandon_margin)`. `best` is the value of the first metric
+        of the best candidate found so far computed with the same folds, so 
+        that both values are comparable. Abandoned candidates get `NaN` metrics.
+        With `n_jobs` other than 1, the best candidate is updated between 
+        batches of candidates.
+        **New in version 0.7.0**
+
+    candidate_timeout : float, default `None`
+        Maximum number of seconds spent on the backtesting of a candidate. It is
+        a soft limit: the time is checked after each fold, so a single fit is 
+        never interrupted and a fit that hangs still blocks the search (the
+        `maxiter` argument of the ARIMA model bounds it). Candidates that
+        exceed the timeout get `NaN` metrics.
+        **New in version 0.7.0**
         
     verbose : bool, default `True`
         Print number of folds used for cv or backtesting.
@@ -787,25 +1152,75 @@ def _evaluate_grid_hyperparameters_sarimax(
         )
 
     print(f"Number of models compared: {len(param_grid)}.")
+
+    metrics_list = []
+    # Abandoned and timed out candidates (NaN metrics) are never the best one.
+    best_metric = np.inf
+    best_fold_metrics = None
+    n_jobs = effective_n_jobs(n_jobs)
+
+    if n_jobs == 1:
   
-    for params in tqdm(param_grid, desc='loop param_grid', position=0, ncols=90):
-
-        forecaster.set_params(**params)
-        metrics_values = backtesting_sarimax(
-                                forecaster         = forecaster,
-                                y                  = y,
-                                steps              = steps,
-                                metric             = metric,
-                                initial_train_size = initial_train_size,
-                                fixed_train_size   = fixed_train_size,
-                                exog               = exog,
-                                refit              = refit,
-                                alpha              = None,
-                                interval           = None,
-                                verbose            = verbose
-                            )[0]
-        warnings.filterwarnings('ignore', category=RuntimeWarning, message= "The forecaster will be fit.*")   
-        params_list.append(params)
+        for params in tqdm(param_grid, desc='loop param_grid', position=0, ncols=90):
+
+            metrics_values, fold_metrics = _evaluate_candidate_sarimax(
+                                 forecaster         = forecaster,
+                                 params             = params,
+                                 y                  = y,
+                                 steps              = steps,
+                                 metric             = metric,
+                                 initial_train_size = initial_train_size,
+                                 fixed_train_size   = fixed_train_size,
+                                 exog               = exog,
+                                 refit              = refit,
+                                 best_fold_metrics  = best_fold_metrics,
+                                 abandon_margin     = abandon_margin,
+                                 candidate_timeout  = candidate_timeout,
+                                 verbose            = verbose
+                             )
+            warnings.filterwarnings('ignore', category=RuntimeWarning, message= "The forecaster will be fit.*")   
+            params_list.append(params)
+            metrics_list.append(metrics_values)
+            if metrics_values[0] < best_metric:
+                best_metric = metrics_values[0]
+                best_fold_metrics = fold_metrics
+
+    else:
+
+        # Candidates are dispatched in batches so that the progress bar and the
+        # best metric, used to abandon candidates, are updated between batches.
+        batch_size = 4 * n_jobs
+        with Parallel(n_jobs=n_jobs) as parallel:
+            with tqdm(total=len(param_grid), desc='loop param_grid', ncols=90) as pbar:
+                for start in range(0, len(param_grid), batch_size):
+                    batch = param_grid[start:start + batch_size]
+                    results_batch = parallel(
+                        delayed(_evaluate_candidate_sarimax_job)(
+                            forecaster         = forecaster,
+                            params             = params,
+                            y                  = y,
+                            steps              = steps,
+                            metric             = metric,
+                            initial_train_size = initial_train_size,
+                            fixed_train_size   = fixed_train_size,
+                            exog               = exog,
+                            refit              = refit,
+                            best_fold_metrics  = best_fold_metrics,
+                            abandon_margin     = abandon_margin,
+                            candidate_timeout  = candidate_timeout,
+                            verbose            = verbose
+                        )
+                        for params in batch
+                    )
+                    params_list.extend(batch)
+                    for metrics_values, fold_metrics in results_batch:
+                        metrics_list.append(metrics_values)
+                        if metrics_values[0] < best_metric:
+                            best_metric = metrics_values[0]
+                            best_fold_metrics = fold_metrics
+                    pbar.update(len(results_batch))
+
+    for metrics_values in metrics_list:
         for m, m_value in zip(metric, metrics_values):
             m_name = m if isinstance(m, str) else m.__name__
             metric_dict[m_name].append(m_value)
@@ -101,7 +101,7 @@ def test_backtesting_sarimax_TypeError_when_refit_not_bool():
 
     refit = 'not_bool'
     
-    err_msg = re.escape( f'`refit` must be boolean: `True`, `False`.')
+    err_msg = re.escape(f'`refit` must be boolean (`True`, `False`) or an integer greater than 0. Got {refit}.')
     with pytest.raises(TypeError, match = err_msg):
         backtesting_sarimax(
             forecaster         = forecaster,
@@ -742,4 +742,121 @@ def test_output_backtesting_sarimax_yes_refit_fixed_train_size_yes_exog_interval
                                     )                                                     
 
     assert expected_metric == approx(metric, abs=0.0001)
-    pd.testing.assert_frame_equal(expected_backtest_predictions, backtest_predictions, atol=0.0001)
\ No newline at end of file
+    pd.testing.assert_frame_equal(expected_backtest_predictions, backtest_predictions, atol=0.0001)
+
+@pytest.mark.parametrize("fixed_train_size", 
+                         [True, False], 
+                         ids = lambda fixed : f'fixed_train_size: {fixed}')
+def test_output_backtesting_sarimax_refit_int_yes_exog(fixed_train_size):
+    """
+    Test output of backtesting_sarimax with refit=2. Folds 0 and 2 are fitted,
+    so their predictions are equal to the ones with refit=True. In fold 1 the 
+    observations of fold 0 are appended to the model fitted in fold 0.
+    """
+    forecaster = ForecasterSarimax(regressor=ARIMA(maxiter=1000, trend=None, method='nm', ftol=1e-19,  order=(1,1,1)))
+    initial_train_size = len(y_datetime) - 9
+
+    _, backtest_predictions = backtesting_sarimax(
+                                  forecaster         = forecaster,
+                                  y                  = y_datetime,
+                                  exog               = exog_datetime,
+                                  steps              = 3,
+                                  metric             = 'mean_squared_error',
+                                  initial_train_size = initial_train_size,
+                                  fixed_train_size   = fixed_train_size,
+                                  refit              = 2,
+                                  verbose            = False
+                              )
+    _, backtest_predictions_refit = backtesting_sarimax(
+                                        forecaster         = forecaster,
+                                        y                  = y_datetime,
+                                        exog               = exog_datetime,
+                                        steps              = 3,
+                                        metric             = 'mean_squared_error',
+                                        initial_train_size = initial_train_size,
+                                        fixed_train_size   = fixed_train_size,
+                                        refit              = True,
+                                        verbose            = False
+                                    )
+
+    forecaster.fit(
+        y    = y_datetime.iloc[:initial_train_size],
+        exog = exog_datetime.iloc[:initial_train_size]
+    )
+    expected_fold_1 = forecaster.predict(
+                          steps            = 3,
+                          last_window      = y_datetime.iloc[initial_train_size:initial_train_size + 3],
+                          last_window_exog = exog_datetime.iloc[initial_train_size:initial_train_size + 3],
+                          exog             = exog_datetime.iloc[initial_train_size + 3:initial_train_size + 6]
+                      )
+
+    pd.testing.assert_frame_equal(backtest_predictions.iloc[[0, 1, 2, 6, 7, 8]], 
+                                  backtest_predictions_refit.iloc[[0, 1, 2, 6, 7, 8]])
+    pd.testing.assert_series_equal(backtest_predictions['pred'].iloc[3:6], expected_fold_1)
+
+
+def test_output_backtesting_sarimax_refit_warm_start():
+    """
+    Test backtesting_sarimax with warm_start=True starts each fit from the 
+    parameters of the previous fold and gives similar predictions to refit
+    from the default initial values.
+    """
+    forecaster = ForecasterSarimax(regressor=ARIMA(maxiter=1000, trend=None, method='lbfgs', order=(1,0,0)))
+
+    metric, backtest_predictions = backtesting_sarimax(
+                                       forecaster         = forecaster,
+                                       y                  = y_datetime,
+                                       steps              = 3,
+                                       metric             = 'mean_squared_error',
+                                       initial_train_size = len(y_datetime) - 12,
+                                       fixed_train_size   = False,
+                                       refit              = True,
+                                       verbose            = False
+                                   )
+    metric_warm, backtest_predictions_warm = backtesting_sarimax(
+                                                 forecaster         = forecaster,
+                                                 y                  = y_datetime,
+                                                 steps              = 3,
+                                                 metric             = 'mean_squared_error',
+                                                 initial_train_size = len(y_datetime) - 12,
+                                                 fixed_train_size   = False,
+                                                 refit              = True,
+                                                 warm_start         = True,
+                                                 verbose            = False
+                                             )
+
+    assert forecaster.regressor.start_params is None
+    assert metric_warm == approx(metric, rel=0.01)
+    pd.testing.assert_frame_equal(backtest_predictions_warm, backtest_predictions, atol=0.001)
+
+
+@pytest.mark.parametrize("trend", 
+                         ['t', 'ct'], 
+                         ids = lambda trend : f'trend: {trend}')
+def test_output_backtesting_sarimax_refit_int_bounded_state_with_time_trend(trend):
+    """
+    Test backtesting_sarimax with refit=4 gives the same predictions with a 
+    ForecasterSarimax with bounded_state=True as with bounded_state=False when
+    the ARIMA has a time trend. In folds 1 to 3 the model is updated several
+    times with `extend`, the time trend must continue from the observations
+    already seen.
+    """
+    backtest_predictions = []
+    for bounded_state in [False, True]:
+        forecaster = ForecasterSarimax(
+                         regressor     = ARIMA(maxiter=1000, trend=trend, method='nm', ftol=1e-19, order=(1,0,0)),
+                         bounded_state = bounded_state
+                     )
+        backtest_predictions.append(
+            backtesting_sarimax(
+                forecaster         = forecaster,
+                y                  = y_datetime,
+                steps              = 3,
+                metric             = 'mean_squared_error',
+                initial_train_size = len(y_datetime) - 12,
+                refit              = 4,
+                verbose            = False
+            )[1]
+        )
+
+    pd.testing.assert_frame_equal(backtest_predictions[0], backtest_predictions[1])
@@ -7,6 +7,7 @@ import pandas as pd
 from sklearn.metrics import mean_absolute_error
 from skforecast.ForecasterSarimax import ForecasterSarimax
 from skforecast.model_selection_sarimax.model_selection_sarimax import _evaluate_grid_hyperparameters_sarimax
+from skforecast.model_selection_sarimax.model_selection_sarimax import _evaluate_candidate_sarimax
 from pmdarima.arima import ARIMA
 
 from tqdm import tqdm
@@ -218,4 +219,115 @@ def test_evaluate_grid_hyperparameters_sarimax_when_return_best():
     
     assert expected_params == forecaster.params
     assert expected_params['method'] == forecaster.regressor.method
-    assert expected_params['order'] == forecaster.regressor.order
\ No newline at end of file
+    assert expected_params['order'] == forecaster.regressor.order
+
+def test_evaluate_grid_hyperparameters_sarimax_n_jobs_same_results_as_sequential():
+    """
+    Test that evaluating the candidates in parallel (n_jobs=2) gives the same
+    results as the sequential evaluation.
+    """
+    param_grid = [{'order': (1,1,1)}, {'order': (1,2,2)}, {'order': (2,2,2)}]
+
+    results = []
+    for n_jobs in [1, 2]:
+        forecaster = ForecasterSarimax(regressor=ARIMA(maxiter=1000, trend=None, method='nm', ftol=1e-19,  order=(1,1,1)))
+        results.append(
+            _evaluate_grid_hyperparameters_sarimax(
+                forecaster         = forecaster,
+                y                  = y_datetime,
+                param_grid         = param_grid,
+                steps              = 3,
+                metric             = 'mean_absolute_error',
+                initial_train_size = len(y_datetime)-12,
+                fixed_train_size   = False,
+                refit              = True,
+                return_best        = False,
+                n_jobs             = n_jobs,
+                verbose            = False
+            )
+        )
+
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
+def test_evaluate_grid_hyperparameters_sarimax_abandon_margin_NaN_metrics():
+    """
+    Test that candidates whose running metric is worse than the best one found
+    so far by more than `abandon_margin` get NaN metrics and are sorted last.
+    """
+    forecaster = ForecasterSarimax(regressor=ARIMA(maxiter=1000, trend=None, method='nm', ftol=1e-19,  order=(1,1,1)))
+    param_grid = [{'order': (1,1,1)}, {'order': (2,2,2)}]
+
+    results = _evaluate_grid_hyperparameters_sarimax(
+                  forecaster         = forecaster,
+                  y                  = y_datetime,
+                  param_grid         = param_grid,
+                  steps              = 3,
+                  metric             = [mean_absolute_error, 'mean_squared_error'],
+                  initial_train_size = len(y_datetime)-12,
+                  fixed_train_size   = False,
+                  refit              = False,
+                  return_best        = False,
+                  abandon_margin     = 0.,
+                  verbose            = False
+              )
+
+    assert results['params'].tolist() == param_grid
+    assert not results.iloc[0][['mean_absolute_error', 'mean_squared_error']].isna().any()
+    assert results.iloc[1][['mean_absolute_error', 'mean_squared_error']].isna().all()
+
+
+def test_evaluate_grid_hyperparameters_sarimax_candidate_timeout_NaN_metrics():
+    """
+    Test that candidates exceeding `candidate_timeout` get NaN metrics.
+    """
+    forecaster = ForecasterSarimax(regressor=ARIMA(maxiter=1000, trend=None, method='nm', ftol=1e-19,  order=(1,1,1)))
+
+    results = _evaluate_grid_hyperparameters_sarimax(
+                  forecaster         = forecaster,
+                  y                  = y_datetime,
+                  param_grid         = [{'order': (1,1,1)}, {'order': (2,2,2)}],
+                  steps              = 3,
+                  metric             = 'mean_absolute_error',
+                  initial_train_size = len(y_datetime)-12,
+                  fixed_train_size   = False,
+                  refit              = True,
+                  return_best        = False,
+                  candidate_timeout  = 0.,
+                  verbose            = False
+              )
+
+    assert results['mean_absolute_error'].isna().all()
+
+
+@pytest.mark.parametrize("scale, expected_abandoned", 
+                         [(1., False), (0.5, True)], 
+                         ids = lambda x : f'{x}')
+def test_evaluate_candidate_sarimax_abandon_compares_same_folds(scale, expected_abandoned):
+    """
+    Test the running metric of a candidate is compared with the metric of the
+    best candidate computed with the same folds. The same candidate is never
+    abandoned against itself, and it is abandoned when the best fold metrics 
+    are lower.
+    """
+    forecaster = ForecasterSarimax(regressor=ARIMA(maxiter=1000, trend=None, method='nm', ftol=1e-19,  order=(1,1,1)))
+    kwargs = dict(
+        forecaster         = forecaster,
+        params             = {'order': (1,1,1)},
+        y                  = y_datetime,
+        steps              = 3,
+        metric             = ['mean_absolute_error'],
+        initial_train_size = len(y_datetime)-12,
+        refit              = False,
+        abandon_margin     = 0.,
+        verbose            = False
+    )
+    metrics_values, fold_metrics = _evaluate_candidate_sarimax(**kwargs)
+    results, _ = _evaluate_candidate_sarimax(
+                     best_fold_metrics = [m * scale for m in fold_metrics],
+                     **kwargs
+                 )
+
+    assert len(fold_metrics) == 4
+    assert fold_metrics[-1] == pytest.approx(metrics_values[0])
+    assert np.isnan(results[0]) == expected_abandoned
@@ -0,0 +1,51 @@
+# Unit test allocate_array
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+from skforecast.utils import allocate_array
+
+
+def test_allocate_array_in_memory_when_memmap_dir_is_None():
+    """
+    Test allocate_array returns a numpy ndarray of zeros when memmap_dir is None.
+    """
+    results = allocate_array(shape=(3, 2), dtype=np.float32)
+
+    assert not isinstance(results, np.memmap)
+    assert results.dtype == np.float32
+    np.testing.assert_array_equal(results, np.zeros((3, 2)))
+
+
+def test_allocate_array_memmap_when_memmap_dir(tmp_path):
+    """
+    Test allocate_array returns a writable memmap of zeros and no file is left
+    in memmap_dir.
+    """
+    results = allocate_array(shape=(3, 2), memmap_dir=str(tmp_path))
+    results[1, :] = [1., 2.]
+
+    assert isinstance(results, np.memmap)
+    np.testing.assert_array_equal(results, np.array([[0., 0.], [1., 2.], [0., 0.]]))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_allocate_array_memmap_empty_shape(tmp_path):
+    """
+    Test allocate_array returns an array in memory when it has no elements.
+    """
+    results = allocate_array(shape=(0, 2), memmap_dir=str(tmp_path))
+
+    assert results.shape == (0, 2)
+
+
+def test_allocate_array_TypeError_when_object_dtype_and_memmap_dir(tmp_path):
+    """
+    Test TypeError is raised when dtype is object and memmap_dir is not None.
+    """
+    err_msg = re.escape(
+                ("Arrays of dtype object cannot be memory-mapped. All the exogenous "
+                 "variables must be numeric when `memmap_dir` is used.")
+              )
+    with pytest.raises(TypeError, match = err_msg):
+        allocate_array(shape=(3, 2), dtype=object, memmap_dir=str(tmp_path))
@@ -0,0 +1,60 @@
+# Unit test append_last_window
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from skforecast.utils import append_last_window
+
+
+def test_append_last_window_exception_when_new_values_is_not_same_type():
+    """
+    Test exception is raised when new_values is not the same type as last_window.
+    """
+    last_window = pd.Series(np.arange(3.))
+    new_values = pd.DataFrame({'a': [3.]}, index=[3])
+
+    err_msg = re.escape(
+                f"`new_values` must be a {type(last_window)}. Got {type(new_values)}."
+              )
+    with pytest.raises(TypeError, match = err_msg):
+        append_last_window(last_window=last_window, new_values=new_values, window_size=3)
+
+
+def test_append_last_window_exception_when_new_values_has_gap():
+    """
+    Test exception is raised when new_values does not start one step ahead of
+    last_window end.
+    """
+    last_window = pd.Series(np.arange(3.))
+    new_values = pd.Series([4.], index=pd.RangeIndex(start=4, stop=5))
+
+    err_msg = re.escape("`new_values` must start one step ahead of `last_window` end")
+    with pytest.raises(ValueError, match = err_msg):
+        append_last_window(last_window=last_window, new_values=new_values, window_size=3)
+
+
+def test_append_last_window_output_RangeIndex():
+    """
+    Test output of append_last_window with a RangeIndex.
+    """
+    last_window = pd.Series(np.arange(3.), name='y')
+    new_values = pd.Series([3., 4.], index=pd.RangeIndex(start=3, stop=5), name='y')
+    results = append_last_window(last_window=last_window, new_values=new_values, window_size=3)
+    expected = pd.Series([2., 3., 4.], index=pd.RangeIndex(start=2, stop=5), name='y')
+
+    pd.testing.assert_series_equal(results, expected)
+
+
+def test_append_last_window_output_DatetimeIndex_DataFrame_more_new_values_than_window_size():
+    """
+    Test output of append_last_window with a DataFrame with DatetimeIndex when
+    new_values is longer than window_size. Frequency is kept.
+    """
+    index = pd.date_range(start='2022-01-01', periods=7, freq='D')
+    df = pd.DataFrame({'a': np.arange(7.), 'b': np.arange(7.) * 10}, index=index)
+    results = append_last_window(last_window=df.iloc[:3], new_values=df.iloc[3:], window_size=2)
+    expected = df.iloc[5:]
+
+    pd.testing.assert_frame_equal(results, expected)
+    assert results.index.freqstr == 'D'
@@ -0,0 +1,108 @@
+# Unit test DirectTrainMatrix
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from skforecast.ForecasterAutoregDirect import ForecasterAutoregDirect
+from skforecast.ForecasterAutoregMultiVariate import ForecasterAutoregMultiVariate
+from skforecast.utils import DirectTrainMatrix
+from skforecast.utils import TrainMatrixCache
+
+# Fixtures
+y = pd.Series(np.arange(50, dtype=float), name='y')
+exog = pd.DataFrame({'exog_1': np.arange(100, 150, dtype=float),
+                     'exog_2': np.arange(1000, 1050, dtype=float)})
+
+
+def test_DirectTrainMatrix_get_step_ValueError_when_step_out_of_range():
+    """
+    Test ValueError is raised when `step` is not between 1 and steps.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=2)
+    train_matrix = forecaster._create_train_matrix(y=y, exog=exog)
+
+    err_msg = re.escape(
+                (f"Invalid value `step`. For this forecaster, minimum value is 1 "
+                 f"and the maximum step is 2.")
+            )
+    with pytest.raises(ValueError, match = err_msg):
+        train_matrix.get_step(step=3)
+
+
+@pytest.mark.parametrize("exog", 
+                         [None, exog, exog['exog_1']], 
+                         ids = lambda exog : f'exog: {type(exog)}')
+def test_DirectTrainMatrix_get_step_same_as_filter_train_X_y_for_step_ForecasterAutoregDirect(exog):
+    """
+    Test the matrices of each step created by `get_step` are equal to the ones
+    selected with `filter_train_X_y_for_step` from `create_train_X_y`.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=4)
+    train_matrix = forecaster._create_train_matrix(y=y, exog=exog)
+    X_train, y_train = forecaster.create_train_X_y(y=y, exog=exog)
+
+    assert isinstance(train_matrix, DirectTrainMatrix)
+    assert train_matrix.X_train_col_names == list(X_train.columns)
+    for step in range(1, 5):
+        X_train_step, y_train_step = train_matrix.get_step(step=step)
+        expected_X, expected_y = forecaster.filter_train_X_y_for_step(
+                                     step    = step,
+                                     X_train = X_train,
+                                     y_train = y_train
+                                 )
+        pd.testing.assert_frame_equal(X_train_step, expected_X)
+        pd.testing.assert_series_equal(y_train_step, expected_y)
+
+
+def test_DirectTrainMatrix_get_step_same_as_filter_train_X_y_for_step_ForecasterAutoregMultiVariate():
+    """
+    Test the matrices of each step created by `get_step` are equal to the ones
+    selected with `filter_train_X_y_for_step` from `create_train_X_y` in 
+    ForecasterAutoregMultiVariate.
+    """
+    series = pd.DataFrame({'l1': np.arange(50, dtype=float), 
+                           'l2': np.arange(50, 100, dtype=float)})
+    forecaster = ForecasterAutoregMultiVariate(LinearRegression(), level='l1',
+                                               lags={'l1': 2, 'l2': [1, 3]}, steps=3)
+    train_matrix = forecaster._create_train_matrix(series=series, exog=exog)
+    X_train, y_train = forecaster.create_train_X_y(series=series, exog=exog)
+
+    for step in range(1, 4):
+        X_train_step, y_train_step = train_matrix.get_step(step=step)
+        expected_X, expected_y = forecaster.filter_train_X_y_for_step(
+                                     step    = step,
+                                     X_train = X_train,
+                                     y_train = y_train
+                                 )
+        pd.testing.assert_frame_equal(X_train_step, expected_X)
+        pd.testing.assert_series_equal(y_train_step, expected_y)
+
+
+def test_DirectTrainMatrix_exog_stored_once():
+    """
+    Test exog values are stored only once, not once per step.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=10)
+    train_matrix = forecaster._create_train_matrix(y=y, exog=exog)
+    X_train, _ = forecaster.create_train_X_y(y=y, exog=exog)
+
+    assert train_matrix.X_exog.shape == (38, 2, 10)
+    assert train_matrix.X_exog.base is not None
+    assert train_matrix.nbytes < X_train.values.nbytes
+
+
+def test_TrainMatrixCache_create_train_matrix_reuses_DirectTrainMatrix():
+    """
+    Test `TrainMatrixCache.create_train_matrix` creates the DirectTrainMatrix
+    only once and keeps its entries apart from the ones of `create_train_X_y`.
+    """
+    forecaster = ForecasterAutoregDirect(LinearRegression(), lags=3, steps=2)
+    cache = TrainMatrixCache()
+    train_matrix_1 = cache.create_train_matrix(forecaster=forecaster, y=y, exog=exog)
+    train_matrix_2 = cache.create_train_matrix(forecaster=forecaster, y=y, exog=exog)
+    cache.create_train_X_y(forecaster=forecaster, y=y, exog=exog)
+
+    assert train_matrix_1 is train_matrix_2
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
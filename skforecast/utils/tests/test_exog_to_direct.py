@@ -61,4 +61,19 @@ def test_exog_to_direct_when_steps_3_exog_numpy_array_2d():
                          [106, 107, 108, 1006, 1007, 1008],
                          [107, 108, 109, 1007, 1008, 1009]])
 
-    assert results == approx(expected)
\ No newline at end of file
+    assert results == approx(expected)
+
+def test_exog_to_direct_when_steps_3_exog_numpy_array_2d_return_view():
+    """
+    Test exog_to_direct results when using steps 3, exog is a 2d numpy array
+    and return_view=True. The view shares memory with exog and the values
+    of each step match the columns of the 2d output.
+    """
+    exog = np.column_stack([np.arange(100, 110), np.arange(1000, 1010)])
+    results = exog_to_direct(exog=exog, steps=3, return_view=True)
+    expected = exog_to_direct(exog=exog, steps=3)
+
+    assert results.shape == (8, 2, 3)
+    assert np.shares_memory(results, exog)
+    for step in range(3):
+        assert results[:, :, step] == approx(expected[:, step::3])
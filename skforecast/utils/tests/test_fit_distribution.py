@@ -0,0 +1,100 @@
+# Unit test fit_distribution
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from scipy.stats import expon
+from scipy.stats import gamma
+from scipy.stats import lognorm
+from scipy.stats import t
+from skforecast.utils import fit_distribution
+
+# Fixtures
+boot_samples = np.random.default_rng(123).normal(loc=2, scale=3, size=(5, 50))
+
+
+def test_fit_distribution_exception_when_method_is_not_valid():
+    """
+    Test exception is raised when method is not 'mle' or 'moments'.
+    """
+    err_msg = re.escape("`method` must be 'mle' or 'moments'. Got 'not_valid'.")
+    with pytest.raises(ValueError, match = err_msg):
+        fit_distribution(boot_samples=boot_samples, distribution=norm, method='not_valid')
+
+
+def test_fit_distribution_exception_when_method_is_moments_and_distribution_not_available():
+    """
+    Test exception is raised when method is 'moments' and the distribution has
+    no moments estimator.
+    """
+    err_msg = re.escape(
+                ("Method of moments is only available for distributions 'norm', "
+                 "'lognorm' and 'gamma'. Got 't'.")
+              )
+    with pytest.raises(ValueError, match = err_msg):
+        fit_distribution(boot_samples=boot_samples, distribution=t, method='moments')
+
+
+@pytest.mark.parametrize("distribution", 
+                         [norm, expon, t], 
+                         ids = lambda dist : f'distribution: {dist.name}')
+@pytest.mark.parametrize("n_jobs", 
+                         [1, 2], 
+                         ids = lambda n_jobs : f'n_jobs: {n_jobs}')
+def test_fit_distribution_mle_equal_to_distribution_fit_each_row(distribution, n_jobs):
+    """
+    Test output of fit_distribution with method 'mle' is the same as calling
+    `distribution.fit` for each row, also when boot_samples is a DataFrame.
+    """
+    expected = np.array([distribution.fit(row) for row in boot_samples])
+    results = fit_distribution(
+                  boot_samples = pd.DataFrame(boot_samples),
+                  distribution = distribution,
+                  method       = 'mle',
+                  n_jobs       = n_jobs
+              )
+
+    np.testing.assert_array_almost_equal(results, expected)
+
+
+@pytest.mark.parametrize("distribution, params", 
+                         [(gamma, (3., 1., 2.)), (lognorm, (0.5, 1., 2.))], 
+                         ids = lambda x : f'{x}' if isinstance(x, tuple) else f'distribution: {x.name}')
+def test_fit_distribution_moments_recovers_parameters(distribution, params):
+    """
+    Test the mean, variance and skewness of the distributions fitted with
+    method 'moments' match the sample moments and the parameters are close to
+    the ones used to simulate the samples.
+    """
+    samples = distribution.rvs(*params, size=(3, 50000), random_state=123)
+    results = fit_distribution(
+                  boot_samples = samples,
+                  distribution = distribution,
+                  method       = 'moments'
+              )
+
+    np.testing.assert_allclose(results, np.tile(params, (3, 1)), rtol=0.25)
+    for row, param_values in zip(samples, results):
+        mean, var, skew = distribution.stats(*param_values, moments='mvs')
+        np.testing.assert_allclose(
+            [mean, var, skew], 
+            [row.mean(), row.var(), ((row - row.mean())**3).mean() / row.std()**3]
+        )
+
+
+def test_fit_distribution_moments_rows_with_negative_skewness_are_fitted_by_mle():
+    """
+    Test rows with negative skewness have no moments estimate for gamma and
+    are fitted with `distribution.fit`.
+    """
+    samples = gamma.rvs(3., 1., 2., size=(2, 200), random_state=123)
+    samples[1] = -samples[1]
+    results = fit_distribution(
+                  boot_samples = samples,
+                  distribution = gamma,
+                  method       = 'moments'
+              )
+
+    np.testing.assert_array_almost_equal(results[1], gamma.fit(samples[1]))
@@ -0,0 +1,139 @@
+# Unit test ForecasterProfiler and timed_phase
+# ==============================================================================
+import threading
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from skforecast.model_selection import backtesting_forecaster
+from skforecast.utils import ForecasterProfiler
+from skforecast.utils import timed_phase
+
+# Fixtures
+y = pd.Series(np.arange(50, dtype=float), name='y')
+
+
+def test_timed_phase_does_nothing_when_no_profiler_is_active():
+    """
+    Test timed_phase returns the same no-op context manager when no profiler
+    is active and nothing is recorded.
+    """
+    profiler = ForecasterProfiler()
+    with timed_phase('phase') as phase:
+        phase.add_array(np.ones(10))
+
+    assert timed_phase('phase') is timed_phase('other_phase')
+    assert profiler.records == []
+
+
+def test_ForecasterProfiler_records_phases_and_folds():
+    """
+    Test records of nested phases and folds.
+    """
+    with ForecasterProfiler() as profiler:
+        with timed_phase('outer') as phase:
+            phase.add_array(np.ones(10))
+            with timed_phase('fold', fold=3):
+                with timed_phase('inner'):
+                    pass
+        with timed_phase('outer'):
+            pass
+
+    with timed_phase('not_recorded'):
+        pass
+
+    results = [(fold, phase, nbytes) for fold, phase, _, nbytes in profiler.records]
+    expected = [(3, 'inner', 0), (3, 'fold', 0), (None, 'outer', 80), (None, 'outer', 0)]
+
+    assert results == expected
+    assert all(record[2] >= 0 for record in profiler.records)
+
+
+def test_ForecasterProfiler_to_frame_output():
+    """
+    Test to_frame output, aggregated and not aggregated.
+    """
+    profiler = ForecasterProfiler()
+    profiler.records = [
+        (None, 'regressor.fit', 1., 0),
+        (0, 'regressor.predict', 2., 10),
+        (0, 'regressor.predict', 4., 30),
+    ]
+    results = profiler.to_frame()
+    expected = pd.DataFrame({
+                   'fold': pd.array([pd.NA, 0], dtype='Int64'),
+                   'phase': ['regressor.fit', 'regressor.predict'],
+                   'n_calls': [1, 2],
+                   'total_time': [1., 6.],
+                   'mean_time': [1., 3.],
+                   'max_nbytes': [0, 30]
+               })
+
+    pd.testing.assert_frame_equal(results, expected)
+    assert profiler.to_frame(aggregate=False).shape == (3, 4)
+
+    profiler.reset()
+    assert profiler.records == []
+
+
+def test_ForecasterProfiler_backtesting_forecaster_refit():
+    """
+    Test phases recorded by backtesting_forecaster with refit=True: one fit and
+    one prediction per fold.
+    """
+    forecaster = ForecasterAutoreg(
+                     regressor     = LinearRegression(),
+                     lags          = 3,
+                     transformer_y = StandardScaler()
+                 )
+    with ForecasterProfiler() as profiler:
+        backtesting_forecaster(
+            forecaster         = forecaster,
+            y                  = y,
+            steps              = 5,
+            metric             = 'mean_squared_error',
+            initial_train_size = 40,
+            refit              = True,
+            verbose            = False
+        )
+    results = profiler.to_frame().set_index(['fold', 'phase'])
+
+    assert results.loc[(0, 'fold'), 'n_calls'] == 1
+    assert results.loc[(1, 'fold'), 'n_calls'] == 1
+    assert results.loc[(1, 'create_train_X_y'), 'max_nbytes'] > 0
+    assert results.loc[(1, 'regressor.fit'), 'n_calls'] == 1
+    assert results.loc[(1, '_recursive_predict'), 'n_calls'] == 1
+    # 5 steps + in-sample residuals
+    assert results.loc[(1, 'regressor.predict'), 'n_calls'] == 6
+    assert results.loc[(1, 'transform'), 'n_calls'] >= 2
+    assert (results['total_time'] >= 0).all()
+
+
+def test_ForecasterProfiler_does_not_record_phases_of_other_threads():
+    """
+    Test a profiler only records the phases run in the thread where it is
+    entered, and profilers entered in other threads are not modified.
+    """
+    barrier = threading.Barrier(2)
+    profilers = {}
+
+    def record(name):
+        with ForecasterProfiler() as profiler:
+            barrier.wait()
+            with timed_phase(name):
+                pass
+            barrier.wait()
+        profilers[name] = profiler
+
+    threads = [threading.Thread(target=record, args=(name,)) for name in ['a', 'b']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with timed_phase('not_recorded'):
+        pass
+
+    assert [record[1] for record in profilers['a'].records] == ['a']
+    assert [record[1] for record in profilers['b'].records] == ['b']
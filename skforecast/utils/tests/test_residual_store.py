@@ -0,0 +1,179 @@
+# Unit test ResidualStore
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from skforecast.utils import ResidualStore
+from skforecast.utils import to_residual_store
+
+
+@pytest.mark.parametrize("capacity, n_bins", 
+                         [(0, 1), (10, 0), (1.5, 1)], 
+                         ids = lambda x : f'{x}')
+def test_ResidualStore_exception_when_capacity_or_n_bins_not_valid(capacity, n_bins):
+    """
+    Test ValueError is raised when capacity or n_bins are not integers greater
+    than 0.
+    """
+    with pytest.raises(ValueError):
+        ResidualStore(capacity=capacity, n_bins=n_bins)
+
+
+def test_ResidualStore_exception_when_bins_have_different_length():
+    """
+    Test ValueError is raised when bins and residuals have different length.
+    """
+    store = ResidualStore(capacity=10, n_bins=2)
+
+    err_msg = re.escape("`bins` must have the same length as `residuals`. Got 2 and 3.")
+    with pytest.raises(ValueError, match = err_msg):
+        store.append(residuals=np.arange(3), bins=np.array([0, 1]))
+
+
+def test_ResidualStore_exception_when_bin_out_of_range():
+    """
+    Test ValueError is raised when a bin is not between 0 and n_bins - 1.
+    """
+    store = ResidualStore(capacity=10, n_bins=2)
+
+    err_msg = re.escape("Bins must be integers between 0 and 1. Got 2.")
+    with pytest.raises(ValueError, match = err_msg):
+        store.append(residuals=np.arange(3), bins=2)
+
+
+def test_ResidualStore_append_less_than_capacity_keeps_order():
+    """
+    Test residuals are stored in order, with no sampling, while the capacity
+    is not reached.
+    """
+    store = ResidualStore(capacity=10)
+    store.append(pd.Series([1., 2., 3.]))
+    store.append(np.array([4., 5.]))
+
+    np.testing.assert_array_equal(store.values, np.array([1., 2., 3., 4., 5.]))
+    assert len(store) == 5
+    assert store.n_seen.tolist() == [5]
+
+
+def test_ResidualStore_values_is_read_only_view():
+    """
+    Test values is a read-only view of the preallocated array.
+    """
+    store = ResidualStore(capacity=10)
+    store.append(np.arange(5))
+    values = store.values
+
+    assert not values.flags.writeable
+    assert np.shares_memory(values, store._values)
+
+
+def test_ResidualStore_append_more_than_capacity_reservoir_sampling():
+    """
+    Test the store keeps `capacity` values, all of them appended, and the
+    result is reproducible for the same random_state.
+    """
+    store_1 = ResidualStore(capacity=100, random_state=123)
+    store_2 = ResidualStore(capacity=100, random_state=123)
+    for i in range(10):
+        store_1.append(np.arange(i * 100, (i + 1) * 100))
+    store_2.append(np.arange(1000))
+
+    assert len(store_1) == 100
+    assert store_1.n_seen.tolist() == [1000]
+    assert len(np.unique(store_1.values)) == 100
+    assert np.isin(store_1.values, np.arange(1000)).all()
+    # Values appended after the store is full are also sampled.
+    assert (store_1.values >= 100).any()
+    np.testing.assert_array_equal(store_1.values, store_2.values)
+
+
+def test_ResidualStore_reservoir_sampling_is_uniform():
+    """
+    Test all the residuals appended have the same probability of being stored.
+    """
+    counts = np.zeros(10)
+    for random_state in range(500):
+        store = ResidualStore(capacity=10, random_state=random_state)
+        store.append(np.arange(100))
+        counts += np.bincount(store.values.astype(int) // 10, minlength=10)
+
+    # Each decile is expected 500 times.
+    assert np.all(np.abs(counts - 500) < 100)
+
+
+def test_ResidualStore_bins():
+    """
+    Test residuals are stored and sampled by bin.
+    """
+    store = ResidualStore(capacity=10, n_bins=2)
+    store.append(residuals=np.array([1., 2., 3., 4.]), bins=np.array([0, 1, 0, 1]))
+    store.append(residuals=np.array([5.]), bins=1)
+
+    np.testing.assert_array_equal(store.get(bins=0), np.array([1., 3.]))
+    np.testing.assert_array_equal(store.get(bins=1), np.array([2., 4., 5.]))
+    np.testing.assert_array_equal(store.values, np.array([1., 3., 2., 4., 5.]))
+    assert np.isin(store.sample(size=(3, 4), random_state=123, bins=1), [2., 4., 5.]).all()
+    assert store.sample(size=(3, 4), random_state=123).shape == (3, 4)
+
+
+def test_ResidualStore_sample_exception_when_empty():
+    """
+    Test ValueError is raised when sampling from an empty store.
+    """
+    store = ResidualStore(capacity=10)
+
+    err_msg = re.escape("The store has no residuals to sample.")
+    with pytest.raises(ValueError, match = err_msg):
+        store.sample(size=3)
+
+
+def test_ResidualStore_sample_per_bin():
+    """
+    Test each row is drawn from its bin and the draws are the same as 
+    `numpy.random.Generator.choice` on the residuals of each bin.
+    """
+    store = ResidualStore(capacity=10, n_bins=3)
+    store.append(residuals=np.array([1., 2., 3.]), bins=0)
+    store.append(residuals=np.array([10., 20.]), bins=2)
+    results = store.sample_per_bin(bins=[2, 0], size=5, random_state=123)
+
+    assert results.shape == (2, 5)
+    assert np.isin(results[0], [10., 20.]).all()
+    assert np.isin(results[1], [1., 2., 3.]).all()
+
+    err_msg = re.escape("Bins [1] have no residuals to sample.")
+    with pytest.raises(ValueError, match = err_msg):
+        store.sample_per_bin(bins=[0, 1], size=5)
+
+
+def test_ResidualStore_sample_same_as_numpy_choice():
+    """
+    Test sample draws the same values as `numpy.random.Generator.choice` with
+    replacement for the same seed.
+    """
+    residuals = np.arange(37.)
+    store = ResidualStore(capacity=100)
+    store.append(residuals)
+    expected = np.random.default_rng(seed=123).choice(a=residuals, size=8, replace=True)
+
+    np.testing.assert_array_equal(store.sample(size=8, random_state=123), expected)
+
+
+@pytest.mark.parametrize("residuals", 
+                         [np.array([1., 2., 3.]), pd.Series([1., 2., 3.]), {0: [1., 2.], 1: None}], 
+                         ids = lambda x : f'{type(x)}')
+def test_to_residual_store_output(residuals):
+    """
+    Test residuals assigned directly to a forecaster attribute are stored in a
+    ResidualStore, and a ResidualStore is returned unchanged.
+    """
+    store = to_residual_store(residuals=residuals, capacity=10, n_bins=2)
+
+    assert isinstance(store, ResidualStore)
+    if isinstance(residuals, dict):
+        np.testing.assert_array_equal(store.get(bins=0), np.array([1., 2.]))
+        assert len(store.get(bins=1)) == 0
+    else:
+        np.testing.assert_array_equal(store.values, np.array([1., 2., 3.]))
+    assert to_residual_store(residuals=store) is store
@@ -7,6 +7,7 @@ import pandas as pd
 from skforecast.ForecasterAutoreg import ForecasterAutoreg
 from skforecast.utils import save_forecaster
 from skforecast.utils import load_forecaster
+from skforecast.utils import ResidualStore
 from sklearn.linear_model import LinearRegression
 
 
@@ -30,5 +31,7 @@ def test_save_and_load_forecaster_persistence():
             assert joblib.hash(attribute_forecaster) == joblib.hash(attribute_forecaster_loaded)
         elif isinstance(attribute_forecaster, (np.ndarray, pd.Series, pd.DataFrame, pd.Index)):
             assert (attribute_forecaster == attribute_forecaster_loaded).all()
+        elif isinstance(attribute_forecaster, ResidualStore):
+            assert (attribute_forecaster.values == attribute_forecaster_loaded.values).all()
         else:
             assert attribute_forecaster == attribute_forecaster_loaded
\ No newline at end of file
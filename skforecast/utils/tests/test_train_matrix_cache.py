@@ -0,0 +1,80 @@
+# Unit test TrainMatrixCache
+# ==============================================================================
+import pickle
+from copy import deepcopy
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+from skforecast.ForecasterAutoreg import ForecasterAutoreg
+from skforecast.utils import TrainMatrixCache
+
+# Fixtures
+y = pd.Series(np.arange(50, dtype=float), name='y')
+
+
+def test_TrainMatrixCache_create_train_X_y_reuses_matrices_when_same_configuration():
+    """
+    Test training matrices are created only once and the stored ones are
+    returned when the forecaster configuration and the data do not change.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3,
+                                   transformer_y=StandardScaler())
+    cache = TrainMatrixCache()
+    X_1, y_1 = cache.create_train_X_y(forecaster=forecaster, y=y)
+    X_2, y_2 = cache.create_train_X_y(forecaster=forecaster, y=y)
+    expected_X, expected_y = forecaster.create_train_X_y(y=y)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    pd.testing.assert_frame_equal(X_2, expected_X)
+    pd.testing.assert_series_equal(y_2, expected_y)
+    assert forecaster.X_train_col_names == ['lag_1', 'lag_2', 'lag_3']
+
+
+def test_TrainMatrixCache_create_train_X_y_new_entry_when_lags_change():
+    """
+    Test a new entry is created when the lags of the forecaster change.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    cache = TrainMatrixCache()
+    cache.create_train_X_y(forecaster=forecaster, y=y)
+    forecaster.set_lags(5)
+    X, _ = cache.create_train_X_y(forecaster=forecaster, y=y)
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+    assert X.shape == (45, 5)
+
+
+def test_TrainMatrixCache_evicts_least_recently_used_entries_when_max_size_mb_exceeded():
+    """
+    Test least recently used entries are discarded when the memory used by
+    the stored matrices exceeds `max_size_mb`.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    cache = TrainMatrixCache()
+    cache.create_train_X_y(forecaster=forecaster, y=y)
+    cache.max_size_mb = cache.size_mb * 1.5
+    cache.create_train_X_y(forecaster=forecaster, y=y + 1)
+
+    assert len(cache) == 1
+    cache.create_train_X_y(forecaster=forecaster, y=y + 1)
+    assert cache.hits == 1
+
+
+def test_TrainMatrixCache_shared_by_deepcopy_and_emptied_by_pickle():
+    """
+    Test the cache is shared by deep copies of a forecaster and its entries
+    are discarded when pickled.
+    """
+    forecaster = ForecasterAutoreg(LinearRegression(), lags=3)
+    forecaster._train_matrix_cache = TrainMatrixCache()
+    forecaster.fit(y=y)
+    forecaster_copy = deepcopy(forecaster)
+    forecaster_copy.fit(y=y)
+
+    assert forecaster_copy._train_matrix_cache is forecaster._train_matrix_cache
+    assert forecaster._train_matrix_cache.hits == 1
+
+    cache = pickle.loads(pickle.dumps(forecaster._train_matrix_cache))
+    assert len(cache) == 0
+    assert cache.size_mb == 0.
@@ -0,0 +1,85 @@
+# Unit test transform_bootstrapping_matrix
+# ==============================================================================
+import re
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import PowerTransformer
+from sklearn.preprocessing import MinMaxScaler
+from sklearn.preprocessing import RobustScaler
+from sklearn.preprocessing import FunctionTransformer
+from skforecast.utils import transform_series
+from skforecast.utils import transform_bootstrapping_matrix
+
+# Fixtures
+y = pd.Series(np.array([1.16, 3.28, 0.07, 2.4, 0.25, 0.56, 1.42, 1.26, 1.78, 1.49]), name='y')
+boot_predictions = pd.DataFrame(
+                       data    = np.array([[0.5, 1.2, 2.3],
+                                           [-0.4, 0.1, 0.8],
+                                           [1.7, -1.1, 0.3],
+                                           [0.2, 0.9, -0.6]]),
+                       index   = pd.RangeIndex(start=10, stop=14),
+                       columns = ['pred_boot_0', 'pred_boot_1', 'pred_boot_2']
+                   )
+
+
+def test_transform_bootstrapping_matrix_exception_when_boot_predictions_is_not_pandas_DataFrame():
+    """
+    Test exception is raised when boot_predictions is not a pandas DataFrame.
+    """
+    err_msg = re.escape("`boot_predictions` argument must be a pandas DataFrame.")
+    with pytest.raises(TypeError, match = err_msg):
+        transform_bootstrapping_matrix(
+            boot_predictions  = boot_predictions.to_numpy(),
+            transformer       = None,
+            inverse_transform = True
+        )
+
+
+def test_transform_bootstrapping_matrix_when_transformer_is_None():
+    """
+    Test the output of transform_bootstrapping_matrix when transformer is None.
+    """
+    results = transform_bootstrapping_matrix(
+                  boot_predictions  = boot_predictions,
+                  transformer       = None,
+                  inverse_transform = True
+              )
+
+    pd.testing.assert_frame_equal(results, boot_predictions)
+
+
+@pytest.mark.parametrize("transformer", 
+                         [StandardScaler(), PowerTransformer(), MinMaxScaler(), RobustScaler(),
+                          FunctionTransformer(func=np.arcsinh, inverse_func=np.sinh),
+                          FunctionTransformer(func=lambda x: np.cumsum(x, axis=0),
+                                              inverse_func=lambda x: np.diff(x, axis=0, prepend=0),
+                                              check_inverse=False)], 
+                         ids = lambda tr : f'transformer: {type(tr).__name__}')
+@pytest.mark.parametrize("inverse_transform", 
+                         [True, False], 
+                         ids = lambda inv : f'inverse_transform: {inv}')
+def test_transform_bootstrapping_matrix_equal_to_transform_series_each_column(transformer, inverse_transform):
+    """
+    Test the output of transform_bootstrapping_matrix is the same as transforming
+    each column with transform_series. Transformers that are not elementwise
+    (cumsum) are applied to each column.
+    """
+    transformer.fit(y.to_frame())
+    expected = boot_predictions.copy()
+    for col in expected.columns:
+        expected[col] = transform_series(
+                            series            = expected[col],
+                            transformer       = transformer,
+                            fit               = False,
+                            inverse_transform = inverse_transform
+                        )
+
+    results = transform_bootstrapping_matrix(
+                  boot_predictions  = boot_predictions,
+                  transformer       = transformer,
+                  inverse_transform = inverse_transform
+              )
+
+    pd.testing.assert_frame_equal(results, expected)
@@ -13,10 +13,20 @@ import joblib
 import numpy as np
 import pandas as pd
 import sklearn
+from sklearn.base import clone
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import FunctionTransformer
+from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import MinMaxScaler
+from sklearn.preprocessing import RobustScaler
+from sklearn.preprocessing import PowerTransformer
 import inspect
+import time
+from contextvars import ContextVar
+import tempfile
 from copy import deepcopy
+from collections import OrderedDict
+from joblib import Parallel, delayed, effective_n_jobs
 
 optional_dependencies = {
     "sarimax": ['statsmodels>=0.12, <0.14', 'pmdarima>=2.0, <2.1'],
@@ -750,11 +760,13 @@ def preprocess_exog(
 
 def exog_to_direct(
     exog: np.ndarray,
-    steps: int
+    steps: int,
+    return_view: bool=False
 )-> np.ndarray:
     """
     Transforms `exog` to `np.ndarray` with the shape needed for direct
-    forecasting.
+    forecasting. Columns are ordered by exogenous variable and, within each
+    variable, by step.
     
     Parameters
     ----------        
@@ -764,35 +776,89 @@ def exog_to_direct(
     steps : int.
         Number of steps that will be predicted using this exog.
 
+    return_view : bool, default `False`
+        If `True`, return a read-only strided view of `exog` with shape
+        (samples - steps + 1, n_exog, steps) instead of the 2d matrix. No
+        data is copied, the values of step `i` (starting at 0) are
+        `exog_transformed[:, :, i]`.
+        **New in version 0.7.0**
+
     Returns 
     -------
     exog_transformed : numpy ndarray
+        Array with shape (samples - steps + 1, n_exog * steps), or 
+        (samples - steps + 1, n_exog, steps) if `return_view=True`.
 
     """
 
-    exog_transformed = []
-
     if exog.ndim < 2:
         exog = exog.reshape(-1, 1)
 
-    for column in range(exog.shape[1]):
+    # Window `i` of variable `j` is exog[i:i + steps, j], no data is copied.
+    exog_transformed = np.lib.stride_tricks.sliding_window_view(
+                           exog,
+                           window_shape = steps,
+                           axis         = 0
+                       )
 
-        exog_column_transformed = []
+    if not return_view:
+        exog_transformed = exog_transformed.reshape(exog_transformed.shape[0], -1)
 
-        for i in range(exog.shape[0] - (steps -1)):
-            exog_column_transformed.append(exog[i:i + steps, column])
+    return exog_transformed
 
-        if len(exog_column_transformed) > 1:
-            exog_column_transformed = np.vstack(exog_column_transformed)
 
-        exog_transformed.append(exog_column_transformed)
+def allocate_array(
+    shape: tuple,
+    dtype: type=np.float64,
+    memmap_dir: Optional[str]=None
+) -> np.ndarray:
+    """
+    Create an array of zeros in memory or, if `memmap_dir` is not `None`, a
+    `numpy.memmap` backed by an anonymous temporary file created in `memmap_dir`.
+    Pages of a memmap are written to disk when memory is needed, so arrays larger
+    than the available RAM can be filled in chunks. The file is removed from 
+    disk once the array is no longer referenced.
 
-    if len(exog_transformed) > 1:
-        exog_transformed = np.hstack(exog_transformed)
-    else:
-        exog_transformed = exog_column_transformed
+    **New in version 0.7.0**
 
-    return exog_transformed
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the array.
+
+    dtype : numpy dtype, default `numpy.float64`
+        Data type of the array. It must be numeric if `memmap_dir` is not `None`.
+
+    memmap_dir : str, default `None`
+        Directory where the file of the memmap is created. If `None`, the array
+        is created in memory.
+
+    Returns
+    -------
+    array : numpy ndarray, numpy memmap
+        Array filled with zeros.
+
+    """
+
+    if memmap_dir is None:
+        return np.zeros(shape=shape, dtype=dtype)
+
+    if np.dtype(dtype).hasobject:
+        raise TypeError(
+            ("Arrays of dtype object cannot be memory-mapped. All the exogenous "
+             "variables must be numeric when `memmap_dir` is used.")
+        )
+
+    # An empty memmap cannot be created, a file of size zero is not mappable.
+    if np.prod(shape) == 0:
+        return np.zeros(shape=shape, dtype=dtype)
+
+    # The anonymous file is zero filled and deleted when closed, the mapping
+    # keeps the data accessible.
+    with tempfile.TemporaryFile(dir=memmap_dir, suffix='.skforecast') as file:
+        array = np.memmap(file, dtype=dtype, mode='w+', shape=shape)
+
+    return array
 
 
 def expand_index(
@@ -837,6 +903,77 @@ def expand_index(
     return new_index
 
 
+def append_last_window(
+    last_window: Union[pd.Series, pd.DataFrame],
+    new_values: Union[pd.Series, pd.DataFrame],
+    window_size: int
+) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Append new observations to the end of `last_window` keeping only the last
+    `window_size` values. If the index of `last_window` is a RangeIndex or a 
+    DatetimeIndex with frequency, `new_values` must start one step ahead of 
+    `last_window` end and the returned window keeps the index type and frequency.
+
+    A new window is returned (`pd.concat` copies the values), `last_window` is
+    not modified in place. The copy has `window_size` + len(`new_values`) rows.
+    
+    **New in version 0.7.0**
+
+    Parameters
+    ----------
+    last_window : pandas Series, pandas DataFrame
+        Values of the series used to create the predictors (lags) needed in the 
+        first iteration of prediction (t + 1).
+
+    new_values : pandas Series, pandas DataFrame
+        New observations of the series, same type as `last_window`.
+
+    window_size : int
+        Number of values stored in the returned window.
+
+    Returns
+    -------
+    last_window : pandas Series, pandas DataFrame
+        Last `window_size` values of `last_window` and `new_values`.
+
+    """
+
+    if not isinstance(new_values, type(last_window)):
+        raise TypeError(
+            f'`new_values` must be a {type(last_window)}. Got {type(new_values)}.'
+        )
+
+    updated_window = pd.concat([last_window, new_values]).iloc[-window_size:]
+
+    if isinstance(last_window.index, pd.RangeIndex) or \
+       (isinstance(last_window.index, pd.DatetimeIndex) and last_window.index.freq is not None):
+
+        expected_index = expand_index(last_window.index, len(new_values))
+        if not (isinstance(new_values.index, type(expected_index)) and new_values.index.equals(expected_index)):
+            raise ValueError(
+                (f'`new_values` must start one step ahead of `last_window` end '
+                 f'and have no gaps.\n'
+                 f'    `last_window` ends at : {last_window.index[-1]}.\n'
+                 f'    Expected index        : {expected_index[0]} to {expected_index[-1]}.\n'
+                 f'    `new_values` index    : {new_values.index[0]} to {new_values.index[-1]}.')
+            )
+
+        if isinstance(expected_index, pd.DatetimeIndex):
+            updated_index = pd.date_range(
+                                end     = expected_index[-1],
+                                periods = len(updated_window),
+                                freq    = expected_index.freq
+                            )
+        else:
+            updated_index = pd.RangeIndex(
+                                start = expected_index[-1] + 1 - len(updated_window),
+                                stop  = expected_index[-1] + 1
+                            )
+        updated_window.index = updated_index
+
+    return updated_window
+
+
 def transform_series(
     series: pd.Series,
     transformer,
@@ -882,19 +1019,20 @@ def transform_series(
 
     data = series.to_frame()
 
-    if fit and hasattr(transformer, 'fit'):
-        transformer.fit(data)
+    with timed_phase('transform'):
+        if fit and hasattr(transformer, 'fit'):
+            transformer.fit(data)
 
-    # If argument feature_names_in_ is overwritten to allow using the transformer on
-    # other series than those that were passed during fit.
-    if hasattr(transformer, 'feature_names_in_') and transformer.feature_names_in_[0] != data.columns[0]:
-        transformer = deepcopy(transformer)
-        transformer.feature_names_in_ = np.array([data.columns[0]], dtype=object)
+        # If argument feature_names_in_ is overwritten to allow using the transformer on
+        # other series than those that were passed during fit.
+        if hasattr(transformer, 'feature_names_in_') and transformer.feature_names_in_[0] != data.columns[0]:
+            transformer = deepcopy(transformer)
+            transformer.feature_names_in_ = np.array([data.columns[0]], dtype=object)
 
-    if inverse_transform:
-        values_transformed = transformer.inverse_transform(data)
-    else:
-        values_transformed = transformer.transform(data)   
+        if inverse_transform:
+            values_transformed = transformer.inverse_transform(data)
+        else:
+            values_transformed = transformer.transform(data)   
 
     if hasattr(values_transformed, 'toarray'):
         # If the returned values are in sparse matrix format, it is converted to dense array.
@@ -918,6 +1056,209 @@ def transform_series(
     return data_transformed
 
 
+def transform_numpy(
+    array: np.ndarray,
+    transformer,
+    inverse_transform: bool=False
+) -> np.ndarray:
+    """
+    Transform raw values of a 1d numpy ndarray with a scikit-learn alike 
+    transformer fitted on a single feature, without creating pandas objects.
+    Used in the prediction paths that work only with numpy arrays.
+
+    **New in version 0.7.0**
+
+    Parameters
+    ----------
+    array : numpy ndarray
+        1d array to be transformed.
+
+    transformer : scikit-learn alike transformer (preprocessor).
+        scikit-learn alike transformer (preprocessor) with methods: fit, transform,
+        fit_transform and inverse_transform, already fitted.
+
+    inverse_transform : bool, default `False`
+        Transform back the data to the original representation.
+
+    Returns
+    -------
+    array_transformed : numpy ndarray
+        Transformed 1d array.
+
+    """
+
+    if transformer is None:
+        return array
+
+    with warnings.catch_warnings():
+        # Suppress scikit-learn warning: "X does not have valid feature names,
+        # but StandardScaler was fitted with feature names".
+        warnings.simplefilter("ignore")
+        if inverse_transform:
+            array_transformed = transformer.inverse_transform(array.reshape(-1, 1))
+        else:
+            array_transformed = transformer.transform(array.reshape(-1, 1))
+
+    if hasattr(array_transformed, 'toarray'):
+        # If the returned values are in sparse matrix format, it is converted to dense array.
+        array_transformed = array_transformed.toarray()
+
+    return np.asarray(array_transformed, dtype=float).ravel()
+
+
+def transform_exog_numpy(
+    exog: np.ndarray,
+    exog_col_names: Union[str, list],
+    transformer
+) -> np.ndarray:
+    """
+    Transform the raw values of the exogenous variables, passed as a numpy
+    ndarray with the columns in the same order as `exog_col_names`, with the
+    transformer fitted during training. A pandas DataFrame is only created when
+    `transformer` is not `None` since it may select the columns by name 
+    (e.g. ColumnTransformer).
+
+    **New in version 0.7.0**
+
+    Parameters
+    ----------
+    exog : numpy ndarray
+        1d or 2d array with the values of the exogenous variables.
+
+    exog_col_names : str, list
+        Names of the exogenous variables used in training.
+
+    transformer : scikit-learn alike transformer (preprocessor) or ColumnTransformer.
+        Transformer fitted during training.
+
+    Returns
+    -------
+    exog_transformed : numpy ndarray
+        2d array with the transformed values.
+
+    """
+
+    if exog.ndim == 1:
+        exog = exog.reshape(-1, 1)
+
+    if transformer is not None:
+        exog_col_names = exog_col_names if isinstance(exog_col_names, list) else [exog_col_names]
+        exog = transform_dataframe(
+                   df                = pd.DataFrame(exog, columns=exog_col_names),
+                   transformer       = transformer,
+                   fit               = False,
+                   inverse_transform = False
+               ).to_numpy()
+
+    return exog
+
+
+def _is_elementwise_transformer(
+    transformer
+) -> bool:
+    """
+    Check if a transformer is known to transform each value independently of
+    the others (elementwise). Only these transformers can transform values
+    that are not consecutive observations of a series, for example several 
+    columns stacked in a single one.
+
+    Parameters
+    ----------
+    transformer : scikit-learn alike transformer (preprocessor).
+        scikit-learn alike transformer (preprocessor).
+
+    Returns
+    -------
+    is_elementwise : bool
+        `True` if the transformer is StandardScaler, MinMaxScaler, RobustScaler,
+        PowerTransformer or a FunctionTransformer whose functions are numpy 
+        ufuncs.
+
+    """
+
+    if isinstance(transformer, (StandardScaler, MinMaxScaler, RobustScaler, PowerTransformer)):
+        is_elementwise = True
+    elif isinstance(transformer, FunctionTransformer):
+        is_elementwise = all(
+            fun is None or isinstance(fun, np.ufunc)
+            for fun in [transformer.func, transformer.inverse_func]
+        )
+    else:
+        is_elementwise = False
+
+    return is_elementwise
+
+
+def transform_bootstrapping_matrix(
+    boot_predictions: pd.DataFrame,
+    transformer,
+    inverse_transform: bool=True
+) -> pd.DataFrame:
+    """
+    Transform all the values of a pandas DataFrame whose columns are values of the
+    same series, for example the predictions of each bootstrapping iteration, with
+    the scikit-learn alike transformer (preprocessor) fitted on that series.
+    Elementwise transformers (StandardScaler, MinMaxScaler, RobustScaler,
+    PowerTransformer and FunctionTransformer with numpy ufuncs) transform each
+    value independently, so all the columns are stacked and transformed with a
+    single call. Any other transformer is applied to each column separately.
+
+    Parameters
+    ----------
+    boot_predictions : pandas DataFrame
+        Values to transform, each column contains values of the same series.
+
+    transformer : scikit-learn alike transformer (preprocessor).
+        scikit-learn alike transformer (preprocessor) with methods: fit, transform,
+        fit_transform and inverse_transform, already fitted.
+
+    inverse_transform : bool, default `True`
+        Transform back the data to the original representation.
+
+    Returns
+    -------
+    boot_predictions_transformed : pandas DataFrame
+        Transformed DataFrame with the same index and columns as `boot_predictions`.
+
+    """
+
+    if not isinstance(boot_predictions, pd.DataFrame):
+        raise TypeError(
+            "`boot_predictions` argument must be a pandas DataFrame."
+        )
+
+    if transformer is None:
+        return boot_predictions
+
+    if not _is_elementwise_transformer(transformer):
+        boot_predictions_transformed = boot_predictions.copy()
+        for col in boot_predictions_transformed.columns:
+            boot_predictions_transformed[col] = transform_series(
+                                                    series            = boot_predictions_transformed[col],
+                                                    transformer       = transformer,
+                                                    fit               = False,
+                                                    inverse_transform = inverse_transform
+                                                )
+
+        return boot_predictions_transformed
+
+    name = transformer.feature_names_in_[0] if hasattr(transformer, 'feature_names_in_') else 'y'
+    values_transformed = transform_series(
+                             series            = pd.Series(boot_predictions.to_numpy().ravel(), name=name),
+                             transformer       = transformer,
+                             fit               = False,
+                             inverse_transform = inverse_transform
+                         )
+
+    boot_predictions_transformed = pd.DataFrame(
+                                       data    = values_transformed.to_numpy().reshape(boot_predictions.shape),
+                                       index   = boot_predictions.index,
+                                       columns = boot_predictions.columns
+                                   )
+
+    return boot_predictions_transformed
+
+
 def transform_dataframe(
     df: pd.DataFrame,
     transformer,
@@ -963,13 +1304,14 @@ def transform_dataframe(
             '`inverse_transform` is not available when using ColumnTransformers.'
         )
  
-    if not inverse_transform:
-        if fit:
-            values_transformed = transformer.fit_transform(df)
+    with timed_phase('transform'):
+        if not inverse_transform:
+            if fit:
+                values_transformed = transformer.fit_transform(df)
+            else:
+                values_transformed = transformer.transform(df)
         else:
-            values_transformed = transformer.transform(df)
-    else:
-        values_transformed = transformer.inverse_transform(df)
+            values_transformed = transformer.inverse_transform(df)
 
     if hasattr(values_transformed, 'toarray'):
         # If the returned values are in sparse matrix format, it is converted to dense
@@ -991,6 +1333,1259 @@ def transform_dataframe(
     return df_transformed
 
 
+def _fit_distribution_rows(
+    distribution: object,
+    values: np.ndarray
+) -> np.ndarray:
+    """
+    Fit `distribution` by maximum likelihood to each row of `values`.
+    
+    Parameters
+    ----------
+    distribution : Object
+        A distribution object from scipy.stats.
+
+    values : numpy ndarray
+        2d array, each row is an independent sample.
+
+    Returns
+    -------
+    param_values : numpy ndarray
+        Parameters estimated for each row of `values`.
+
+    """
+
+    param_values = np.array([distribution.fit(row) for row in values], dtype=float)
+
+    return param_values
+
+
+def fit_distribution(
+    boot_samples: Union[np.ndarray, pd.DataFrame],
+    distribution: object,
+    method: str='mle',
+    n_jobs: int=1
+) -> np.ndarray:
+    """
+    Fit a probability distribution to each row of a bootstrapping matrix. The
+    estimators available in closed form are applied to all rows at once:
+
+    - `method='mle'`: maximum likelihood estimation. `norm` and `expon` are
+    estimated with vectorized numpy operations (same result as `distribution.fit`),
+    any other distribution is fitted row by row with `distribution.fit`, 
+    distributing the rows among `n_jobs` jobs.
+    - `method='moments'`: method of moments, available for `norm`, `lognorm` 
+    and `gamma`. For `lognorm` and `gamma`, rows whose skewness is not positive
+    have no moments estimate and are fitted by maximum likelihood.
+    
+    **New in version 0.7.0**
+
+    Parameters
+    ----------
+    boot_samples : numpy ndarray, pandas DataFrame
+        2d array, each row contains the bootstrapping predictions of one step.
+
+    distribution : Object
+        A distribution object from scipy.stats.
+
+    method : str, default `'mle'`
+        Estimation method, `'mle'` or `'moments'`.
+
+    n_jobs : int, default `1`
+        Number of jobs used to fit by maximum likelihood the distributions with
+        no vectorized estimator. If `-1`, all processors are used.
+
+    Returns
+    -------
+    param_values : numpy ndarray
+        Parameters estimated for each row, in the same order as `distribution.fit`
+        returns them (shape parameters, loc and scale).
+
+    """
+
+    if method not in ['mle', 'moments']:
+        raise ValueError(
+            f"`method` must be 'mle' or 'moments'. Got '{method}'."
+        )
+
+    name = getattr(distribution, 'name', None)
+    if method == 'moments' and name not in ['norm', 'lognorm', 'gamma']:
+        raise ValueError(
+            (f"Method of moments is only available for distributions 'norm', "
+             f"'lognorm' and 'gamma'. Got '{name}'.")
+        )
+
+    values = np.asarray(boot_samples, dtype=float)
+    mean = values.mean(axis=1)
+    std = values.std(axis=1)
+
+    if name == 'norm':
+        # The maximum likelihood and moments estimators are the same.
+        return np.column_stack((mean, std))
+
+    if method == 'mle' and name == 'expon':
+        loc = values.min(axis=1)
+        return np.column_stack((loc, mean - loc))
+
+    if method == 'mle':
+        n_jobs = min(effective_n_jobs(n_jobs), len(values))
+        if n_jobs <= 1:
+            return _fit_distribution_rows(distribution, values)
+        param_values = Parallel(n_jobs=n_jobs)(
+                           delayed(_fit_distribution_rows)(distribution, block)
+                           for block in np.array_split(values, n_jobs)
+                       )
+        return np.vstack(param_values)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skew = ((values - mean.reshape(-1, 1))**3).mean(axis=1) / std**3
+        if name == 'gamma':
+            shape = 4 / skew**2
+            scale = std * skew / 2
+            loc = mean - shape * scale
+        else:
+            # Skewness of lognorm is (w + 2) * sqrt(w - 1) with w = exp(s**2). 
+            # With u = sqrt(w - 1), u**3 + 3u - skew = 0, solved by Cardano's 
+            # formula.
+            root = np.sqrt(skew**2 / 4 + 1)
+            u = np.cbrt(skew / 2 + root) + np.cbrt(skew / 2 - root)
+            w = 1 + u**2
+            shape = np.sqrt(np.log(w))
+            scale = std / np.sqrt(w * (w - 1))
+            loc = mean - scale * np.sqrt(w)
+
+    param_values = np.column_stack((shape, loc, scale))
+    invalid = ~(skew > 0) | ~np.isfinite(param_values).all(axis=1)
+    if invalid.any():
+        param_values[invalid] = fit_distribution(
+                                    boot_samples = values[invalid],
+                                    distribution = distribution,
+                                    method       = 'mle',
+                                    n_jobs       = n_jobs
+                                )
+
+    return param_values
+
+
+class TrainMatrixCache():
+    """
+    Least recently used (LRU) cache of the training matrices created with the
+    method `create_train_X_y` of a forecaster (`_create_train_matrix` in the 
+    forecasters that train one regressor per step). When the same training matrices
+    are needed several times, for example when different regressor
+    hyperparameters are evaluated with the same lags and data, they are created
+    only once.
+
+    Entries are identified by the type of forecaster, the attributes that define
+    the predictors (`lags`, `steps`, `window_size`, `source_code_create_predictors`,
+    `vectorized_predictors`, `dtype`), the configuration of the transformers and
+    the values of `y` and `exog`. Along with the training matrices, the fitted
+    transformers and `X_train_col_names` are stored and restored in the forecaster
+    when an entry is reused.
+
+    The cache is shared by all the copies of a forecaster created with `deepcopy`.
+    When pickled (e.g. sent to another process) its entries are discarded.
+    
+    Parameters
+    ----------
+    max_size_mb : float, default `512`
+        Maximum memory, in megabytes, used by the stored training matrices. When
+        exceeded, the least recently used entries are discarded.
+
+    Attributes
+    ----------
+    max_size_mb : float
+        Maximum memory, in megabytes, used by the stored training matrices.
+
+    size_mb : float
+        Memory, in megabytes, used by the stored training matrices.
+
+    hits : int
+        Number of times stored training matrices have been reused.
+
+    misses : int
+        Number of times training matrices have been created.
+
+    """
+
+    def __init__(
+        self,
+        max_size_mb: float=512
+    ) -> None:
+
+        self.max_size_mb = max_size_mb
+        self.size_mb     = 0.
+        self.hits        = 0
+        self.misses      = 0
+        self._entries    = OrderedDict()
+
+
+    def __len__(
+        self
+    ) -> int:
+
+        return len(self._entries)
+
+
+    def __deepcopy__(
+        self,
+        memo: dict
+    ) -> object:
+        """
+        Copies of a forecaster share the same cache.
+        """
+
+        return self
+
+
+    def __getstate__(
+        self
+    ) -> dict:
+        """
+        Entries are not pickled.
+        """
+
+        state = self.__dict__.copy()
+        state['size_mb'] = 0.
+        state['_entries'] = OrderedDict()
+
+        return state
+
+
+    def clear(
+        self
+    ) -> None:
+        """
+        Remove all entries.
+        """
+
+        self._entries.clear()
+        self.size_mb = 0.
+
+
+    def _get_key(
+        self,
+        forecaster,
+        y: pd.Series,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None
+    ) -> Union[str, None]:
+        """
+        Identifier of the training matrices created by `forecaster` with `y`
+        and `exog`. If the transformers cannot be cloned, `None` is returned
+        and the training matrices are not cached.
+        """
+
+        predictors = {
+            attr: getattr(forecaster, attr, None)
+            for attr in ['lags', 'steps', 'window_size', 'source_code_create_predictors',
+                         'vectorized_predictors', 'dtype']
+        }
+
+        try:
+            # Transformers are identified by their configuration, not by their
+            # fitted state.
+            transformers = [
+                None if transformer is None else clone(transformer)
+                for transformer in [forecaster.transformer_y, forecaster.transformer_exog]
+            ]
+            key = joblib.hash(
+                      (type(forecaster).__name__, predictors, transformers, y, exog)
+                  )
+        except Exception:
+            key = None
+
+        return key
+
+
+    def create_train_X_y(
+        self,
+        forecaster,
+        y: pd.Series,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None
+    ) -> Tuple[pd.DataFrame, Union[pd.Series, pd.DataFrame]]:
+        """
+        Return the training matrices created with `forecaster.create_train_X_y(y, exog)`.
+        If they are already stored, the fitted transformers and `X_train_col_names`
+        are restored in the forecaster and stored matrices are returned.
+        
+        Parameters
+        ----------
+        forecaster : ForecasterAutoreg, ForecasterAutoregCustom, ForecasterAutoregDirect
+            Forecaster model.
+
+        y : pandas Series
+            Training time series.
+            
+        exog : pandas Series, pandas DataFrame, default `None`
+            Exogenous variable/s included as predictor/s.
+
+        Returns 
+        -------
+        X_train : pandas DataFrame
+            Pandas DataFrame with the training values (predictors).
+            
+        y_train : pandas Series, pandas DataFrame
+            Values (target) of the time series related to each row of `X_train`.
+
+        """
+
+        X_train, y_train = self._get_or_create(
+                               forecaster = forecaster,
+                               y          = y,
+                               exog       = exog,
+                               method     = 'create_train_X_y'
+                           )
+
+        return X_train, y_train
+
+
+    def create_train_matrix(
+        self,
+        forecaster,
+        y: pd.Series,
+        exog: Optional[Union[pd.Series, pd.DataFrame]]=None
+    ) -> object:
+        """
+        Return the `DirectTrainMatrix` created with `forecaster._create_train_matrix(y, exog)`.
+        If it is already stored, the fitted transformers and `X_train_col_names`
+        are restored in the forecaster and the stored object is returned.
+
+        **New in version 0.7.0**
+        
+        Parameters
+        ----------
+        forecaster : ForecasterAutoregDirect
+            Forecaster model.
+
+        y : pandas Series
+            Training time series.
+            
+        exog : pandas Series, pandas DataFrame, default `None`
+            Exogenous variable/s included as predictor/s.
+
+        Returns 
+        -------
+        train_matrix : DirectTrainMatrix
+            Training matrices of the forecaster.
+
+        """
+
+        train_matrix = self._get_or_create(
+                           forecaster = forecaster,
+                           y          = y,
+                           exog       = exog,
+                           method     = '_create_train_matrix'
+                       )
+
+        return train_matrix
+
+
+    def _get_or_create(
+        self,
+        forecaster,
+        y: pd.Series,
+        exog: Optional[Union[pd.Series, pd.DataFrame]],
+        method: str
+    ) -> Any:
+        """
+        Return the stored output of `getattr(forecaster, method)(y, exog)` or 
+        create and store it.
+        """
+
+        key = self._get_key(forecaster=forecaster, y=y, exog=exog)
+        if key is not None:
+            key = (key, method)
+
+        if key is not None and key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            train_matrices, transformer_y, transformer_exog, X_train_col_names, _ = \
+                self._entries[key]
+            forecaster.transformer_y     = deepcopy(transformer_y)
+            forecaster.transformer_exog  = deepcopy(transformer_exog)
+            forecaster.X_train_col_names = list(X_train_col_names)
+
+            return train_matrices
+
+        self.misses += 1
+        train_matrices = getattr(forecaster, method)(y=y, exog=exog)
+        
+        if key is not None:
+            if isinstance(train_matrices, tuple):
+                entry_size_mb = sum(
+                    np.sum(matrix.memory_usage(index=True)) for matrix in train_matrices
+                ) / 2**20
+            else:
+                entry_size_mb = train_matrices.nbytes / 2**20
+
+            if entry_size_mb <= self.max_size_mb:
+                while self.size_mb + entry_size_mb > self.max_size_mb:
+                    _, oldest_entry = self._entries.popitem(last=False)
+                    self.size_mb -= oldest_entry[-1]
+
+                self._entries[key] = (
+                    train_matrices,
+                    deepcopy(forecaster.transformer_y),
+                    deepcopy(forecaster.transformer_exog),
+                    list(forecaster.X_train_col_names),
+                    entry_size_mb
+                )
+                self.size_mb += entry_size_mb
+
+        return train_matrices
+
+
+class DirectTrainMatrix():
+    """
+    Training matrices of the forecasters that train one regressor per step 
+    (`ForecasterAutoregDirect`, `ForecasterAutoregMultiVariate`). Lags and 
+    exogenous variables are stored only once and the predictors of each step 
+    are created when they are requested, so the memory used is proportional 
+    to `n_samples * (n_lags + n_exog)` instead of `n_samples * (n_lags + n_exog * steps)`.
+
+    **New in version 0.7.0**
+    
+    Parameters
+    ----------
+    X_lags : numpy ndarray, shape (n_samples, n_lags)
+        Values of the lags, shared by all the steps.
+
+    y_train : numpy ndarray, shape (n_samples, steps)
+        Values (target) of each step.
+
+    index : pandas Index
+        Index of the training samples.
+
+    X_lags_col_names : list
+        Names of the lags.
+
+    y_train_col_names : list
+        Names of the target of each step.
+
+    X_exog : numpy ndarray, shape (n_samples, n_exog, steps), default `None`
+        Values of the exogenous variables of each step, usually the view created
+        with `exog_to_direct(return_view=True)`.
+
+    exog_col_names : list, default `None`
+        Names of the exogenous variables.
+
+    Attributes
+    ----------
+    X_lags : numpy ndarray, shape (n_samples, n_lags)
+        Values of the lags, shared by all the steps.
+
+    y_train : numpy ndarray, shape (n_samples, steps)
+        Values (target) of each step.
+
+    index : pandas Index
+        Index of the training samples.
+
+    X_lags_col_names : list
+        Names of the lags.
+
+    y_train_col_names : list
+        Names of the target of each step.
+
+    X_exog : numpy ndarray, shape (n_samples, n_exog, steps)
+        Values of the exogenous variables of each step.
+
+    exog_col_names : list
+        Names of the exogenous variables.
+
+    steps : int
+        Number of steps.
+
+    """
+
+    def __init__(
+        self,
+        X_lags: np.ndarray,
+        y_train: np.ndarray,
+        index: pd.Index,
+        X_lags_col_names: list,
+        y_train_col_names: list,
+        X_exog: Optional[np.ndarray]=None,
+        exog_col_names: Optional[list]=None
+    ) -> None:
+
+        self.X_lags            = X_lags
+        self.y_train           = y_train
+        self.index             = index
+        self.X_lags_col_names  = list(X_lags_col_names)
+        self.y_train_col_names = list(y_train_col_names)
+        self.X_exog            = X_exog
+        self.exog_col_names    = list(exog_col_names) if exog_col_names is not None else None
+        self.steps             = y_train.shape[1]
+
+
+    @property
+    def nbytes(
+        self
+    ) -> int:
+        """
+        Memory, in bytes, used by the stored values. Views of other arrays
+        count with the size of their elements.
+        """
+
+        nbytes = self.X_lags.nbytes + self.y_train.nbytes
+        if self.X_exog is not None:
+            nbytes += self.X_exog.shape[0] * self.X_exog.shape[1] * self.X_exog.itemsize
+
+        return nbytes
+
+
+    @property
+    def X_train_col_names(
+        self
+    ) -> list:
+        """
+        Names of the columns of the training matrix with the predictors of all
+        the steps (lags, and each exogenous variable for each step).
+        """
+
+        X_train_col_names = list(self.X_lags_col_names)
+        if self.X_exog is not None:
+            X_train_col_names.extend(
+                [f"{col_name}_step_{i+1}" for col_name in self.exog_col_names 
+                 for i in range(self.steps)]
+            )
+
+        return X_train_col_names
+
+
+    def get_step(
+        self,
+        step: int
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Create the training matrices of a specific step. The output is the same
+        as `filter_train_X_y_for_step` applied to the output of `to_frame`.
+
+        Parameters
+        ----------
+        step : int
+            Step for which the matrices are created. Starts at 1.
+
+        Returns 
+        -------
+        X_train_step : pandas DataFrame
+            Pandas DataFrame with the training values (predictors) for step.
+            
+        y_train_step : pandas Series
+            Values (target) of the time series related to each row of `X_train_step`.
+
+        """
+
+        if (step < 1) or (step > self.steps):
+            raise ValueError(
+                f"Invalid value `step`. For this forecaster, minimum value is 1 "
+                f"and the maximum step is {self.steps}."
+            )
+
+        step = step - 1 # Matrices X_train and y_train start at index 0.
+
+        if self.X_exog is None:
+            X_train_step = self.X_lags
+            X_train_step_col_names = self.X_lags_col_names
+        else:
+            X_train_step = np.column_stack((self.X_lags, self.X_exog[:, :, step]))
+            X_train_step_col_names = (
+                self.X_lags_col_names
+                + [f"{col_name}_step_{step+1}" for col_name in self.exog_col_names]
+            )
+
+        X_train_step = pd.DataFrame(
+                           data    = X_train_step,
+                           columns = X_train_step_col_names,
+                           index   = self.index
+                       )
+        y_train_step = pd.Series(
+                           data  = self.y_train[:, step],
+                           index = self.index,
+                           name  = self.y_train_col_names[step]
+                       )
+
+        return X_train_step, y_train_step
+
+
+    def to_frame(
+        self
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Create the training matrices with the predictors of all the steps, the
+        output of `create_train_X_y`.
+
+        Returns 
+        -------
+        X_train : pandas DataFrame
+            Pandas DataFrame with the training values (predictors).
+            
+        y_train : pandas DataFrame
+            Values (target) of the time series related to each row of `X_train`
+            for each step.
+
+        """
+
+        if self.X_exog is None:
+            X_train = self.X_lags
+        else:
+            X_train = np.column_stack(
+                          (self.X_lags, self.X_exog.reshape(self.X_exog.shape[0], -1))
+                      )
+
+        X_train = pd.DataFrame(
+                      data    = X_train,
+                      columns = self.X_train_col_names,
+                      index   = self.index
+                  )
+        y_train = pd.DataFrame(
+                      data    = self.y_train,
+                      index   = self.index,
+                      columns = self.y_train_col_names
+                  )
+
+        return X_train, y_train
+
+
+class ResidualStore():
+    """
+    Bounded store of residuals backed by a preallocated numpy array. Up to
+    `capacity` residuals are stored in each bin. Once a bin is full, new residuals
+    are added with reservoir sampling (algorithm R): the stored values are always
+    a uniform random sample of all the residuals appended to the bin.
+
+    Bins are optional and identified by an integer from 0 to `n_bins - 1`, for
+    example the step (horizon) of the prediction or the interval of the 
+    predicted value the residual belongs to.
+
+    **New in version 0.7.0**
+    
+    Parameters
+    ----------
+    capacity : int, default `1000`
+        Maximum number of residuals stored in each bin.
+
+    n_bins : int, default `1`
+        Number of bins.
+
+    random_state : int, default `123`
+        Sets a seed to the random generator used by reservoir sampling.
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of residuals stored in each bin.
+
+    n_bins : int
+        Number of bins.
+
+    random_state : int
+        Seed of the random generator used by reservoir sampling.
+
+    n_seen : numpy ndarray
+        Number of residuals appended to each bin.
+
+    """
+
+    def __init__(
+        self,
+        capacity: int=1000,
+        n_bins: int=1,
+        random_state: int=123
+    ) -> None:
+
+        if not isinstance(capacity, (int, np.integer)) or capacity < 1:
+            raise ValueError(
+                f'`capacity` must be an integer greater than 0. Got {capacity}.'
+            )
+        if not isinstance(n_bins, (int, np.integer)) or n_bins < 1:
+            raise ValueError(
+                f'`n_bins` must be an integer greater than 0. Got {n_bins}.'
+            )
+
+        self.capacity     = capacity
+        self.n_bins       = n_bins
+        self.random_state = random_state
+        self.n_seen       = np.zeros(n_bins, dtype=np.int64)
+        self._values      = np.full(shape=(n_bins, capacity), fill_value=np.nan, dtype=float)
+        self._rng         = np.random.default_rng(seed=random_state)
+
+
+    def __repr__(
+        self
+    ) -> str:
+
+        return (
+            f"{type(self).__name__}(capacity={self.capacity}, n_bins={self.n_bins}, "
+            f"n_stored={len(self)})"
+        )
+
+
+    def __len__(
+        self
+    ) -> int:
+
+        return int(np.minimum(self.n_seen, self.capacity).sum())
+
+
+    def __array__(
+        self,
+        dtype: Optional[type]=None
+    ) -> np.ndarray:
+
+        values = self.get()
+
+        return values if dtype is None else values.astype(dtype)
+
+
+    @property
+    def values(
+        self
+    ) -> np.ndarray:
+        """
+        Residuals stored in all bins.
+        """
+
+        return self.get()
+
+
+    def to_numpy(
+        self
+    ) -> np.ndarray:
+        """
+        Copy of the residuals stored in all bins.
+        """
+
+        return np.array(self.get())
+
+
+    def append(
+        self,
+        residuals: Union[np.ndarray, pd.Series],
+        bins: Optional[Union[int, np.ndarray]]=None
+    ) -> None:
+        """
+        Add residuals to the store.
+
+        Parameters
+        ----------
+        residuals : numpy ndarray, pandas Series
+            Residuals to add.
+
+        bins : int, numpy ndarray, default `None`
+            Bin of each residual. If an int, all residuals are added to that bin.
+            If `None`, all residuals are added to bin 0.
+
+        Returns
+        -------
+        None
+
+        """
+
+        residuals = np.asarray(residuals, dtype=float).ravel()
+
+        if bins is None or np.ndim(bins) == 0:
+            bin_ = 0 if bins is None else int(bins)
+            self._append_bin(residuals=residuals, bin_=bin_)
+        else:
+            bins = np.asarray(bins).ravel()
+            if len(bins) != len(residuals):
+                raise ValueError(
+                    (f'`bins` must have the same length as `residuals`. '
+                     f'Got {len(bins)} and {len(residuals)}.')
+                )
+            for bin_ in np.unique(bins):
+                self._append_bin(residuals=residuals[bins == bin_], bin_=int(bin_))
+
+
+    def _append_bin(
+        self,
+        residuals: np.ndarray,
+        bin_: int
+    ) -> None:
+        """
+        Add residuals to one bin using reservoir sampling once it is full.
+        """
+
+        if not 0 <= bin_ < self.n_bins:
+            raise ValueError(
+                f'Bins must be integers between 0 and {self.n_bins - 1}. Got {bin_}.'
+            )
+
+        n_seen = self.n_seen[bin_]
+        values = self._values[bin_]
+
+        # Free positions are filled in order.
+        n_free = max(0, min(self.capacity - n_seen, len(residuals)))
+        values[n_seen:n_seen + n_free] = residuals[:n_free]
+
+        # The i-th residual seen replaces a random stored value with probability
+        # capacity / i. When several new residuals replace the same position,
+        # the last one is kept.
+        remaining = residuals[n_free:]
+        if len(remaining) > 0:
+            n_total = n_seen + n_free + np.arange(1, len(remaining) + 1)
+            positions = self._rng.integers(low=0, high=n_total)
+            keep = positions < self.capacity
+            positions, remaining = positions[keep][::-1], remaining[keep][::-1]
+            positions, idx_last = np.unique(positions, return_index=True)
+            values[positions] = remaining[idx_last]
+
+        self.n_seen[bin_] += len(residuals)
+
+
+    def get(
+        self,
+        bins: Optional[Union[int, list]]=None
+    ) -> np.ndarray:
+        """
+        Residuals stored. With one bin, a read-only view of the preallocated
+        array is returned (no copy).
+
+        Parameters
+        ----------
+        bins : int, list, default `None`
+            Bin or bins whose residuals are returned. If `None`, residuals of 
+            all bins are returned.
+
+        Returns
+        -------
+        residuals : numpy ndarray
+            Residuals stored.
+
+        """
+
+        if bins is None:
+            bins = range(self.n_bins)
+        elif np.ndim(bins) == 0:
+            bins = [bins]
+
+        n_stored = np.minimum(self.n_seen, self.capacity)
+        if len(bins) == 1:
+            residuals = self._values[bins[0], :n_stored[bins[0]]].view()
+            residuals.flags.writeable = False
+        else:
+            residuals = np.concatenate(
+                            [self._values[bin_, :n_stored[bin_]] for bin_ in bins]
+                        )
+
+        return residuals
+
+
+    def sample(
+        self,
+        size: Union[int, tuple],
+        random_state: Optional[Union[int, np.random.Generator]]=None,
+        bins: Optional[Union[int, list]]=None
+    ) -> np.ndarray:
+        """
+        Draw residuals with replacement.
+
+        Parameters
+        ----------
+        size : int, tuple
+            Shape of the returned array.
+
+        random_state : int, numpy Generator, default `None`
+            Seed or random generator used to draw the residuals.
+
+        bins : int, list, default `None`
+            Bin or bins the residuals are drawn from. If `None`, all bins are 
+            used.
+
+        Returns
+        -------
+        sample_residuals : numpy ndarray
+            Residuals drawn.
+
+        """
+
+        residuals = self.get(bins=bins)
+        if len(residuals) == 0:
+            raise ValueError('The store has no residuals to sample.')
+
+        rng = np.random.default_rng(seed=random_state)
+        sample_residuals = residuals[rng.integers(low=0, high=len(residuals), size=size)]
+
+        return sample_residuals
+
+
+    def sample_per_bin(
+        self,
+        bins: list,
+        size: int,
+        random_state: Optional[Union[int, np.random.Generator]]=None
+    ) -> np.ndarray:
+        """
+        Draw residuals with replacement from each bin. The values are taken with
+        a single integer-index gather from the preallocated array, no residuals
+        are copied before drawing.
+
+        Parameters
+        ----------
+        bins : list
+            Bins the residuals are drawn from.
+
+        size : int
+            Number of residuals drawn from each bin.
+
+        random_state : int, numpy Generator, default `None`
+            Seed or random generator used to draw the residuals.
+
+        Returns
+        -------
+        sample_residuals : numpy ndarray
+            Residuals drawn, shape (len(bins), size). Row `i` is drawn from
+            `bins[i]`.
+
+        """
+
+        bins = np.asarray(bins, dtype=int)
+        n_stored = np.minimum(self.n_seen, self.capacity)[bins]
+        if (n_stored == 0).any():
+            raise ValueError(
+                f'Bins {bins[n_stored == 0].tolist()} have no residuals to sample.'
+            )
+
+        rng = np.random.default_rng(seed=random_state)
+        idx_residuals = rng.integers(
+                            low  = 0,
+                            high = n_stored.reshape(-1, 1),
+                            size = (len(bins), size)
+                        )
+        sample_residuals = np.take_along_axis(self._values[bins], idx_residuals, axis=1)
+
+        return sample_residuals
+
+
+def to_residual_store(
+    residuals: Any,
+    capacity: int=1000,
+    n_bins: int=1,
+    random_state: int=123
+) -> ResidualStore:
+    """
+    Store in a `ResidualStore` the residuals assigned directly to a forecaster
+    attribute. A `ResidualStore` is returned unchanged.
+
+    **New in version 0.7.0**
+
+    Parameters
+    ----------
+    residuals : ResidualStore, numpy ndarray, pandas Series, dict
+        Residuals. If a dict, keys are the bins and values the residuals of 
+        each bin, `None` values are skipped.
+
+    capacity : int, default `1000`
+        Maximum number of residuals stored in each bin.
+
+    n_bins : int, default `1`
+        Number of bins.
+
+    random_state : int, default `123`
+        Sets a seed to the random generator used by reservoir sampling.
+
+    Returns
+    -------
+    residual_store : ResidualStore
+        Store with the residuals.
+
+    """
+
+    if isinstance(residuals, ResidualStore):
+        return residuals
+
+    residual_store = ResidualStore(
+                         capacity     = capacity,
+                         n_bins       = n_bins,
+                         random_state = random_state
+                     )
+    if isinstance(residuals, dict):
+        for bin_, residuals_bin in residuals.items():
+            if residuals_bin is not None:
+                residual_store.append(residuals=residuals_bin, bins=bin_)
+    else:
+        residual_store.append(residuals=residuals)
+
+    return residual_store
+
+
+# Profilers that are recording in the current thread (or asyncio task), see
+# `ForecasterProfiler`. A context variable holding a tuple is used so that 
+# profilers entered in other threads are neither seen nor modified. When it is 
+# empty, `timed_phase` returns a no-op context manager.
+_active_profilers = ContextVar('_active_profilers', default=())
+
+
+class ForecasterProfiler():
+    """
+    Context manager that records the wall time, number of calls and peak array
+    size of the phases of forecasters and backtesting functions run inside it.
+
+    Phases are reported by the forecasters, the transformation functions of
+    `utils` and the `_backtesting_*` functions:
+
+    + `create_train_X_y`: creation of the training matrices (includes `transform`).
+    + `transform`: fit, transform or inverse transform of `y`, `series` or `exog`.
+    + `regressor.fit`: fit of the regressor(s).
+    + `regressor.predict`: prediction of the regressor(s), including the one
+    used to compute the in-sample residuals in `fit`.
+    + `_recursive_predict`: recursive prediction of all the steps 
+    (`ForecasterAutoreg`, `ForecasterAutoregCustom` and 
+    `ForecasterAutoregMultiSeries`).
+    + `_recursive_predict_bootstrapping`: recursive prediction of all the steps
+    and bootstrapping iterations at once (`ForecasterAutoreg.predict_bootstrapping`).
+    + `fold`: each fold of a backtesting. Phases run inside a fold are recorded
+    with its number.
+
+    Phases are nested, the time of a phase includes the time of the phases run
+    inside it. Only the phases run in the thread where the profiler is entered
+    are recorded: folds run in other processes or threads (`n_jobs` > 1) are 
+    not. When no profiler is active, the overhead is a function call per phase.
+
+    **New in version 0.7.0**
+
+    Attributes
+    ----------
+    records : list
+        One tuple (fold, phase, time, nbytes) per finished phase. `nbytes` is the
+        size of the largest array reported by the phase, 0 if none.
+
+    Examples
+    --------
+    >>> with ForecasterProfiler() as profiler:
+    ...     backtesting_forecaster(...)
+    >>> profiler.to_frame()
+
+    """
+
+    def __init__(
+        self
+    ) -> None:
+
+        self.records = []
+        self._fold   = None
+        self._tokens = []
+
+
+    def __repr__(
+        self
+    ) -> str:
+
+        return f"{type(self).__name__}(n_records={len(self.records)})"
+
+
+    def __enter__(
+        self
+    ) -> object:
+
+        self._tokens.append(
+            _active_profilers.set(_active_profilers.get() + (self,))
+        )
+
+        return self
+
+
+    def __exit__(
+        self,
+        *exc_info
+    ) -> bool:
+
+        _active_profilers.reset(self._tokens.pop())
+
+        return False
+
+
+    def reset(
+        self
+    ) -> None:
+        """
+        Discard all the records.
+
+        Parameters
+        ----------
+        self
+
+        Returns
+        -------
+        None
+        
+        """
+
+        self.records = []
+
+
+    def to_frame(
+        self,
+        aggregate: bool=True
+    ) -> pd.DataFrame:
+        """
+        Records as a pandas DataFrame.
+
+        Parameters
+        ----------
+        aggregate : bool, default `True`
+            If `True`, one row per fold and phase with columns `n_calls`,
+            `total_time`, `mean_time` (seconds) and `max_nbytes`. If `False`,
+            one row per record with columns `fold`, `phase`, `time` and `nbytes`.
+
+        Returns
+        -------
+        results : pandas DataFrame
+            Recorded phases. `fold` is missing for the phases run outside a fold.
+        
+        """
+
+        records = pd.DataFrame(
+                      data    = self.records,
+                      columns = ['fold', 'phase', 'time', 'nbytes']
+                  ).astype({'fold': 'Int64', 'phase': str, 'time': float, 'nbytes': 'int64'})
+
+        if not aggregate:
+            return records
+
+        results = records.groupby(
+                      ['fold', 'phase'], dropna=False, sort=False
+                  ).agg(
+                      n_calls    = ('time', 'size'),
+                      total_time = ('time', 'sum'),
+                      mean_time  = ('time', 'mean'),
+                      max_nbytes = ('nbytes', 'max')
+                  ).reset_index()
+
+        return results
+
+
+class _Phase():
+    """
+    Context manager that times a phase and reports it to the active profilers.
+    Created with `timed_phase`.
+    """
+
+    __slots__ = ('phase', 'fold', 'nbytes', '_start', '_profilers', '_previous_folds')
+
+    def __init__(
+        self,
+        phase: str,
+        fold: Optional[int]=None
+    ) -> None:
+
+        self.phase  = phase
+        self.fold   = fold
+        self.nbytes = 0
+
+
+    def __enter__(
+        self
+    ) -> object:
+
+        self._profilers = _active_profilers.get()
+        if self.fold is not None:
+            self._previous_folds = [profiler._fold for profiler in self._profilers]
+            for profiler in self._profilers:
+                profiler._fold = self.fold
+        self._start = time.perf_counter()
+
+        return self
+
+
+    def __exit__(
+        self,
+        *exc_info
+    ) -> bool:
+
+        elapsed = time.perf_counter() - self._start
+        for profiler in self._profilers:
+            profiler.records.append((profiler._fold, self.phase, elapsed, self.nbytes))
+        if self.fold is not None:
+            for profiler, fold in zip(self._profilers, self._previous_folds):
+                profiler._fold = fold
+
+        return False
+
+
+    def add_array(
+        self,
+        array: Any
+    ) -> None:
+        """
+        Report an array created in the phase, only the largest one is kept.
+        """
+
+        if isinstance(array, pd.DataFrame):
+            nbytes = int(array.memory_usage(index=False).sum())
+        else:
+            nbytes = getattr(array, 'nbytes', 0)
+        self.nbytes = max(self.nbytes, nbytes)
+
+
+class _NoOpPhase():
+    """
+    Context manager returned by `timed_phase` when no profiler is active.
+    """
+
+    __slots__ = ()
+
+    def __enter__(
+        self
+    ) -> object:
+
+        return self
+
+
+    def __exit__(
+        self,
+        *exc_info
+    ) -> bool:
+
+        return False
+
+
+    def add_array(
+        self,
+        array: Any
+    ) -> None:
+
+        pass
+
+
+_no_op_phase = _NoOpPhase()
+
+
+def timed_phase(
+    phase: str,
+    fold: Optional[int]=None
+) -> object:
+    """
+    Context manager that reports the wall time of the code run inside it as 
+    `phase` to the active `ForecasterProfiler`s. Arrays created in the phase can
+    be reported with its method `add_array`. It does nothing if no profiler is
+    active.
+
+    **New in version 0.7.0**
+
+    Parameters
+    ----------
+    phase : str
+        Name of the phase.
+
+    fold : int, default `None`
+        Number of the backtesting fold. If not `None`, the phases run inside
+        this one are recorded with this fold.
+
+    Returns
+    -------
+    phase_context : context manager
+        Context manager of the phase.
+    
+    """
+
+    if not _active_profilers.get():
+        return _no_op_phase
+
+    return _Phase(phase=phase, fold=fold)
+
+
 def save_forecaster(
     forecaster, 
     file_name: str, 